@@ -11,11 +11,10 @@ from homeassistant.components import blueprint
 from homeassistant.components.automation.helpers import async_get_blueprints
 from homeassistant.components.blueprint.const import BLUEPRINT_FOLDER
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform, CONF_ICON, CONF_ENTITY_ID
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ServiceValidationError, HomeAssistantError
+from homeassistant.const import Platform, CONF_ICON, CONF_ENTITY_ID, ENTITY_MATCH_ALL
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import entity_registry
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.yaml import load_yaml_dict
@@ -26,9 +25,17 @@ from .const import DOMAIN, CONF_TASK_INTERVAL_VALUE, CONF_DAY, CONF_TASK_INTERVA
     CONF_SHOW_PANEL, CONF_REPEAT_MODE, CONF_REPEAT_AFTER, \
     CONF_REPEAT_EVERY_TYPE, CONF_REPEAT_WEEKDAY, CONF_REPEAT_WEEKS_INTERVAL, \
     CONF_REPEAT_MONTH_DAY, CONF_REPEAT_NTH_OCCURRENCE, CONF_REPEAT_DAYS_BEFORE_END, CONF_REPEAT_MONTHS_INTERVAL, \
-    CONF_DEPENDENCIES
+    CONF_DEPENDENCIES, SERVICE_TARGET_KEYS, CONF_HISTORY_LIMIT, CONF_REFRESH_CONCURRENCY, CONF_REFRESH_SPREAD, \
+    CONF_TODO_SYNC_CONCURRENCY, CONF_TODO_SYNC_TIMEOUT
 from .coordinator import TaskTrackerCoordinator
 from .frontend import TaskTrackerCardRegistration
+from .history import DATA_HISTORY_STORE, DEFAULT_HISTORY_LIMIT, TaskTrackerHistoryStore
+from .registry import async_get_registry
+from .scheduler import DATA_SCHEDULER, DEFAULT_REFRESH_CONCURRENCY, DEFAULT_REFRESH_SPREAD, TaskTrackerScheduler
+from .state_store import DATA_STATE_STORE, TaskTrackerStateStore
+from .todo_index import async_get_todo_index
+from .todo_sync import DATA_TODO_RECONCILER, DEFAULT_TODO_SYNC_CONCURRENCY, DEFAULT_TODO_SYNC_TIMEOUT, \
+    TodoReconciler
 
 _PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON]
 _LOGGER = logging.getLogger(__name__)
@@ -38,6 +45,21 @@ CONFIG_SCHEMA = vol.Schema(
         DOMAIN: vol.Schema(
             {
                 vol.Optional(CONF_SHOW_PANEL, default=True): bool,
+                vol.Optional(CONF_HISTORY_LIMIT, default=DEFAULT_HISTORY_LIMIT): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(CONF_REFRESH_CONCURRENCY, default=DEFAULT_REFRESH_CONCURRENCY): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(CONF_REFRESH_SPREAD, default=DEFAULT_REFRESH_SPREAD): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
+                vol.Optional(CONF_TODO_SYNC_CONCURRENCY, default=DEFAULT_TODO_SYNC_CONCURRENCY): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(CONF_TODO_SYNC_TIMEOUT, default=DEFAULT_TODO_SYNC_TIMEOUT): vol.All(
+                    vol.Coerce(float), vol.Range(min=1)
+                ),
             }
         )
     },
@@ -47,48 +69,103 @@ CONFIG_SCHEMA = vol.Schema(
 
 def _get_coordinator(hass: HomeAssistant, entity_id: str) -> TaskTrackerCoordinator:
     """Return the coordinator for *entity_id*, raising ValueError if not found."""
-    reg = entity_registry.async_get(hass)
-    entry = reg.async_get(entity_id)
-    if entry is None or entry.config_entry_id is None:
-        raise ValueError(f"Could not find config entry for {entity_id}")
-    coordinator = hass.data.get(DOMAIN, {}).get(entry.config_entry_id)
+    coordinator = async_get_registry(hass).get_coordinator(entity_id)
     if coordinator is None:
         raise ValueError(
-            f"Task Tracker integration not loaded for {entity_id}; "
+            f"Could not find a loaded Task Tracker task for {entity_id}; "
             "the config entry may still be setting up"
         )
     return coordinator
 
 
+def _resolve_coordinators(hass: HomeAssistant, service_call: ServiceCall) -> list[TaskTrackerCoordinator]:
+    """Return the coordinators of every task targeted by *service_call*, each once.
+
+    Explicitly listed entity ids must belong to a loaded task; entities reached
+    through an area, device, floor or label that are not Task Tracker entities
+    are skipped.  The optional ``tags`` field keeps only tasks carrying at least
+    one of the given tags, and selects among all tasks when no target is given.
+    """
+    registry = async_get_registry(hass)
+    targeted = any(key in service_call.data for key in SERVICE_TARGET_KEYS if key != CONF_TAGS)
+    if not targeted or service_call.data.get(CONF_ENTITY_ID) == ENTITY_MATCH_ALL:
+        entry_ids = registry.entry_ids()
+    else:
+        selected = async_extract_referenced_entity_ids(hass, service_call)
+        entry_ids = [_get_coordinator(hass, entity_id).entry_id for entity_id in sorted(selected.referenced)]
+        entry_ids += filter(None, map(registry.get_entry_id, sorted(selected.indirectly_referenced)))
+
+    tags = service_call.data.get(CONF_TAGS)
+    if tags is not None:
+        entry_ids = [entry_id for entry_id in entry_ids if registry.has_any_tag(entry_id, tags)]
+    return [registry.get_coordinator(entry_id) for entry_id in dict.fromkeys(entry_ids)]
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """Set up the integration and schedule a single daily midnight update for all entities."""
-    # Schedule only once for the integration
+    """Set up the integration-wide registry, state and history stores, day-transition scheduler and services."""
+    # Set up only once for the integration
     domain_data = hass.data.setdefault(DOMAIN, {})
-    if "midnight_unsub" in domain_data:
+    if DATA_SCHEDULER in domain_data:
         return True
+    registry = async_get_registry(hass)
+    domain_config = config.get(DOMAIN, {})
+    # Status sensors register with the scheduler as they are added
+    domain_data[DATA_SCHEDULER] = TaskTrackerScheduler(
+        hass,
+        domain_config.get(CONF_REFRESH_CONCURRENCY, DEFAULT_REFRESH_CONCURRENCY),
+        domain_config.get(CONF_REFRESH_SPREAD, DEFAULT_REFRESH_SPREAD),
+    )
+    domain_data[DATA_TODO_RECONCILER] = TodoReconciler(
+        hass,
+        domain_config.get(CONF_TODO_SYNC_CONCURRENCY, DEFAULT_TODO_SYNC_CONCURRENCY),
+        domain_config.get(CONF_TODO_SYNC_TIMEOUT, DEFAULT_TODO_SYNC_TIMEOUT),
+    )
+
+    # Loaded before any entry is set up, so coordinators are restored as they are created
+    state_store = TaskTrackerStateStore(hass)
+    await state_store.async_load()
+    domain_data[DATA_STATE_STORE] = state_store
+
+    history_store = TaskTrackerHistoryStore(hass, domain_config.get(CONF_HISTORY_LIMIT, DEFAULT_HISTORY_LIMIT))
+    await history_store.async_load()
+    domain_data[DATA_HISTORY_STORE] = history_store
+
+    @callback
+    def _filter_entity_renames(event_data: entity_registry.EventEntityRegistryUpdatedData) -> bool:
+        """Listen only for entity_id changes of entities belonging to a task."""
+        return (
+            event_data["action"] == "update"
+            and "old_entity_id" in event_data
+            and registry.is_known_entity(event_data["old_entity_id"])
+        )
 
-    async def _midnight_update(_) -> None:
-        """Update all entities belonging to this integration at midnight."""
-        task_entity_ids = []
-        registry = entity_registry.async_get(hass)
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            entries = entity_registry.async_entries_for_config_entry(registry, entry.entry_id)
-            for e in entries:
-                if e.entity_id.startswith("sensor."):
-                    task_entity_ids.append(e.entity_id)
-        await async_update_entities(task_entity_ids, hass)
-        _LOGGER.debug("Midnight update ran for %s entities", len(task_entity_ids))
-
-    unsub = async_track_time_change(hass, _midnight_update, hour=0, minute=0, second=0)
-    domain_data["midnight_unsub"] = unsub
+    @callback
+    def _async_entity_renamed(event: Event[entity_registry.EventEntityRegistryUpdatedData]) -> None:
+        """Keep the task registry in sync with entity_id changes."""
+        registry.async_rename_entity(event.data["old_entity_id"], event.data["entity_id"])
 
+    domain_data["rename_unsub"] = hass.bus.async_listen(
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        _async_entity_renamed,
+        event_filter=_filter_entity_renames,
+    )
+
+    # Both services resolve all targeted tasks up front, update them without
+    # notifying and then flush the listener notifications together.
     async def async_mark_as_done(service_call: ServiceCall):
-        coordinator = _get_coordinator(hass, service_call.data[CONF_ENTITY_ID])
-        await coordinator.async_mark_as_done(today=dt_util.now().date())
+        coordinators = _resolve_coordinators(hass, service_call)
+        today = dt_util.now().date()
+        changed = [c for c in coordinators if await c.async_mark_as_done(today=today, notify=False)]
+        for coordinator in changed:
+            coordinator.async_notify_listeners()
+        _LOGGER.debug("mark_as_done: %s of %s targeted tasks changed", len(changed), len(coordinators))
 
     async def async_set_last_done_date(service_call: ServiceCall):
-        coordinator = _get_coordinator(hass, service_call.data[CONF_ENTITY_ID])
-        await coordinator.async_set_last_done_date(service_call.data[CONF_DATE])
+        coordinators = _resolve_coordinators(hass, service_call)
+        for coordinator in coordinators:
+            await coordinator.async_set_last_done_date(service_call.data[CONF_DATE], notify=False)
+        for coordinator in coordinators:
+            coordinator.async_notify_listeners()
 
     hass.services.async_register(
         DOMAIN,
@@ -104,7 +181,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         schema=SERVICE_SET_LAST_DONE_DATE_SCHEMA,
     )
 
-    show_panel = config.get(DOMAIN, {}).get(CONF_SHOW_PANEL, True)
+    show_panel = domain_config.get(CONF_SHOW_PANEL, True)
 
     cards = TaskTrackerCardRegistration(hass)
     await cards.async_register(show_panel=show_panel)
@@ -133,22 +210,9 @@ async def _async_register_blueprints(hass: HomeAssistant) -> None:
         _LOGGER.exception("Failed to register blueprint %s", blueprint_rel_path)
 
 
-async def async_update_entities(entity_ids: list[str], hass: HomeAssistant) -> dict | None:
-    """Update the entity."""
-    try:
-        return await hass.services.async_call(
-            domain="homeassistant",
-            service="update_entity",
-            service_data={"entity_id": entity_ids},
-            blocking=False,
-        )
-    except (ServiceValidationError, HomeAssistantError) as err:
-        _LOGGER.error("Failed to update entities %s: %s", ", ".join(entity_ids), err)
-        raise
-
-
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Task Tracker from a config entry."""
+    history_store: TaskTrackerHistoryStore = hass.data[DOMAIN][DATA_HISTORY_STORE]
     coordinator = TaskTrackerCoordinator(
         entry.entry_id,
         repeat_mode=entry.options.get(CONF_REPEAT_MODE, CONF_REPEAT_AFTER),
@@ -160,8 +224,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         repeat_days_before_end=entry.options.get(CONF_REPEAT_DAYS_BEFORE_END, 0),
         repeat_months_interval=entry.options.get(CONF_REPEAT_MONTHS_INTERVAL, 1),
         due_soon_days=entry.options.get(CONF_DUE_SOON_DAYS, 0),
+        history=history_store.async_get_history(entry.entry_id),
     )
+    state_store: TaskTrackerStateStore = hass.data[DOMAIN][DATA_STATE_STORE]
+    entry.async_on_unload(state_store.async_add_coordinator(coordinator))
+    # Every coordinator change schedules a delayed write; the stores merge them
+    entry.async_on_unload(coordinator.async_add_listener(history_store.async_schedule_save))
+    entry.async_on_unload(coordinator.async_add_listener(state_store.async_schedule_save))
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    tags = [tag.strip() for tag in entry.options.get(CONF_TAGS, []) if tag]
+    async_get_registry(hass).async_add_task(entry.entry_id, coordinator, tags)
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
 
     return True
@@ -172,9 +244,24 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     result = await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
     if result:
         hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        registry = async_get_registry(hass)
+        registry.async_remove_task(entry.entry_id)
+        if not registry.entry_ids():
+            # Stop following the todo lists once no task is loaded
+            async_get_todo_index(hass).async_clear()
     return result
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored state and completion history of a removed task."""
+    state_store: TaskTrackerStateStore | None = hass.data.get(DOMAIN, {}).get(DATA_STATE_STORE)
+    if state_store is not None:
+        state_store.async_remove_task(entry.entry_id)
+    history_store: TaskTrackerHistoryStore | None = hass.data.get(DOMAIN, {}).get(DATA_HISTORY_STORE)
+    if history_store is not None:
+        history_store.async_remove_history(entry.entry_id)
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate old config entry."""
 
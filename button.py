@@ -14,6 +14,7 @@ from homeassistant.util import dt as dt_util, slugify
 
 from .const import DOMAIN
 from .coordinator import TaskTrackerCoordinator
+from .registry import async_get_registry
 
 LOGGER = getLogger(__name__)
 
@@ -47,6 +48,11 @@ class TaskTrackerButton(ButtonEntity):
         self._attr_unique_id = f"{entry_id}_mark_as_done"
         self.entity_id = generate_entity_id("button.task_tracker_{}_mark_as_done", slugify(entry_name), hass=hass)
 
+    async def async_added_to_hass(self) -> None:
+        """Register the button with the task registry."""
+        await super().async_added_to_hass()
+        self.async_on_remove(async_get_registry(self.hass).async_add_entity(self._entry_id, self.entity_id))
+
     async def async_press(self) -> None:
         coordinator: TaskTrackerCoordinator = self.hass.data[DOMAIN][self._entry_id]
         await coordinator.async_mark_as_done(today=dt_util.now().date())
@@ -1,7 +1,8 @@
 """Constants for the Task Tracker integration."""
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
-from homeassistant.const import CONF_NAME, CONF_ENTITY_ID, CONF_OPTIONS, CONF_MODE
+from homeassistant.const import CONF_NAME, CONF_ENTITY_ID, CONF_OPTIONS, CONF_MODE, ATTR_AREA_ID, ATTR_DEVICE_ID, \
+    ATTR_FLOOR_ID, ATTR_LABEL_ID
 from homeassistant.helpers.selector import selector
 
 DOMAIN = "task_tracker"
@@ -25,6 +26,11 @@ CONF_DATE = "date"
 CONF_VALUE = "value"
 CONF_LABEL = "label"
 CONF_SHOW_PANEL = "show_panel"
+CONF_HISTORY_LIMIT = "history_limit"
+CONF_REFRESH_CONCURRENCY = "refresh_concurrency"
+CONF_REFRESH_SPREAD = "refresh_spread"
+CONF_TODO_SYNC_CONCURRENCY = "todo_sync_concurrency"
+CONF_TODO_SYNC_TIMEOUT = "todo_sync_timeout"
 CONF_REPEAT_MODE = "repeat_mode"
 CONF_REPEAT_AFTER = "repeat_after"
 CONF_REPEAT_EVERY = "repeat_every"
@@ -79,17 +85,27 @@ TASK_TRACKER_PANEL = {
 SERVICE_MARK_AS_DONE = "mark_as_done"
 SERVICE_SET_LAST_DONE_DATE = "set_last_done_date"
 
-SERVICE_MARK_AS_DONE_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_ENTITY_ID): cv.entity_id,
-    }
+# Both services accept entity ids, HA targets (area/device/floor/label) and a tags
+# filter; at least one of them must be given.
+SERVICE_TARGET_FIELDS = {
+    **cv.ENTITY_SERVICE_FIELDS,
+    vol.Optional(CONF_TAGS): vol.All(cv.ensure_list, [cv.string]),
+}
+SERVICE_TARGET_KEYS = (CONF_ENTITY_ID, ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_FLOOR_ID, ATTR_LABEL_ID, CONF_TAGS)
+
+SERVICE_MARK_AS_DONE_SCHEMA = vol.All(
+    vol.Schema(SERVICE_TARGET_FIELDS),
+    cv.has_at_least_one_key(*SERVICE_TARGET_KEYS),
 )
 
-SERVICE_SET_LAST_DONE_DATE_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_ENTITY_ID): cv.entity_id,
-        vol.Required(CONF_DATE): cv.date,
-    }
+SERVICE_SET_LAST_DONE_DATE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **SERVICE_TARGET_FIELDS,
+            vol.Required(CONF_DATE): cv.date,
+        }
+    ),
+    cv.has_at_least_one_key(*SERVICE_TARGET_KEYS),
 )
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
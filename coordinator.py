@@ -6,11 +6,15 @@ due-date calculation logic for one Task Tracker entry.  It exposes:
 * ``last_done``              – the date the task was last completed
 * ``repeat_mode``            – how the next due date is calculated on completion
 * ``calculate_due_date``     – compute the next due date given an effective interval
+* ``iter_occurrences``       – lazily project every due date within a date window
+                               (``list_occurrences`` is the bounded batch variant)
 * ``async_mark_as_done``     – mark the task as done today (or as of the current
                                due date for repeat_every mode)
 * ``async_set_last_done_date`` – set an explicit last-done date
-* ``async_add_listener``     – register a callback that is invoked on every
-                               state change (returns an unsubscribe callable)
+* ``async_add_listener``     – register a callback that is invoked after state
+                               changes, coalesced per event loop iteration
+                               (returns an unsubscribe callable)
+* ``async_notify_listeners`` – schedule a (coalesced) listener notification
 
 Services and the button entity interact with the coordinator; the sensor entity
 reads state from the coordinator, resolves any HA override entities to obtain the
@@ -20,23 +24,77 @@ registers a listener so it is notified whenever state changes.
 
 from __future__ import annotations
 
-import calendar
+import asyncio
 from datetime import date, timedelta
+from itertools import islice
+from math import gcd
 from logging import getLogger
-from typing import Callable
-
-from dateutil.relativedelta import relativedelta
+from typing import Callable, Iterator
 
 from .const import (
-    CONF_DAY, CONF_WEEK, CONF_MONTH, CONF_YEAR,
+    CONF_WEEK, CONF_MONTH, CONF_YEAR,
     CONF_REPEAT_AFTER, CONF_REPEAT_EVERY,
-    CONF_REPEAT_EVERY_WEEKDAY, CONF_REPEAT_EVERY_DAY_OF_MONTH,
-    CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH, CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH,
-    CONF_REPEAT_MONTHS_INTERVAL,
+)
+from .datemath import add_months, day_in_month, month_index, month_length
+from .history import CompletionHistory
+from .schedule import (
+    WEEKDAY_NUMBERS, NTH_OCCURRENCES, RepeatEverySchedule, WeekdaySchedule, DayOfMonthSchedule,
+    DaysBeforeEndOfMonthSchedule, WeekdayOfMonthSchedule, compile_schedule, iter_fixed_step,
+    nth_weekday_of_month,
 )
 
 LOGGER = getLogger(__name__)
 
+# Upper bound on memoised due dates per coordinator.  The cache is cleared on
+# every mutation, so in practice it only ever holds one or two entries; the cap
+# merely guards against unbounded growth when last_done is assigned directly.
+_DUE_DATE_CACHE_SIZE = 16
+
+
+def _chained_month_day(index: int, day: int, months: int, steps: int) -> int:
+    """Return the day of month reached by adding *months* to *day* of month *index* *steps* times.
+
+    Every addition clamps to the target month's length, so the result is the
+    smallest of *day* and the lengths of all months visited.  The months of the
+    year visited repeat every ``12 // gcd(months, 12)`` steps and only
+    February's length varies between repeats, so only the first repeat and the
+    later Februaries, up to the first one in a common year, are checked.
+    """
+    period = 12 // gcd(months, 12)
+    for step in range(1, min(steps, period) + 1):
+        visited = index + step * months
+        day = min(day, month_length(visited))
+        if visited % 12 == 1:
+            # A leap-year February; a later one in a common year clamps further
+            for later in range(step + period, steps + 1, period):
+                if day <= 28:
+                    break
+                day = min(day, month_length(index + later * months))
+        if day <= 28:
+            break
+    return day
+
+
+def _iter_month_offsets(anchor: date, months: int, start: date, end: date) -> Iterator[date]:
+    """Yield repeat_after occurrences spaced *months* calendar months apart within [*start*, *end*].
+
+    Each step adds *months* to the previous occurrence, so a day that was
+    clamped once (Jan 31 → Feb 29) stays clamped, exactly like a chain of
+    ``calculate_due_date`` calls.  The chain is jumped forward to *start*
+    directly, with the day it would have been clamped to on the way.
+    """
+    current = anchor
+    steps = (month_index(start) - month_index(anchor)) // months - 1
+    if steps > 0:
+        index = month_index(anchor)
+        current = day_in_month(index + steps * months, _chained_month_day(index, anchor.day, months, steps))
+    while True:
+        current = add_months(current, months)
+        if current > end:
+            return
+        if current >= start:
+            yield current
+
 
 class TaskTrackerCoordinator:
     """Per-entry coordinator that owns mutable state for one Task Tracker task."""
@@ -53,8 +111,16 @@ class TaskTrackerCoordinator:
         repeat_days_before_end: int = 0,
         repeat_months_interval: int = 1,
         due_soon_days: int = 0,
+        notify_delay: float = 0.0,
+        history: CompletionHistory | None = None,
     ) -> None:
-        """Initialise the coordinator."""
+        """Initialise the coordinator.
+
+        *notify_delay* is the window in seconds over which listener
+        notifications are coalesced; ``0`` coalesces within one event loop
+        iteration.  *history* receives every completion; a fresh in-memory log
+        is used when not given.
+        """
         self.entry_id = entry_id
         self.last_done: date = date(1970, 1, 1)
         self.repeat_mode: str = repeat_mode
@@ -70,8 +136,30 @@ class TaskTrackerCoordinator:
         self.repeat_days_before_end: int = max(0, repeat_days_before_end or 0)
         self.repeat_months_interval: int = max(1, repeat_months_interval or 1)
         self.due_soon_days: int = max(0, due_soon_days or 0)
+        # The repeat_every configuration compiled once into an immutable schedule
+        self.schedule: RepeatEverySchedule = compile_schedule(
+            self.repeat_every_type,
+            repeat_weekday=self.repeat_weekday,
+            repeat_weeks_interval=self.repeat_weeks_interval,
+            repeat_month_day=self.repeat_month_day,
+            repeat_nth_occurrence=self.repeat_nth_occurrence,
+            repeat_days_before_end=self.repeat_days_before_end,
+            repeat_months_interval=self.repeat_months_interval,
+        )
         self.times_completed: int = 0
+        # Whether last_done and times_completed were restored from the state store
+        self.state_restored: bool = False
+        self.history: CompletionHistory = history if history is not None else CompletionHistory()
         self._listeners: list[Callable[[], None]] = []
+        self.notify_delay: float = max(0.0, notify_delay or 0.0)
+        self._notify_handle: asyncio.Handle | None = None
+        self.coalesced_notifications: int = 0
+        self._due_date_cache: dict[tuple, date] = {}
+        self.due_date_cache_hits: int = 0
+        self.due_date_cache_misses: int = 0
+        # (last_done, due date) of the most recent due-date calculation, used to
+        # record how late a completion was
+        self._current_due_date: tuple[date, date] | None = None
 
     def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
         """Register *update_callback*; returns a callable that removes it."""
@@ -82,13 +170,32 @@ class TaskTrackerCoordinator:
 
         return remove_listener
 
-    def _async_notify_listeners(self) -> None:
-        """Notify all registered listeners of a state change."""
+    def async_notify_listeners(self) -> None:
+        """Schedule a notification of all registered listeners.
+
+        Notifications are coalesced: however many mutations happen before the
+        pending notification runs, every listener is called once, so a burst
+        of service calls causes a single sensor refresh.
+        ``coalesced_notifications`` counts the notifications absorbed into an
+        already pending one.
+        """
+        if self._notify_handle is not None:
+            self.coalesced_notifications += 1
+            return
+        loop = asyncio.get_running_loop()
+        if self.notify_delay:
+            self._notify_handle = loop.call_later(self.notify_delay, self._async_flush_listeners)
+        else:
+            self._notify_handle = loop.call_soon(self._async_flush_listeners)
+
+    def _async_flush_listeners(self) -> None:
+        """Run the pending notification of all registered listeners."""
+        self._notify_handle = None
         for listener in list(self._listeners):
             listener()
 
-    async def async_mark_as_done(self, today: date) -> None:
-        """Mark the task as done and notify listeners.
+    async def async_mark_as_done(self, today: date, notify: bool = True) -> bool:
+        """Mark the task as done and notify listeners; returns whether the task changed.
 
         *today* is the caller-supplied current local date (obtained from the HA
         timezone via ``dt_util.now().date()``).  When not provided it falls back
@@ -119,18 +226,21 @@ class TaskTrackerCoordinator:
         This logic lives entirely in the coordinator so that all callers
         (sensor entity, button entity, services) get consistent behaviour
         without needing to pass any hint about the current task state.
+
+        Bulk callers pass ``notify=False`` and call ``async_notify_listeners``
+        for every changed task once all of them have been updated.
         """
         if today is None:
             raise ValueError("No completion date provided")
         if self.repeat_mode == CONF_REPEAT_EVERY:
             if self.last_done > today:
                 # Already pre-marked a future cycle; pressing again is a no-op.
-                return
-            due_date = self._calculate_repeat_every_due_date()
+                return False
+            due_date = self._cached_due_date(None, None)
             due_in = (due_date - today).days if due_date > today else 0
             if due_in > self.due_soon_days:
                 # Task is DONE (not yet in the due-soon window); no-op.
-                return
+                return False
             if due_in > 0:
                 self.last_done = due_date
             else:
@@ -139,15 +249,33 @@ class TaskTrackerCoordinator:
             if self.last_done == today:
                 # Already marked done today; nothing changed, so skip
                 # incrementing the counter and notifying listeners.
-                return
+                return False
+            # The due date last shown for this cycle, if it was calculated at all
+            current = self._current_due_date
+            due_date = current[1] if current is not None and current[0] == self.last_done else None
             self.last_done = today
         self.times_completed += 1
-        self._async_notify_listeners()
-
-    async def async_set_last_done_date(self, new_date: date) -> None:
-        """Set the last-done date and notify listeners."""
+        self.history.add(today, (today - due_date).days if due_date is not None else None)
+        self.invalidate_due_date_cache()
+        if notify:
+            self.async_notify_listeners()
+        return True
+
+    async def async_set_last_done_date(self, new_date: date, notify: bool = True) -> None:
+        """Set the last-done date and notify listeners (unless *notify* is false)."""
         self.last_done = new_date
-        self._async_notify_listeners()
+        self.invalidate_due_date_cache()
+        if notify:
+            self.async_notify_listeners()
+
+    def invalidate_due_date_cache(self) -> None:
+        """Drop all memoised due dates.
+
+        Called after every mutation of ``last_done``.  Configuration changes go
+        through an entry reload, which replaces the coordinator (and its cache)
+        altogether.
+        """
+        self._due_date_cache.clear()
 
     # ------------------------------------------------------------------
     # Due-date calculation
@@ -159,36 +287,47 @@ class TaskTrackerCoordinator:
         The *interval_value* / *interval_type* pair is only used in
         ``repeat_after`` mode.  In ``repeat_every`` mode the schedule is driven
         entirely by the repeat_every_* configuration stored on this coordinator.
+
+        Results are memoised per ``last_done``, effective interval and compiled
+        schedule; see ``due_date_cache_hits`` / ``due_date_cache_misses``.
         """
         if self.repeat_mode == CONF_REPEAT_EVERY:
-            return self._calculate_repeat_every_due_date()
-        # repeat_after (completion-coupled)
+            # The interval does not influence repeat_every schedules, so leave it
+            # out of the key and share the entry with async_mark_as_done.
+            return self._cached_due_date(None, None)
+        return self._cached_due_date(interval_value, interval_type)
+
+    def _cached_due_date(self, interval_value: int | None, interval_type: str | None) -> date:
+        """Return the memoised due date for the current state, computing it on a miss."""
+        key = (self.last_done, interval_value, interval_type, self.schedule)
+        due_date = self._due_date_cache.get(key)
+        if due_date is not None:
+            self.due_date_cache_hits += 1
+        else:
+            self.due_date_cache_misses += 1
+            if self.repeat_mode == CONF_REPEAT_EVERY:
+                due_date = self._calculate_repeat_every_due_date()
+            else:
+                due_date = self._calculate_repeat_after_due_date(interval_value, interval_type)
+            if len(self._due_date_cache) >= _DUE_DATE_CACHE_SIZE:
+                self._due_date_cache.clear()
+            self._due_date_cache[key] = due_date
+        self._current_due_date = (self.last_done, due_date)
+        return due_date
+
+    def _calculate_repeat_after_due_date(self, interval_value: int, interval_type: str) -> date:
+        """Calculate the completion-coupled due date for the given interval."""
         if interval_type == CONF_WEEK:
-            return self.last_done + relativedelta(weeks=interval_value)
+            return self.last_done + timedelta(weeks=interval_value)
         if interval_type == CONF_MONTH:
-            return self.last_done + relativedelta(months=interval_value)
+            return add_months(self.last_done, interval_value)
         if interval_type == CONF_YEAR:
-            return self.last_done + relativedelta(years=interval_value)
-        return self.last_done + relativedelta(days=interval_value)
+            return add_months(self.last_done, 12 * interval_value)
+        return self.last_done + timedelta(days=interval_value)
 
     def _calculate_repeat_every_due_date(self) -> date:
         """Calculate due date for the active repeat_every schedule sub-type."""
-        last = self.last_done
-        etype = self.repeat_every_type
-        if etype == CONF_REPEAT_EVERY_WEEKDAY:
-            return self._calc_next_weekday(
-                last, self.repeat_weekday or "monday", self.repeat_weeks_interval
-            )
-        if etype == CONF_REPEAT_EVERY_DAY_OF_MONTH:
-            return self._calc_next_day_of_month(last, self.repeat_month_day, self.repeat_months_interval)
-        if etype == CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH:
-            return self._calc_next_weekday_of_month(
-                last, self.repeat_weekday or "monday", self.repeat_nth_occurrence, self.repeat_months_interval
-            )
-        if etype == CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH:
-            return self._calc_next_days_before_end_of_month(last, self.repeat_days_before_end, self.repeat_months_interval)
-        # Unrecognised sub-type: fall back to a 7-day interval
-        return last + relativedelta(days=7)
+        return self.schedule.next_after(self.last_done)
 
     def _find_most_recent_occurrence(self, today: date) -> date:
         """Return the most recent occurrence of the schedule on or before *today*.
@@ -197,43 +336,74 @@ class TaskTrackerCoordinator:
         brings ``last_done`` up to the current cycle regardless of how far in
         the past the previous value was.
         """
-        etype = self.repeat_every_type
-        if etype == CONF_REPEAT_EVERY_WEEKDAY:
-            return self._calc_most_recent_weekday_in_cycle(
-                today, self.repeat_weekday or "monday", self.repeat_weeks_interval
-            )
-        if etype == CONF_REPEAT_EVERY_DAY_OF_MONTH:
-            return self._calc_most_recent_day_of_month(today, self.repeat_month_day, self.repeat_months_interval)
-        if etype == CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH:
-            return self._calc_most_recent_weekday_of_month(
-                today, self.repeat_weekday or "monday", self.repeat_nth_occurrence, self.repeat_months_interval
-            )
-        if etype == CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH:
-            return self._calc_most_recent_days_before_end_of_month(today, self.repeat_days_before_end, self.repeat_months_interval)
-        # Unrecognised sub-type: fall back to today
-        return today
+        return self.schedule.most_recent_on_or_before(today, self.last_done)
+
+    # ------------------------------------------------------------------
+    # Occurrence projection
+    # ------------------------------------------------------------------
+
+    def iter_occurrences(
+        self,
+        start: date,
+        end: date,
+        interval_value: int | None = None,
+        interval_type: str | None = None,
+    ) -> Iterator[date]:
+        """Lazily yield every due date within [*start*, *end*] (inclusive).
+
+        The occurrences are the due dates the task would have if it were
+        completed exactly on each due date, i.e. the same sequence obtained by
+        repeatedly calling ``calculate_due_date`` and feeding the result back in
+        as ``last_done`` — without touching ``last_done``.  Only dates strictly
+        after ``last_done`` are produced.
+
+        *interval_value* / *interval_type* carry the effective interval and are
+        required in ``repeat_after`` mode; in ``repeat_every`` mode they are
+        ignored.  Skipping ahead to *start* is done arithmetically, and each
+        following occurrence costs constant time.
+        """
+        if self.repeat_mode == CONF_REPEAT_EVERY:
+            return self.schedule.iter_occurrences(self.last_done, start, end)
+
+        if interval_value is None or interval_type is None:
+            raise ValueError("No interval provided for a repeat_after task")
+        interval_value = max(1, interval_value)
+        if interval_type == CONF_WEEK:
+            return iter_fixed_step(self.last_done + timedelta(weeks=interval_value),
+                                   timedelta(weeks=interval_value), start, end)
+        if interval_type in (CONF_MONTH, CONF_YEAR):
+            months = interval_value * 12 if interval_type == CONF_YEAR else interval_value
+            return _iter_month_offsets(self.last_done, months, start, end)
+        return iter_fixed_step(self.last_done + timedelta(days=interval_value),
+                               timedelta(days=interval_value), start, end)
+
+    def list_occurrences(
+        self,
+        start: date,
+        end: date,
+        interval_value: int | None = None,
+        interval_type: str | None = None,
+        limit: int = 366,
+    ) -> list[date]:
+        """Return at most *limit* occurrences within [*start*, *end*]; see ``iter_occurrences``."""
+        return list(islice(self.iter_occurrences(start, end, interval_value, interval_type), limit))
+
+    # ------------------------------------------------------------------
+    # Per-sub-type helpers taking explicit schedule parameters.  They build a
+    # throwaway schedule object, so the compiled ``self.schedule`` remains the
+    # single implementation of the date maths.
+    # ------------------------------------------------------------------
 
     @staticmethod
     def _weekday_number(weekday_name: str) -> int:
         """Convert a weekday name to Python weekday number (0 = Monday, 6 = Sunday)."""
-        return {
-            "monday": 0, "tuesday": 1, "wednesday": 2,
-            "thursday": 3, "friday": 4, "saturday": 5, "sunday": 6,
-        }[weekday_name]
+        return WEEKDAY_NUMBERS[weekday_name]
 
-    def _calc_next_weekday(self, last: date, weekday_name: str, weeks_interval: int) -> date:
-        """Return the next due date for 'every N weeks on *weekday_name*'.
+    _get_nth_weekday_of_month = staticmethod(nth_weekday_of_month)
 
-        When *last* already falls on the target weekday the schedule advances by
-        *weeks_interval* full weeks.  Otherwise the very next occurrence of that
-        weekday is found and then (weeks_interval - 1) additional weeks are added
-        so the spacing after the first completion is always consistent.
-        """
-        target = self._weekday_number(weekday_name)
-        days_ahead = (target - last.weekday()) % 7
-        if days_ahead == 0:
-            return last + timedelta(weeks=weeks_interval)
-        return last + timedelta(days=days_ahead) + timedelta(weeks=weeks_interval - 1)
+    def _calc_next_weekday(self, last: date, weekday_name: str, weeks_interval: int) -> date:
+        """Return the next due date for 'every N weeks on *weekday_name*'; see ``WeekdaySchedule``."""
+        return WeekdaySchedule(WEEKDAY_NUMBERS[weekday_name], weeks_interval).next_after(last)
 
     @staticmethod
     def _calc_next_day_of_month(last: date, day: int, months_interval: int) -> date:
@@ -244,15 +414,7 @@ class TaskTrackerCoordinator:
         occurrence is considered part of the *current* cycle, so the function
         always advances by *months_interval* months to reach the *next* cycle.
         """
-        if months_interval == 1:
-            last_day_of_month = calendar.monthrange(last.year, last.month)[1]
-            candidate = last.replace(day=min(day, last_day_of_month))
-            if candidate > last:
-                return candidate
-        # Advance to the month that is months_interval ahead
-        next_month = last.replace(day=1) + relativedelta(months=months_interval)
-        last_day_of_next = calendar.monthrange(next_month.year, next_month.month)[1]
-        return next_month.replace(day=min(day, last_day_of_next))
+        return DayOfMonthSchedule(day, months_interval).next_after(last)
 
     @staticmethod
     def _calc_next_days_before_end_of_month(last: date, days_before: int, months_interval: int) -> date:
@@ -266,36 +428,7 @@ class TaskTrackerCoordinator:
         if it is still ahead.  For larger intervals the same-month occurrence belongs to the
         current cycle, so the function always advances by *months_interval* months.
         """
-        if months_interval == 1:
-            last_day = calendar.monthrange(last.year, last.month)[1]
-            target_day = max(1, last_day - days_before)
-            candidate = last.replace(day=target_day)
-            if candidate > last:
-                return candidate
-        # Advance to the month that is months_interval ahead
-        next_month = last.replace(day=1) + relativedelta(months=months_interval)
-        next_last_day = calendar.monthrange(next_month.year, next_month.month)[1]
-        return next_month.replace(day=max(1, next_last_day - days_before))
-
-    @staticmethod
-    def _get_nth_weekday_of_month(year: int, month: int, target_weekday: int, nth: int) -> date | None:
-        """Return the *nth* occurrence of *target_weekday* in *year*/*month*.
-
-        Returns ``None`` when the requested occurrence does not exist (e.g. a
-        5th Monday in a month that only has four).  Use nth == -1 for the last
-        occurrence.
-        """
-        if nth == -1:
-            last_day = calendar.monthrange(year, month)[1]
-            d = date(year, month, last_day)
-            while d.weekday() != target_weekday:
-                d -= timedelta(days=1)
-            return d
-        first_day = date(year, month, 1)
-        days_ahead = (target_weekday - first_day.weekday()) % 7
-        first_occurrence = first_day + timedelta(days=days_ahead)
-        result = first_occurrence + timedelta(weeks=nth - 1)
-        return result if result.month == month else None
+        return DaysBeforeEndOfMonthSchedule(days_before, months_interval).next_after(last)
 
     def _calc_next_weekday_of_month(self, last: date, weekday_name: str, nth_str: str, months_interval: int) -> date:
         """Return the next *nth* weekday-of-month occurrence strictly after *last*.
@@ -304,24 +437,9 @@ class TaskTrackerCoordinator:
         returned if it is still ahead.  For larger intervals the same-month occurrence belongs
         to the current cycle, so the function always advances by *months_interval* months.
         """
-        target = self._weekday_number(weekday_name)
-        nth = -1 if nth_str == "last" else int(nth_str)
-        # For monthly (interval=1): check if this month's occurrence is still ahead.
-        if months_interval == 1:
-            occurrence = self._get_nth_weekday_of_month(last.year, last.month, target, nth)
-            if occurrence is not None and occurrence > last:
-                return occurrence
-        # Advance by months_interval months at a time until a valid occurrence is found
-        candidate_month = last.replace(day=1) + relativedelta(months=months_interval)
-        for _ in range(24):  # safety cap of 24 attempts
-            occurrence = self._get_nth_weekday_of_month(
-                candidate_month.year, candidate_month.month, target, nth
-            )
-            if occurrence is not None:
-                return occurrence
-            candidate_month += relativedelta(months=months_interval)
-        # Unreachable in practice; last-resort fallback
-        return last + relativedelta(months=months_interval)
+        return WeekdayOfMonthSchedule(
+            WEEKDAY_NUMBERS[weekday_name], NTH_OCCURRENCES[nth_str], months_interval
+        ).next_after(last)
 
     # ------------------------------------------------------------------
     # Most-recent-occurrence helpers (used by async_mark_as_done)
@@ -330,8 +448,7 @@ class TaskTrackerCoordinator:
     @staticmethod
     def _calc_most_recent_weekday(today: date, weekday_name: str) -> date:
         """Return the most recent date on or before *today* that falls on *weekday_name*."""
-        target = TaskTrackerCoordinator._weekday_number(weekday_name)
-        days_back = (today.weekday() - target) % 7
+        days_back = (today.weekday() - WEEKDAY_NUMBERS[weekday_name]) % 7
         return today - timedelta(days=days_back)
 
     def _calc_most_recent_weekday_in_cycle(
@@ -340,31 +457,13 @@ class TaskTrackerCoordinator:
         """Return the most recent cycle occurrence of *weekday_name* on or before *today*.
 
         Cycle occurrences are spaced *weeks_interval* weeks apart, anchored at
-        the ``last_done`` date.  The first cycle date is computed with the same
-        logic as ``_calc_next_weekday`` so that the forward and backward
-        calculations stay consistent.
-
-        When *weeks_interval* is 1 every occurrence of that weekday is a valid
-        cycle date, so the result is identical to ``_calc_most_recent_weekday``.
+        the ``last_done`` date.  When *weeks_interval* is 1 every occurrence of
+        that weekday is a valid cycle date, so the result is identical to
+        ``_calc_most_recent_weekday``.
         """
-        anchor = self.last_done
-        # Compute the first cycle date strictly after anchor (mirrors _calc_next_weekday)
-        target = self._weekday_number(weekday_name)
-        days_ahead = (target - anchor.weekday()) % 7
-        if days_ahead == 0:
-            first_cycle = anchor + timedelta(weeks=weeks_interval)
-        else:
-            first_cycle = anchor + timedelta(days=days_ahead) + timedelta(weeks=weeks_interval - 1)
-
-        if first_cycle > today:
-            # The first cycle date is already in the future — return anchor as a
-            # safe fallback (this path is not reached in normal overdue flow).
-            return anchor
-
-        # Find the largest N such that first_cycle + N * weeks_interval weeks <= today
-        days_elapsed = (today - first_cycle).days
-        periods_elapsed = days_elapsed // (weeks_interval * 7)
-        return first_cycle + timedelta(weeks=periods_elapsed * weeks_interval)
+        return WeekdaySchedule(WEEKDAY_NUMBERS[weekday_name], weeks_interval).most_recent_on_or_before(
+            today, self.last_done
+        )
 
     def _calc_most_recent_day_of_month(self, today: date, day: int, months_interval: int) -> date:
         """Return the most recent date on or before *today* that is the *day*-th of its month.
@@ -373,25 +472,7 @@ class TaskTrackerCoordinator:
         larger values the valid cycle months are anchored at ``last_done`` and
         spaced *months_interval* months apart.
         """
-        if months_interval == 1:
-            last_day_of_month = calendar.monthrange(today.year, today.month)[1]
-            candidate = today.replace(day=min(day, last_day_of_month))
-            if candidate <= today:
-                return candidate
-            # The target day hasn't occurred yet this month — go back to the previous month.
-            prev_month = today.replace(day=1) - relativedelta(months=1)
-            prev_last_day = calendar.monthrange(prev_month.year, prev_month.month)[1]
-            return prev_month.replace(day=min(day, prev_last_day))
-        # For months_interval > 1: walk forward from the first cycle occurrence
-        # after last_done until we exceed today.
-        current = TaskTrackerCoordinator._calc_next_day_of_month(self.last_done, day, months_interval)
-        if current > today:
-            return self.last_done
-        while True:
-            nxt = TaskTrackerCoordinator._calc_next_day_of_month(current, day, months_interval)
-            if nxt > today:
-                return current
-            current = nxt
+        return DayOfMonthSchedule(day, months_interval).most_recent_on_or_before(today, self.last_done)
 
     def _calc_most_recent_days_before_end_of_month(self, today: date, days_before: int, months_interval: int) -> date:
         """Return the most recent date on or before *today* that is *days_before* days before month-end.
@@ -400,28 +481,9 @@ class TaskTrackerCoordinator:
         larger values the valid cycle months are anchored at ``last_done`` and
         spaced *months_interval* months apart.
         """
-        if months_interval == 1:
-            last_day = calendar.monthrange(today.year, today.month)[1]
-            candidate = today.replace(day=max(1, last_day - days_before))
-            if candidate <= today:
-                return candidate
-            prev_month = today.replace(day=1) - relativedelta(months=1)
-            prev_last_day = calendar.monthrange(prev_month.year, prev_month.month)[1]
-            return prev_month.replace(day=max(1, prev_last_day - days_before))
-        # For months_interval > 1: walk forward from the first cycle occurrence
-        # after last_done until we exceed today.
-        current = TaskTrackerCoordinator._calc_next_days_before_end_of_month(
-            self.last_done, days_before, months_interval
+        return DaysBeforeEndOfMonthSchedule(days_before, months_interval).most_recent_on_or_before(
+            today, self.last_done
         )
-        if current > today:
-            return self.last_done
-        while True:
-            nxt = TaskTrackerCoordinator._calc_next_days_before_end_of_month(
-                current, days_before, months_interval
-            )
-            if nxt > today:
-                return current
-            current = nxt
 
     def _calc_most_recent_weekday_of_month(self, today: date, weekday_name: str, nth_str: str, months_interval: int) -> date:
         """Return the most recent *nth* weekday-of-month occurrence on or before *today*.
@@ -430,31 +492,6 @@ class TaskTrackerCoordinator:
         larger values the valid cycle months are anchored at ``last_done`` and
         spaced *months_interval* months apart.
         """
-        target = self._weekday_number(weekday_name)
-        nth = -1 if nth_str == "last" else int(nth_str)
-        if months_interval == 1:
-            # Try the current month first
-            occurrence = self._get_nth_weekday_of_month(today.year, today.month, target, nth)
-            if occurrence is not None and occurrence <= today:
-                return occurrence
-            # Walk backwards month by month
-            candidate_month = today.replace(day=1) - relativedelta(months=1)
-            for _ in range(24):  # safety cap
-                occurrence = self._get_nth_weekday_of_month(
-                    candidate_month.year, candidate_month.month, target, nth
-                )
-                if occurrence is not None:
-                    return occurrence
-                candidate_month -= relativedelta(months=1)
-            # Unreachable in practice; last-resort fallback
-            return today
-        # For months_interval > 1: walk forward from the first cycle occurrence
-        # after last_done until we exceed today.
-        current = self._calc_next_weekday_of_month(self.last_done, weekday_name, nth_str, months_interval)
-        if current > today:
-            return self.last_done
-        while True:
-            nxt = self._calc_next_weekday_of_month(current, weekday_name, nth_str, months_interval)
-            if nxt > today:
-                return current
-            current = nxt
+        return WeekdayOfMonthSchedule(
+            WEEKDAY_NUMBERS[weekday_name], NTH_OCCURRENCES[nth_str], months_interval
+        ).most_recent_on_or_before(today, self.last_done)
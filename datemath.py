@@ -0,0 +1,95 @@
+"""Integer date arithmetic for the Task Tracker due-date calculations.
+
+All schedule maths works on two integer representations:
+
+* proleptic Gregorian ordinals (``date.toordinal()``), where adding days is
+  integer addition, and
+* absolute month indices (``year * 12 + month - 1``), where adding months is
+  integer addition.
+
+Month lengths and the ordinal of the first day of every month are precomputed
+for the years 1900–2299, so turning "the 31st of month index *i*" into a date is
+two tuple lookups and one ``date.fromordinal`` call.  Months outside the
+tables fall back to ``calendar`` and stay correct, just slower.
+"""
+
+from __future__ import annotations
+
+import calendar
+from datetime import date
+
+_TABLE_FIRST_YEAR = 1900
+_TABLE_END_YEAR = 2300  # exclusive
+_TABLE_FIRST_INDEX = _TABLE_FIRST_YEAR * 12
+_TABLE_SIZE = (_TABLE_END_YEAR - _TABLE_FIRST_YEAR) * 12
+
+
+def _build_tables() -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Return the month-length and first-day-ordinal tables."""
+    lengths = []
+    first_ordinals = []
+    ordinal = date(_TABLE_FIRST_YEAR, 1, 1).toordinal()
+    for year in range(_TABLE_FIRST_YEAR, _TABLE_END_YEAR):
+        for month in range(1, 13):
+            length = calendar.monthrange(year, month)[1]
+            lengths.append(length)
+            first_ordinals.append(ordinal)
+            ordinal += length
+    return tuple(lengths), tuple(first_ordinals)
+
+
+_MONTH_LENGTHS, _MONTH_FIRST_ORDINALS = _build_tables()
+
+
+def month_index(day: date) -> int:
+    """Return the absolute month index (``year * 12 + month - 1``) of *day*."""
+    return day.year * 12 + day.month - 1
+
+
+def month_from_index(index: int) -> tuple[int, int]:
+    """Return the ``(year, month)`` pair for an absolute month *index*."""
+    year, month_zero = divmod(index, 12)
+    return year, month_zero + 1
+
+
+def month_length(index: int) -> int:
+    """Return the number of days in the month at *index*."""
+    offset = index - _TABLE_FIRST_INDEX
+    if 0 <= offset < _TABLE_SIZE:
+        return _MONTH_LENGTHS[offset]
+    return calendar.monthrange(*month_from_index(index))[1]
+
+
+def month_first_ordinal(index: int) -> int:
+    """Return the ordinal of the first day of the month at *index*."""
+    offset = index - _TABLE_FIRST_INDEX
+    if 0 <= offset < _TABLE_SIZE:
+        return _MONTH_FIRST_ORDINALS[offset]
+    year, month = month_from_index(index)
+    return date(year, month, 1).toordinal()
+
+
+def ordinal_weekday(ordinal: int) -> int:
+    """Return the weekday (0 = Monday) of the day with proleptic *ordinal*."""
+    # date.fromordinal(1) (0001-01-01) is a Monday
+    return (ordinal - 1) % 7
+
+
+def day_in_month(index: int, day: int) -> date:
+    """Return *day* of the month at *index*, clamped to the valid range of that month."""
+    offset = index - _TABLE_FIRST_INDEX
+    if 0 <= offset < _TABLE_SIZE:
+        length = _MONTH_LENGTHS[offset]
+        first = _MONTH_FIRST_ORDINALS[offset]
+    else:
+        length = month_length(index)
+        first = month_first_ordinal(index)
+    return date.fromordinal(first + max(1, min(day, length)) - 1)
+
+
+def add_months(day: date, months: int) -> date:
+    """Return *day* shifted by *months* calendar months, clamping to the target month's length.
+
+    Equivalent to ``day + relativedelta(months=months)``.
+    """
+    return day_in_month(day.year * 12 + day.month - 1 + months, day.day)
@@ -0,0 +1,201 @@
+"""Dependency graph of the Task Tracker tasks.
+
+A task cannot be more urgent than its least urgent dependency.  Instead of
+every dependent task refreshing itself when a dependency's state changes,
+which turns a chain of N tasks into N consecutive refreshes, each task's
+status sensor is a node of one domain-level DAG keyed by entity id.  When a
+task's own state has been recalculated, the graph re-evaluates the dependency
+clamp of everything downstream of it in topological order, in a single pass:
+a dependent is only looked at once one of its dependencies actually changed,
+and every dependent whose effective state changes is written exactly once.
+
+For the clamp itself every task keeps counters of how many of its
+dependencies are in each state.  A dependency's state change moves one count
+per dependent from the old state to the new one, so finding the least urgent
+dependency is a constant-time lookup however many dependencies a task has.
+
+Circular dependencies are rejected by the options flow; should a cycle slip
+through anyway, its tasks are skipped with a warning rather than recursed
+into.
+"""
+
+from __future__ import annotations
+
+from logging import getLogger
+from typing import Callable, Iterable, Protocol
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CONST_DONE, CONST_DUE, CONST_DUE_SOON, DOMAIN
+
+LOGGER = getLogger(__name__)
+
+DATA_DEPENDENCY_GRAPH = "dependency_graph"
+
+# Urgency ordering used by the dependency clamp; other states (inactive,
+# unavailable, ...) do not count
+STATE_RANK = {CONST_DONE: 0, CONST_DUE_SOON: 1, CONST_DUE: 2}
+RANK_STATE = {rank: state for state, rank in STATE_RANK.items()}
+
+
+class DependencyNode(Protocol):
+    """A status sensor taking part in the dependency graph."""
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the task's effective state."""
+
+    @callback
+    def async_reevaluate_dependencies(self) -> bool:
+        """Re-apply the dependency clamp; return whether the effective state changed.
+
+        A node whose state changes reports it through ``async_set_state``.
+        """
+
+
+class TaskDependencyGraph:
+    """DAG from status sensor entity ids to the tasks depending on them."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise an empty graph."""
+        self.hass = hass
+        self._nodes: dict[str, DependencyNode] = {}
+        self._dependencies: dict[str, tuple[str, ...]] = {}
+        self._dependents: dict[str, set[str]] = {}
+        # Rank of every entity some task depends on, and per task the number
+        # of its dependencies at each rank
+        self._ranks: dict[str, int | None] = {}
+        self._rank_counts: dict[str, list[int]] = {}
+
+    @callback
+    def async_add_task(
+        self, entity_id: str, dependencies: Iterable[str], node: DependencyNode
+    ) -> Callable[[], None]:
+        """Add status sensor *node* depending on *dependencies*; returns a callable that removes it."""
+        dependencies = tuple(dict.fromkeys(dependencies))
+        self._nodes[entity_id] = node
+        self._dependencies[entity_id] = dependencies
+        counts = self._rank_counts[entity_id] = [0] * len(RANK_STATE)
+        for dependency in dependencies:
+            self._dependents.setdefault(dependency, set()).add(entity_id)
+            if dependency not in self._ranks:
+                self._ranks[dependency] = STATE_RANK.get(self.get_state(dependency))
+            rank = self._ranks[dependency]
+            if rank is not None:
+                counts[rank] += 1
+
+        @callback
+        def remove_task() -> None:
+            if self._nodes.get(entity_id) is not node:
+                return
+            del self._nodes[entity_id]
+            del self._rank_counts[entity_id]
+            for dependency in self._dependencies.pop(entity_id):
+                dependents = self._dependents.get(dependency)
+                if dependents is not None:
+                    dependents.discard(entity_id)
+                    if not dependents:
+                        del self._dependents[dependency]
+                        self._ranks.pop(dependency, None)
+
+        return remove_task
+
+    @callback
+    def async_set_state(self, entity_id: str, state: str | None) -> bool:
+        """Record the new effective *state* of *entity_id* in its dependents' counters.
+
+        Returns whether this changes the rank the dependents see; only then do
+        they need to be re-evaluated.
+        """
+        if entity_id not in self._dependents:
+            return False
+        rank = STATE_RANK.get(state)
+        previous = self._ranks.get(entity_id)
+        if rank == previous:
+            return False
+        self._ranks[entity_id] = rank
+        for dependent in self._dependents[entity_id]:
+            counts = self._rank_counts[dependent]
+            if previous is not None:
+                counts[previous] -= 1
+            if rank is not None:
+                counts[rank] += 1
+        return True
+
+    def least_urgent_dependency(self, entity_id: str) -> int | None:
+        """Return the rank of the least urgent dependency of task *entity_id*, if any has a rank."""
+        for rank, count in enumerate(self._rank_counts.get(entity_id, ())):
+            if count:
+                return rank
+        return None
+
+    def is_task(self, entity_id: str) -> bool:
+        """Return whether *entity_id* is a status sensor in the graph."""
+        return entity_id in self._nodes
+
+    def get_state(self, entity_id: str) -> str | None:
+        """Return the current state of *entity_id*, from the graph if it is a task in it."""
+        node = self._nodes.get(entity_id)
+        if node is not None:
+            return node.native_value
+        state = self.hass.states.get(entity_id)
+        return state.state if state is not None else None
+
+    def downstream_order(self, entity_id: str) -> list[str]:
+        """Return the tasks depending directly or indirectly on *entity_id*, in topological order."""
+        # Collect everything reachable, counting the incoming edges within that subgraph
+        in_degree: dict[str, int] = {}
+        stack = [entity_id]
+        while stack:
+            for dependent in self._dependents.get(stack.pop(), ()):
+                if dependent not in in_degree:
+                    in_degree[dependent] = 0
+                    stack.append(dependent)
+                in_degree[dependent] += 1
+        # A cycle back to entity_id itself must not re-evaluate the task that started the pass
+        in_degree.pop(entity_id, None)
+        # Kahn's algorithm, starting from entity_id
+        order: list[str] = []
+        ready = [entity_id]
+        while ready:
+            current = ready.pop()
+            if current != entity_id:
+                order.append(current)
+            for dependent in self._dependents.get(current, ()):
+                if dependent in in_degree:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        ready.append(dependent)
+        if len(order) < len(in_degree):
+            LOGGER.warning(
+                "Circular task dependencies below %s; not re-evaluating %s",
+                entity_id, sorted(set(in_degree) - set(order)),
+            )
+        return order
+
+    @callback
+    def async_propagate(self, entity_id: str) -> list[str]:
+        """Re-evaluate the tasks downstream of *entity_id* after ``async_set_state`` reported a change.
+
+        Returns the entity ids of the tasks whose effective state changed.
+        """
+        changed = {entity_id}
+        updated: list[str] = []
+        for dependent in self.downstream_order(entity_id):
+            node = self._nodes.get(dependent)
+            if node is None or changed.isdisjoint(self._dependencies[dependent]):
+                continue
+            if node.async_reevaluate_dependencies():
+                changed.add(dependent)
+                updated.append(dependent)
+        return updated
+
+
+@callback
+def async_get_dependency_graph(hass: HomeAssistant) -> TaskDependencyGraph:
+    """Return the dependency graph stored in ``hass.data[DOMAIN]``, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    graph = domain_data.get(DATA_DEPENDENCY_GRAPH)
+    if graph is None:
+        graph = domain_data[DATA_DEPENDENCY_GRAPH] = TaskDependencyGraph(hass)
+    return graph
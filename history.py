@@ -0,0 +1,161 @@
+"""Persistent completion history for the Task Tracker integration.
+
+Every task keeps a bounded log of its completions: the day it was marked as
+done and how many days late (negative: early) that was relative to the due
+date at the time.  Days are stored as proleptic Gregorian ordinals, so the
+whole log of one task is two flat integer lists.
+
+All tasks share a single ``Store`` whose writes are delayed and coalesced, so a
+burst of completions across many tasks results in one write to disk.  The
+aggregates exposed as sensor attributes (mean interval, mean lateness, on-time
+streak) are maintained incrementally and cost O(1) per completion.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import date
+from logging import getLogger
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+LOGGER = getLogger(__name__)
+
+DATA_HISTORY_STORE = "history"
+STORAGE_KEY = f"{DOMAIN}.history"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+DEFAULT_HISTORY_LIMIT = 100
+
+# Attribute names added by CompletionHistory.as_attributes
+HISTORY_ATTRIBUTES = frozenset({"completions_recorded", "mean_completion_interval", "mean_lateness", "on_time_streak"})
+
+
+class CompletionHistory:
+    """Bounded completion log of one task with running aggregates."""
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+        done: list[int] | None = None,
+        lateness: list[int | None] | None = None,
+        streak: int = 0,
+    ) -> None:
+        """Initialise the log, keeping at most the *limit* most recent completions.
+
+        *done* holds completion day ordinals (oldest first) and *lateness* the
+        matching lateness in days, or ``None`` where the due date was unknown.
+        """
+        self.limit: int = max(1, limit)
+        done = list(done or [])[-self.limit:]
+        lateness = list(lateness or [])[-len(done):] if done else []
+        lateness = [None] * (len(done) - len(lateness)) + lateness
+        self._done: deque[int] = deque(done, maxlen=self.limit)
+        self._lateness: deque[int | None] = deque(lateness, maxlen=self.limit)
+        self._lateness_sum: int = sum(late for late in lateness if late is not None)
+        self._lateness_count: int = sum(1 for late in lateness if late is not None)
+        self.streak: int = max(0, streak)
+
+    def __len__(self) -> int:
+        """Return the number of retained completions."""
+        return len(self._done)
+
+    def add(self, day: date, lateness: int | None) -> None:
+        """Record a completion on *day* that was *lateness* days late (``None``: unknown)."""
+        if len(self._done) == self.limit:
+            evicted = self._lateness[0]
+            if evicted is not None:
+                self._lateness_sum -= evicted
+                self._lateness_count -= 1
+        self._done.append(day.toordinal())
+        self._lateness.append(lateness)
+        if lateness is not None:
+            self._lateness_sum += lateness
+            self._lateness_count += 1
+            self.streak = self.streak + 1 if lateness <= 0 else 0
+
+    @property
+    def last_completion(self) -> date | None:
+        """Return the day of the most recent completion, if any."""
+        return date.fromordinal(self._done[-1]) if self._done else None
+
+    @property
+    def mean_interval(self) -> float | None:
+        """Return the mean number of days between consecutive retained completions."""
+        if len(self._done) < 2:
+            return None
+        return (self._done[-1] - self._done[0]) / (len(self._done) - 1)
+
+    @property
+    def mean_lateness(self) -> float | None:
+        """Return the mean lateness in days over the retained completions with a known due date."""
+        if not self._lateness_count:
+            return None
+        return self._lateness_sum / self._lateness_count
+
+    def as_attributes(self) -> dict[str, Any]:
+        """Return the aggregates as sensor attributes."""
+        mean_interval = self.mean_interval
+        mean_lateness = self.mean_lateness
+        return {
+            "completions_recorded": len(self._done),
+            "mean_completion_interval": round(mean_interval, 1) if mean_interval is not None else None,
+            "mean_lateness": round(mean_lateness, 1) if mean_lateness is not None else None,
+            "on_time_streak": self.streak,
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the compact, JSON-serialisable form of the log."""
+        return {"done": list(self._done), "lateness": list(self._lateness), "streak": self.streak}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], limit: int = DEFAULT_HISTORY_LIMIT) -> CompletionHistory:
+        """Rebuild a log from its ``as_dict`` form, applying the current *limit*."""
+        return cls(limit, data.get("done"), data.get("lateness"), data.get("streak", 0))
+
+
+class TaskTrackerHistoryStore:
+    """Completion histories of all tasks, persisted together in one ``Store``."""
+
+    def __init__(self, hass: HomeAssistant, limit: int = DEFAULT_HISTORY_LIMIT) -> None:
+        """Initialise the store; call ``async_load`` before use."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self.limit: int = limit
+        self._histories: dict[str, CompletionHistory] = {}
+
+    async def async_load(self) -> None:
+        """Load all stored histories."""
+        data = await self._store.async_load() or {}
+        self._histories = {
+            entry_id: CompletionHistory.from_dict(task_data, self.limit)
+            for entry_id, task_data in data.get("tasks", {}).items()
+        }
+        LOGGER.debug("Loaded completion history for %s tasks", len(self._histories))
+
+    @callback
+    def async_get_history(self, entry_id: str) -> CompletionHistory:
+        """Return the history of task *entry_id*, creating an empty one if needed."""
+        history = self._histories.get(entry_id)
+        if history is None:
+            history = self._histories[entry_id] = CompletionHistory(self.limit)
+        return history
+
+    @callback
+    def async_remove_history(self, entry_id: str) -> None:
+        """Delete the history of a removed task."""
+        if self._histories.pop(entry_id, None) is not None:
+            self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write; writes requested within ``SAVE_DELAY`` are merged."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data written to disk."""
+        return {"tasks": {entry_id: history.as_dict() for entry_id, history in self._histories.items()}}
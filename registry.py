@@ -0,0 +1,99 @@
+"""Domain-level task registry for the Task Tracker integration.
+
+The registry lives in ``hass.data[DOMAIN]`` and maps every identifier a caller
+may use to refer to a task — the config entry id, the status sensor, the
+times-completed sensor and the mark-as-done button — to the task's
+``TaskTrackerCoordinator``.  It is kept up to date by entry setup/unload, by
+the entities themselves as they are added to and removed from hass, and by
+entity registry rename events, so service dispatch never has to scan the
+entity registry.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .coordinator import TaskTrackerCoordinator
+
+DATA_REGISTRY = "registry"
+
+
+class TaskTrackerRegistry:
+    """Index from entry ids and entity ids to task coordinators."""
+
+    def __init__(self) -> None:
+        """Initialise an empty registry."""
+        self._coordinators: dict[str, TaskTrackerCoordinator] = {}
+        self._entity_entries: dict[str, str] = {}
+        self._tags: dict[str, frozenset[str]] = {}
+
+    @callback
+    def async_add_task(
+        self, entry_id: str, coordinator: TaskTrackerCoordinator, tags: Iterable[str] = ()
+    ) -> None:
+        """Register the *coordinator* of config entry *entry_id*, tagged with *tags*."""
+        self._coordinators[entry_id] = coordinator
+        self._tags[entry_id] = frozenset(tags)
+
+    @callback
+    def async_remove_task(self, entry_id: str) -> None:
+        """Forget config entry *entry_id* together with all of its entities."""
+        self._coordinators.pop(entry_id, None)
+        self._tags.pop(entry_id, None)
+        for entity_id in [e for e, owner in self._entity_entries.items() if owner == entry_id]:
+            del self._entity_entries[entity_id]
+
+    @callback
+    def async_add_entity(self, entry_id: str, entity_id: str) -> Callable[[], None]:
+        """Register *entity_id* as belonging to *entry_id*; returns a callable that removes it."""
+        self._entity_entries[entity_id] = entry_id
+
+        @callback
+        def remove_entity() -> None:
+            if self._entity_entries.get(entity_id) == entry_id:
+                del self._entity_entries[entity_id]
+
+        return remove_entity
+
+    @callback
+    def async_rename_entity(self, old_entity_id: str, new_entity_id: str) -> None:
+        """Follow an entity registry rename of *old_entity_id* to *new_entity_id*."""
+        entry_id = self._entity_entries.pop(old_entity_id, None)
+        if entry_id is None:
+            return
+        self._entity_entries[new_entity_id] = entry_id
+
+    def get_coordinator(self, entity_or_entry_id: str) -> TaskTrackerCoordinator | None:
+        """Return the coordinator for an entity id or config entry id, or ``None``."""
+        entry_id = self._entity_entries.get(entity_or_entry_id, entity_or_entry_id)
+        return self._coordinators.get(entry_id)
+
+    def get_entry_id(self, entity_id: str) -> str | None:
+        """Return the config entry id of the loaded task *entity_id* belongs to, or ``None``."""
+        entry_id = self._entity_entries.get(entity_id)
+        return entry_id if entry_id in self._coordinators else None
+
+    def entry_ids(self) -> list[str]:
+        """Return the config entry ids of all loaded tasks."""
+        return list(self._coordinators)
+
+    def has_any_tag(self, entry_id: str, tags: Iterable[str]) -> bool:
+        """Return whether task *entry_id* carries at least one of *tags*."""
+        return not self._tags.get(entry_id, frozenset()).isdisjoint(tags)
+
+    def is_known_entity(self, entity_id: str) -> bool:
+        """Return whether *entity_id* belongs to a registered task."""
+        return entity_id in self._entity_entries
+
+
+@callback
+def async_get_registry(hass: HomeAssistant) -> TaskTrackerRegistry:
+    """Return the task registry stored in ``hass.data[DOMAIN]``, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry = domain_data.get(DATA_REGISTRY)
+    if registry is None:
+        registry = domain_data[DATA_REGISTRY] = TaskTrackerRegistry()
+    return registry
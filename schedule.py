@@ -0,0 +1,290 @@
+"""Compiled repeat_every schedules for the Task Tracker integration.
+
+A ``TaskTrackerCoordinator`` compiles its repeat_every configuration once into
+one of the immutable schedule objects below, so the due-date hot path is a
+single method call on pre-parsed integers instead of string dispatch.  Every
+schedule answers three questions:
+
+* ``next_after(day)``                      – the first occurrence strictly after *day*
+* ``most_recent_on_or_before(day, anchor)`` – the latest cycle occurrence on or
+                                              before *day* for a schedule whose
+                                              cycles are anchored at *anchor*
+                                              (the task's ``last_done``)
+* ``iter_occurrences(last, start, end)``    – every occurrence after *last* that
+                                              falls within [*start*, *end*]
+
+Month-based schedules work on absolute month indices (``year * 12 + month - 1``)
+so that skipping any number of cycles is plain integer arithmetic; the dates
+themselves come from the table-driven helpers in ``datemath``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Iterator
+
+from .const import (
+    CONF_REPEAT_EVERY_WEEKDAY, CONF_REPEAT_EVERY_DAY_OF_MONTH,
+    CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH, CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH,
+    CONF_MONDAY, CONF_TUESDAY, CONF_WEDNESDAY, CONF_THURSDAY, CONF_FRIDAY, CONF_SATURDAY, CONF_SUNDAY,
+)
+from .datemath import day_in_month, month_first_ordinal, month_index, month_length, ordinal_weekday
+
+# Python weekday numbers (0 = Monday, 6 = Sunday) by weekday option value
+WEEKDAY_NUMBERS: dict[str, int] = {
+    CONF_MONDAY: 0, CONF_TUESDAY: 1, CONF_WEDNESDAY: 2,
+    CONF_THURSDAY: 3, CONF_FRIDAY: 4, CONF_SATURDAY: 5, CONF_SUNDAY: 6,
+}
+
+# Weekday-of-month occurrence option value → nth (-1 = last occurrence)
+NTH_OCCURRENCES: dict[str, int] = {"1": 1, "2": 2, "3": 3, "4": 4, "last": -1}
+
+
+def nth_weekday_ordinal(index: int, target_weekday: int, nth: int) -> int | None:
+    """Return the ordinal of the *nth* *target_weekday* in the month at *index*.
+
+    Returns ``None`` when the requested occurrence does not exist (e.g. a
+    5th Monday in a month that only has four).  Use nth == -1 for the last
+    occurrence.
+    """
+    first = month_first_ordinal(index)
+    length = month_length(index)
+    if nth == -1:
+        last = first + length - 1
+        return last - (ordinal_weekday(last) - target_weekday) % 7
+    days_ahead = (target_weekday - ordinal_weekday(first)) % 7 + 7 * (nth - 1)
+    return first + days_ahead if days_ahead < length else None
+
+
+def nth_weekday_of_month(year: int, month: int, target_weekday: int, nth: int) -> date | None:
+    """Return the *nth* occurrence of *target_weekday* in *year*/*month* (see ``nth_weekday_ordinal``)."""
+    ordinal = nth_weekday_ordinal(year * 12 + month - 1, target_weekday, nth)
+    return None if ordinal is None else date.fromordinal(ordinal)
+
+
+def iter_fixed_step(first: date, step: timedelta, start: date, end: date) -> Iterator[date]:
+    """Yield ``first + n * step`` (n >= 0) for every value within [*start*, *end*]."""
+    if first < start:
+        first += step * -((first - start) // step)
+    current = first
+    while current <= end:
+        yield current
+        current += step
+
+
+class RepeatEverySchedule:
+    """Base class for the compiled repeat_every schedules.
+
+    The concrete schedules are frozen, slotted dataclasses, so instances are
+    immutable and compare equal when their configuration is.
+    """
+
+    __slots__ = ()
+
+    def next_after(self, day: date) -> date:
+        """Return the first occurrence strictly after *day*."""
+        raise NotImplementedError
+
+    def most_recent_on_or_before(self, day: date, anchor: date) -> date:
+        """Return the latest cycle occurrence on or before *day* for cycles anchored at *anchor*."""
+        raise NotImplementedError
+
+    def iter_occurrences(self, last: date, start: date, end: date) -> Iterator[date]:
+        """Yield every occurrence after *last* that falls within [*start*, *end*]."""
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, slots=True)
+class WeekdaySchedule(RepeatEverySchedule):
+    """Every *weeks_interval* weeks on *weekday*."""
+
+    weekday: int
+    weeks_interval: int
+    _step: timedelta = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the cycle length."""
+        object.__setattr__(self, "_step", timedelta(weeks=self.weeks_interval))
+
+    def next_after(self, day: date) -> date:
+        """Return the next due date for 'every N weeks on *weekday*'.
+
+        When *day* already falls on the target weekday the schedule advances by
+        *weeks_interval* full weeks.  Otherwise the very next occurrence of that
+        weekday is found and then (weeks_interval - 1) additional weeks are added
+        so the spacing after the first completion is always consistent.
+        """
+        days_ahead = (self.weekday - day.weekday()) % 7
+        if days_ahead == 0:
+            return day + self._step
+        return day + timedelta(days=days_ahead + 7 * (self.weeks_interval - 1))
+
+    def most_recent_on_or_before(self, day: date, anchor: date) -> date:
+        """Return the most recent cycle occurrence on or before *day*.
+
+        Cycle occurrences are spaced *weeks_interval* weeks apart, starting at
+        ``next_after(anchor)``.  When that first cycle date is still in the
+        future *anchor* is returned as a safe fallback.
+        """
+        first_cycle = self.next_after(anchor)
+        if first_cycle > day:
+            return anchor
+        return first_cycle + self._step * ((day - first_cycle) // self._step)
+
+    def iter_occurrences(self, last: date, start: date, end: date) -> Iterator[date]:
+        """Yield every occurrence after *last* that falls within [*start*, *end*]."""
+        return iter_fixed_step(self.next_after(last), self._step, start, end)
+
+
+class MonthlySchedule(RepeatEverySchedule):
+    """Base class for schedules with exactly one occurrence per cycle month.
+
+    For *months_interval* == 1 every month is a cycle month.  For larger
+    intervals the occurrence in the month of the reference date belongs to the
+    current cycle, so ``next_after`` always advances by *months_interval*
+    months, and the cycle months of ``most_recent_on_or_before`` are anchored
+    at the month of *anchor*.  Subclasses declare ``months_interval`` as their
+    last field.
+    """
+
+    __slots__ = ()
+
+    months_interval: int
+
+    def occurrence_in(self, index: int) -> date:
+        """Return the occurrence within the month at absolute month *index*."""
+        raise NotImplementedError
+
+    def next_after(self, day: date) -> date:
+        """Return the first occurrence strictly after *day*."""
+        index = month_index(day)
+        if self.months_interval == 1:
+            candidate = self.occurrence_in(index)
+            if candidate > day:
+                return candidate
+        return self.occurrence_in(index + self.months_interval)
+
+    def most_recent_on_or_before(self, day: date, anchor: date) -> date:
+        """Return the most recent cycle occurrence on or before *day*.
+
+        The cycle that contains *day* is found arithmetically, so the cost does
+        not depend on how far *anchor* lies in the past.  Returns *anchor* when
+        the first cycle occurrence after it is still ahead of *day*.
+        """
+        index = month_index(day)
+        if self.months_interval == 1:
+            candidate = self.occurrence_in(index)
+            return candidate if candidate <= day else self.occurrence_in(index - 1)
+        first_index = month_index(anchor) + self.months_interval
+        if self.occurrence_in(first_index) > day:
+            return anchor
+        cycle_index = first_index + (index - first_index) // self.months_interval * self.months_interval
+        candidate = self.occurrence_in(cycle_index)
+        if candidate > day:
+            # day's cycle month has not reached its occurrence yet; the previous
+            # cycle (which exists, since the first one is <= day) wins.
+            candidate = self.occurrence_in(cycle_index - self.months_interval)
+        return candidate
+
+    def iter_occurrences(self, last: date, start: date, end: date) -> Iterator[date]:
+        """Yield every occurrence after *last* that falls within [*start*, *end*]."""
+        index = month_index(self.next_after(last))
+        months_behind = month_index(start) - index
+        if months_behind > 0:
+            index += -(-months_behind // self.months_interval) * self.months_interval
+        while True:
+            occurrence = self.occurrence_in(index)
+            if occurrence > end:
+                return
+            if occurrence >= start:
+                yield occurrence
+            index += self.months_interval
+
+
+@dataclass(frozen=True, slots=True)
+class DayOfMonthSchedule(MonthlySchedule):
+    """Every *months_interval* months on *day* (clamped to the month's length)."""
+
+    day: int
+    months_interval: int
+
+    def occurrence_in(self, index: int) -> date:
+        """Return *day* of the month at *index*, clamped to the month's length."""
+        return day_in_month(index, self.day)
+
+
+@dataclass(frozen=True, slots=True)
+class DaysBeforeEndOfMonthSchedule(MonthlySchedule):
+    """Every *months_interval* months, *days_before* days before the last day of the month.
+
+    ``days_before=0`` targets the last day of the month.  The target day is
+    clamped to at least the 1st so that large values in short months never
+    produce an invalid date.
+    """
+
+    days_before: int
+    months_interval: int
+
+    def occurrence_in(self, index: int) -> date:
+        """Return the target day of the month at *index*."""
+        return day_in_month(index, month_length(index) - self.days_before)
+
+
+@dataclass(frozen=True, slots=True)
+class WeekdayOfMonthSchedule(MonthlySchedule):
+    """Every *months_interval* months on the *nth* *weekday* (nth == -1 for the last one)."""
+
+    weekday: int
+    nth: int
+    months_interval: int
+
+    def occurrence_in(self, index: int) -> date:
+        """Return the *nth* *weekday* of the month at *index*.
+
+        nth is 1-4 or -1, so every month has a matching occurrence.
+        """
+        return date.fromordinal(nth_weekday_ordinal(index, self.weekday, self.nth))
+
+
+@dataclass(frozen=True, slots=True)
+class FallbackSchedule(RepeatEverySchedule):
+    """Schedule used for an unrecognised repeat_every sub-type: every 7 days."""
+
+    def next_after(self, day: date) -> date:
+        """Return the date 7 days after *day*."""
+        return day + timedelta(days=7)
+
+    def most_recent_on_or_before(self, day: date, anchor: date) -> date:
+        """Return *day* itself."""
+        return day
+
+    def iter_occurrences(self, last: date, start: date, end: date) -> Iterator[date]:
+        """Yield every 7th day after *last* within [*start*, *end*]."""
+        return iter_fixed_step(last + timedelta(days=7), timedelta(days=7), start, end)
+
+
+def compile_schedule(
+    repeat_every_type: str | None,
+    *,
+    repeat_weekday: str | None,
+    repeat_weeks_interval: int,
+    repeat_month_day: int,
+    repeat_nth_occurrence: str,
+    repeat_days_before_end: int,
+    repeat_months_interval: int,
+) -> RepeatEverySchedule:
+    """Compile already-validated repeat_every options into a schedule object."""
+    if repeat_every_type == CONF_REPEAT_EVERY_WEEKDAY:
+        return WeekdaySchedule(WEEKDAY_NUMBERS[repeat_weekday or CONF_MONDAY], repeat_weeks_interval)
+    if repeat_every_type == CONF_REPEAT_EVERY_DAY_OF_MONTH:
+        return DayOfMonthSchedule(repeat_month_day, repeat_months_interval)
+    if repeat_every_type == CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH:
+        return WeekdayOfMonthSchedule(
+            WEEKDAY_NUMBERS[repeat_weekday or CONF_MONDAY],
+            NTH_OCCURRENCES[repeat_nth_occurrence],
+            repeat_months_interval,
+        )
+    if repeat_every_type == CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH:
+        return DaysBeforeEndOfMonthSchedule(repeat_days_before_end, repeat_months_interval)
+    return FallbackSchedule()
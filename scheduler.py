@@ -0,0 +1,200 @@
+"""Day-transition scheduler for the Task Tracker integration.
+
+A task's state only changes on specific days: when it enters the due-soon
+window, when it becomes due, or when one of its override or dependency
+entities changes (which already triggers a refresh on its own).  After every
+full refresh a status sensor therefore tells the scheduler the next day on
+which its state will change.  The scheduler keeps these days in one min-heap
+and arms a single timer for the next local midnight:
+
+* tasks whose transition day has arrived get a full refresh of their state
+  and attributes, called directly rather than through the
+  ``homeassistant.update_entity`` service, after which the todo lists of all
+  refreshed tasks are reconciled in one batch;
+* every other task only advances its day counters (``due_in`` /
+  ``overdue_by``), which involves no service calls at all.
+
+The refreshes themselves only recalculate state and make no service calls.
+The todo reconciliation that follows reconciles at most ``concurrency`` todo
+lists at once and may spread them evenly over ``spread`` seconds, so a night
+on which many tasks change does not flood the todo integrations with calls.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from datetime import date, datetime, timedelta
+from logging import getLogger
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .todo_sync import async_get_todo_reconciler
+
+LOGGER = getLogger(__name__)
+
+DATA_SCHEDULER = "scheduler"
+DEFAULT_REFRESH_CONCURRENCY = 4
+DEFAULT_REFRESH_SPREAD = 0
+
+
+class TaskTrackerScheduler:
+    """Min-heap of per-task transition days driven by a single timer."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        concurrency: int = DEFAULT_REFRESH_CONCURRENCY,
+        spread: float = DEFAULT_REFRESH_SPREAD,
+    ) -> None:
+        """Initialise an empty scheduler.
+
+        The todo reconciliation after the refreshes handles at most
+        *concurrency* lists at once; with a *spread* (in seconds) their start
+        times are distributed evenly over that window.
+        """
+        self.hass = hass
+        self.concurrency: int = max(1, concurrency)
+        self.spread: float = max(0.0, spread)
+        # (day ordinal, sequence number, key); superseded entries are skipped lazily
+        self._heap: list[tuple[int, int, str]] = []
+        self._transitions: dict[str, tuple[int, int]] = {}
+        self._tasks: dict[str, tuple[Callable[[], None], Callable[[], Awaitable[Any]]]] = {}
+        self._sequence: int = 0
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self.last_refresh_metrics: dict[str, Any] | None = None
+
+    @callback
+    def async_add_task(
+        self, key: str, advance_day: Callable[[], None], refresh: Callable[[], Awaitable[Any]]
+    ) -> Callable[[], None]:
+        """Register task *key*; returns a callable that unregisters it.
+
+        *advance_day* is called at every midnight without a transition for the
+        task, and the coroutine function *refresh* is awaited on the day of its
+        scheduled transition.  When *refresh* returns a todo sync target, its
+        todo lists are reconciled together with those of the other refreshed
+        tasks.
+        """
+        self._tasks[key] = (advance_day, refresh)
+        self._async_arm()
+
+        @callback
+        def remove_task() -> None:
+            if self._tasks.get(key) == (advance_day, refresh):
+                del self._tasks[key]
+                self._transitions.pop(key, None)
+            if not self._tasks and self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = None
+
+        return remove_task
+
+    @callback
+    def async_schedule_transition(self, key: str, day: date | None) -> None:
+        """Set the next transition of task *key* to *day* (``None``: no transition ahead)."""
+        if day is None:
+            self._transitions.pop(key, None)
+            return
+        ordinal = day.toordinal()
+        current = self._transitions.get(key)
+        if current is not None and current[0] == ordinal:
+            return
+        self._sequence += 1
+        self._transitions[key] = (ordinal, self._sequence)
+        heapq.heappush(self._heap, (ordinal, self._sequence, key))
+        if len(self._heap) > 2 * len(self._transitions) + 64:
+            # Drop superseded entries so rescheduling cannot grow the heap unboundedly
+            self._heap = [(o, seq, k) for k, (o, seq) in self._transitions.items()]
+            heapq.heapify(self._heap)
+
+    def next_transition(self, key: str) -> date | None:
+        """Return the scheduled transition day of task *key*, if any."""
+        current = self._transitions.get(key)
+        return date.fromordinal(current[0]) if current is not None else None
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the timer for the next local midnight unless it is already armed."""
+        if self._unsub_timer is not None or not self._tasks:
+            return
+        next_midnight = dt_util.start_of_local_day(dt_util.now().date() + timedelta(days=1))
+        self._unsub_timer = async_track_point_in_time(self.hass, self._async_run, next_midnight)
+
+    @callback
+    def _async_run(self, now: datetime) -> None:
+        """Refresh the tasks whose transition has arrived and advance all others."""
+        self._unsub_timer = None
+        today = dt_util.as_local(now).date().toordinal()
+        due: set[str] = set()
+        while self._heap and self._heap[0][0] <= today:
+            ordinal, sequence, key = heapq.heappop(self._heap)
+            if self._transitions.get(key) == (ordinal, sequence):
+                del self._transitions[key]
+                due.add(key)
+        refreshes: dict[str, Callable[[], Awaitable[Any]]] = {}
+        for key, (advance_day, refresh) in list(self._tasks.items()):
+            if key in due:
+                refreshes[key] = refresh
+            else:
+                advance_day()
+        self._async_arm()
+        if refreshes:
+            self.hass.async_create_background_task(
+                self.async_refresh(refreshes), f"{DOMAIN} day transition refresh"
+            )
+
+    async def async_refresh(self, refreshes: dict[str, Callable[[], Awaitable[Any]]]) -> dict[str, Any]:
+        """Run the *refreshes* of their task keys, then reconcile the refreshed tasks' todo lists.
+
+        A task whose refresh fails is scheduled for another transition on the
+        next day, so it is retried rather than left stale.  Returns the run
+        metrics, which are also kept in ``last_refresh_metrics``.
+        """
+        started = time.monotonic()
+        failed = 0
+        targets: list[Any] = []
+        for key, refresh in refreshes.items():
+            try:
+                target = await refresh()
+            except Exception:  # pylint: disable=broad-exception-caught
+                # One failing task must not keep the others from their transition
+                failed += 1
+                LOGGER.exception("Day transition refresh of %s failed", key)
+                if key in self._tasks:
+                    self.async_schedule_transition(key, dt_util.now().date() + timedelta(days=1))
+            else:
+                if target is not None:
+                    targets.append(target)
+        todo_sync = (
+            await async_get_todo_reconciler(self.hass).async_reconcile(targets, self.concurrency, self.spread)
+            if targets else None
+        )
+        self.last_refresh_metrics = {
+            "tasks_refreshed": len(refreshes) - failed,
+            "failed": failed,
+            "wall_time": round(time.monotonic() - started, 3),
+            # Todo lists reconciled at once at the peak, bounded by the concurrency
+            "peak_in_flight": todo_sync["peak_in_flight"] if todo_sync else 0,
+            "todo_sync": todo_sync,
+        }
+        LOGGER.debug(
+            "Day transition refresh: %s tasks refreshed (%s failed) in %.3fs, peak %s todo lists in flight",
+            len(refreshes) - failed, failed, self.last_refresh_metrics["wall_time"],
+            self.last_refresh_metrics["peak_in_flight"],
+        )
+        return self.last_refresh_metrics
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> TaskTrackerScheduler:
+    """Return the scheduler stored in ``hass.data[DOMAIN]``, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = domain_data[DATA_SCHEDULER] = TaskTrackerScheduler(hass)
+    return scheduler
@@ -1,6 +1,7 @@
 """Platform for sensor integration."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta, datetime, date
 from functools import partial
 from logging import getLogger
@@ -9,8 +10,8 @@ from typing import Any, Callable
 from homeassistant.components.sensor import (
     SensorEntity, RestoreSensor, SensorStateClass,
 )
-from homeassistant.const import CONF_NAME, CONF_ICON, CONF_ENTITY_ID, EVENT_STATE_CHANGED
-from homeassistant.core import HomeAssistant, EventStateChangedData, callback
+from homeassistant.const import CONF_NAME, CONF_ICON, CONF_ENTITY_ID
+from homeassistant.core import CoreState, Event, HomeAssistant, EventStateChangedData, State, callback
 from homeassistant.exceptions import ServiceValidationError, HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import generate_entity_id
@@ -26,9 +27,49 @@ from .const import DOMAIN, CONF_TASK_INTERVAL_VALUE, CONF_NOTIFICATION_INTERVAL,
     CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH, CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH, \
     CONF_DEPENDENCIES
 from .coordinator import TaskTrackerCoordinator
+from .dependency_graph import RANK_STATE, STATE_RANK, async_get_dependency_graph
+from .history import HISTORY_ATTRIBUTES
+from .registry import async_get_registry
+from .scheduler import async_get_scheduler
+from .state_dispatcher import async_get_state_dispatcher
+from .todo_index import async_get_todo_index
+from .todo_sync import TODO_ADD, TODO_REMOVE, TODO_UPDATE, async_get_todo_reconciler
 
 LOGGER = getLogger(__name__)
 
+# Attributes that only change when the task is reconfigured; only last_done,
+# due_date, due_in and overdue_by are recorded
+CONFIG_ATTRIBUTES = frozenset({
+    "repeat_mode", "icon", "tags", "todo_lists", "due_soon_days", "notification_interval", "dependencies",
+    "task_interval_value", "task_interval_type", "repeat_every_type", "repeat_weekday", "repeat_weeks_interval",
+    "repeat_month_day", "repeat_months_interval", "repeat_nth_occurrence", "repeat_days_before_end",
+})
+
+
+def _parse_switch_override(state: State | None) -> bool | None:
+    """Return whether an active override entity is on, or None if it has no usable state."""
+    if state is None or state.state in ("unavailable", "unknown"):
+        return None
+    return state.state == "on"
+
+
+def _parse_days_override(minimum: int, state: State | None) -> int | None:
+    """Return the number of days of a numeric override entity, or None if it has no usable state."""
+    if state is None or state.state in ("unavailable", "unknown"):
+        return None
+    try:
+        return max(minimum, int(float(state.state)))
+    except (ValueError, TypeError):
+        return None
+
+
+# Parser of each kind of override entity
+OVERRIDE_PARSERS: dict[str, Callable[[State | None], bool | int | None]] = {
+    CONF_ACTIVE_OVERRIDE: _parse_switch_override,
+    CONF_TASK_INTERVAL_OVERRIDE: partial(_parse_days_override, 1),
+    CONF_DUE_SOON_OVERRIDE: partial(_parse_days_override, 0),
+}
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -58,6 +99,9 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
     _attr_translation_key = "status"
+    # The history aggregates are persisted by the integration itself, and the
+    # configuration does not need to be stored again with every state change
+    _unrecorded_attributes = HISTORY_ATTRIBUTES | CONFIG_ATTRIBUTES
 
     def __init__(self, coordinator: TaskTrackerCoordinator, entry_name: str,
                  task_interval_value: int, task_interval_type: str,
@@ -82,13 +126,30 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
         self.due_date: date = date(1970, 1, 1)
         self.due_in: int = 0
         self.mark_as_done_scheduled: Callable[[], None] | None = None
+        # Number of update_item calls skipped because the item was already up to date
+        self.todo_writes_avoided: int = 0
         self.active_override: str | None = active_override
         self.task_interval_override: str | None = task_interval_override
         self.due_soon_override: str | None = due_soon_override
         self.dependencies: list[str] = dependencies or []
+        # State before applying the dependency clamp, once calculated
+        self._own_state: str | None = None
+        # State and attributes of the last write through the refresh paths, and
+        # the number of refresh writes skipped as unchanged
+        self._written: tuple[Any, dict[str, Any]] | None = None
+        self.state_writes_skipped: int = 0
+        # (due date, state) the todo lists were last synced for, and the background sync
+        self._todo_synced_for: tuple[date, str] | None = None
+        self._todo_sync_task: asyncio.Task | None = None
+        self._todo_sync_rerun: bool = False
         # Effective values after applying overrides; initialised to configured values
         self._effective_active: bool = active
         self._effective_due_soon_days: int = due_soon_days
+        # Parsed state of each override entity by override kind, read on first use and
+        # then kept up to date from its state changes; None when it has no usable state
+        self._override_values: dict[str, bool | int | None] = {}
+        # Number of override state changes that left every effective value as it was
+        self.override_refreshes_skipped: int = 0
 
         device_id = f"{DOMAIN}_{self.entry_id}"
         self._attr_name = None
@@ -108,17 +169,29 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
         # entity to hass also trigger the update callback.
         self.async_on_remove(
             self.coordinator.async_add_listener(
-                lambda: self.async_schedule_update_ha_state(force_refresh=True)
+                self.async_schedule_refresh
             )
         )
 
     async def async_added_to_hass(self) -> None:
         """Restore last known state on startup."""
         await super().async_added_to_hass()
+        # Nothing has been written under this entity_id yet
+        self._written = None
+        self.async_on_remove(
+            async_get_registry(self.hass).async_add_entity(self.entry_id, self.entity_id)
+        )
+        self.async_on_remove(
+            async_get_scheduler(self.hass).async_add_task(
+                self.entry_id, self.async_advance_day, self.async_refresh_state
+            )
+        )
         last_sensor_state = await self.async_get_last_sensor_data()
         if last_sensor_state is not None:
             self._attr_native_value = last_sensor_state.native_value
-        last_state = await self.async_get_last_state()
+        # The coordinator is restored from the state store before its entities
+        # are added; the last state is only used for tasks not stored there yet
+        last_state = None if self.coordinator.state_restored else await self.async_get_last_state()
         if last_state is not None:
             last_done = last_state.attributes.get("last_done", "1970-01-01")
             # Restore last_done into the coordinator — it is the single source of truth.
@@ -128,52 +201,49 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
                 "last_done": last_done,
             }
 
-        # Subscribe to todo list state changes
+        # Follow the todo lists, override entities and dependencies through the
+        # shared dispatcher, which only calls the tasks subscribed to the changed entity
+        dispatcher = async_get_state_dispatcher(self.hass)
+        if self.todo_lists:
+            self.async_on_remove(dispatcher.async_track(self.todo_lists, self._async_todo_list_state_changed))
+        # Re-evaluate whenever an override entity's state changes an effective value
+        overrides = self._override_entities()
+        if overrides:
+            self._resolve_overrides()
+            self.async_on_remove(dispatcher.async_track(overrides.values(), self._async_override_state_changed))
+        # Dependencies that are tasks re-clamp this one through the dependency graph
         self.async_on_remove(
-            self.hass.bus.async_listen(
-                EVENT_STATE_CHANGED,
-                self.async_todo_list_changed,
-                self._filter_state_changes
-            )
+            async_get_dependency_graph(self.hass).async_add_task(self.entity_id, self.dependencies, self)
         )
-
-        # Subscribe to override entity state changes
-        if any([self.active_override, self.task_interval_override, self.due_soon_override]):
-            @callback
-            def _async_override_state_changed(_event: Any) -> None:
-                self.async_schedule_update_ha_state(force_refresh=True)
-
-            self.async_on_remove(
-                self.hass.bus.async_listen(
-                    EVENT_STATE_CHANGED,
-                    _async_override_state_changed,
-                    self._filter_override_changes,
-                )
-            )
-
-        # Subscribe to dependency state changes so the task re-evaluates whenever
-        # a dependency's state changes.
         if self.dependencies:
-            @callback
-            def _async_dependency_state_changed(_event: Any) -> None:
-                self.async_schedule_update_ha_state(force_refresh=True)
-
-            self.async_on_remove(
-                self.hass.bus.async_listen(
-                    EVENT_STATE_CHANGED,
-                    _async_dependency_state_changed,
-                    self._filter_dependency_changes,
-                )
-            )
+            self.async_on_remove(dispatcher.async_track(self.dependencies, self._async_dependency_state_changed))
+
+        # The todo lists are synced in one batch with the other tasks starting up
+        await self._async_update_state()
+        if self._start_todo_sync():
+            async_get_todo_reconciler(self.hass).async_schedule(self)
+
+    def _override_entities(self) -> dict[str, str]:
+        """Return the configured override entities by override kind."""
+        overrides = {
+            CONF_ACTIVE_OVERRIDE: self.active_override,
+            CONF_TASK_INTERVAL_OVERRIDE: self.task_interval_override,
+            CONF_DUE_SOON_OVERRIDE: self.due_soon_override,
+        }
+        return {kind: entity_id for kind, entity_id in overrides.items() if entity_id}
 
-        await self.async_update()
+    def _override_value(self, kind: str, entity_id: str) -> bool | int | None:
+        """Return the parsed state of override entity *entity_id*, reading it on first use."""
+        if kind not in self._override_values:
+            self._override_values[kind] = OVERRIDE_PARSERS[kind](self.hass.states.get(entity_id))
+        return self._override_values[kind]
 
     def _resolve_active_override(self) -> bool:
         """Return the effective ``active`` value after applying any override entity."""
         if self.active_override:
-            override_state = self.hass.states.get(self.active_override)
-            if override_state is not None and override_state.state not in ("unavailable", "unknown"):
-                return override_state.state == "on"
+            value = self._override_value(CONF_ACTIVE_OVERRIDE, self.active_override)
+            if value is not None:
+                return value
         return self.active
 
     def _resolve_task_interval_override(self) -> tuple[int, str]:
@@ -183,37 +253,122 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
         override represents a number of days regardless of the configured interval type.
         """
         if self.task_interval_override:
-            override_state = self.hass.states.get(self.task_interval_override)
-            if override_state is not None and override_state.state not in ("unavailable", "unknown"):
-                try:
-                    return max(1, int(float(override_state.state))), CONF_DAY
-                except (ValueError, TypeError):
-                    pass
+            value = self._override_value(CONF_TASK_INTERVAL_OVERRIDE, self.task_interval_override)
+            if value is not None:
+                return value, CONF_DAY
         return self.task_interval_value, self.task_interval_type
 
     def _resolve_due_soon_override(self) -> int:
         """Return the effective due soon days after applying any override entity."""
         if self.due_soon_override:
-            override_state = self.hass.states.get(self.due_soon_override)
-            if override_state is not None and override_state.state not in ("unavailable", "unknown"):
-                try:
-                    return max(0, int(float(override_state.state)))
-                except (ValueError, TypeError):
-                    pass
+            value = self._override_value(CONF_DUE_SOON_OVERRIDE, self.due_soon_override)
+            if value is not None:
+                return value
         return self.due_soon_days
 
+    def _resolve_overrides(self) -> tuple[bool, tuple[int, str], int]:
+        """Return the effective active, (interval_value, interval_type) and due soon days."""
+        return (
+            self._resolve_active_override(),
+            self._resolve_task_interval_override(),
+            self._resolve_due_soon_override(),
+        )
+
     async def async_update(self) -> None:
-        """Recalculate state, attributes, and sync all configured todo lists."""
+        """Recalculate state and attributes; sync the todo lists in the background if needed.
+
+        The state is written as soon as this returns, without waiting for any
+        todo list.  The lists are only synced when the due date or the state
+        changed since they were last synced.
+        """
+        await self._async_recalculate()
+        # Home Assistant writes the state itself after this, bypassing the
+        # refresh paths, so the next refresh must not compare against older values
+        self._written = None
+
+    async def _async_recalculate(self) -> None:
+        """Recalculate state and attributes and start a todo list sync if needed."""
+        await self._async_update_state()
+        if self._start_todo_sync():
+            if self.hass.state is not CoreState.running:
+                # Reconciled with all other tasks once Home Assistant has started
+                async_get_todo_reconciler(self.hass).async_schedule(self)
+            elif self._todo_sync_task is None or self._todo_sync_task.done():
+                self._todo_sync_task = self.hass.async_create_background_task(
+                    self._async_run_todo_sync(), f"{DOMAIN} todo sync {self.entity_id}"
+                )
+            else:
+                self._todo_sync_rerun = True
+
+    @callback
+    def async_schedule_refresh(self) -> None:
+        """Recalculate the state in a task and write it if anything changed."""
+        self.hass.async_create_task(self._async_refresh(), f"{DOMAIN} refresh {self.entity_id}")
+
+    async def _async_refresh(self) -> None:
+        """Recalculate the state and write it if anything changed."""
+        await self._async_recalculate()
+        self._async_write_if_changed()
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write the state, unless it and all attributes equal those of the last refresh write.
+
+        Refreshes triggered by overrides, dependencies or the coordinator often
+        change nothing; skipping those writes spares the state machine, the
+        recorder and every frontend client.  Writes by Home Assistant itself
+        (adding the entity, registry updates) always go through.
+        """
+        written = (self._attr_native_value, dict(self._attr_extra_state_attributes or {}))
+        if written == self._written:
+            self.state_writes_skipped += 1
+            return
+        self._written = written
+        self.async_write_ha_state()
+
+    async def _async_run_todo_sync(self) -> None:
+        """Sync all configured todo lists, again if the state changed meanwhile."""
+        self._todo_sync_rerun = True
+        while self._todo_sync_rerun:
+            self._todo_sync_rerun = False
+            # The lists are synced concurrently within a time budget, so a slow
+            # list does not hold up the others
+            if not await async_get_todo_reconciler(self.hass).async_sync_task(self):
+                # Try again on the next refresh
+                self._todo_synced_for = None
+
+    def _start_todo_sync(self) -> bool:
+        """Return whether the todo lists need a sync for the current due date and state.
+
+        If so, they count as synced for it from now on, so each change is synced once.
+        """
+        synced_for = (self.due_date, self._attr_native_value)
+        if not self.todo_lists or synced_for == self._todo_synced_for:
+            return False
+        self._todo_synced_for = synced_for
+        return True
+
+    async def async_refresh_state(self) -> TaskTrackerSensor | None:
+        """Recalculate and write the state without touching the todo lists.
+
+        Used by the nightly refresh, which syncs the todo lists of all refreshed
+        tasks afterwards in one batch; returns the sensor if it belongs in that
+        batch.
+        """
+        await self._async_update_state()
+        self._async_write_if_changed()
+        return self if self._start_todo_sync() else None
+
+    async def _async_update_state(self) -> None:
+        """Recalculate state and attributes."""
         self._attr_native_value = CONST_DONE
 
-        effective_active = self._resolve_active_override()
-        effective_task_interval_value, effective_task_interval_type = self._resolve_task_interval_override()
-        effective_due_soon_days = self._resolve_due_soon_override()
+        effective_active, (effective_task_interval_value, effective_task_interval_type), effective_due_soon_days = \
+            self._resolve_overrides()
 
         self.due_date = self.coordinator.calculate_due_date(effective_task_interval_value, effective_task_interval_type)
         today = dt_util.now().date()
-        self.due_in: int = (self.due_date - today).days if self.due_date > today else 0
-        overdue_by: int = (today - self.due_date).days if self.due_date < today else 0
+        self.due_in, overdue_by = self._day_counters(today)
 
         if not effective_active:
             self._attr_native_value = CONST_INACTIVE
@@ -222,27 +377,13 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
         elif self.due_in <= effective_due_soon_days:
             self._attr_native_value = CONST_DUE_SOON
 
-        # Apply dependency constraint: a task's state cannot be more urgent than its
-        # least-urgent dependency.  Urgency ordering: done < due_soon < due.
-        if self._attr_native_value in (CONST_DUE, CONST_DUE_SOON) and self.dependencies:
-            # State ordering: done=0, due_soon=1, due=2
-            state_rank = {CONST_DONE: 0, CONST_DUE_SOON: 1, CONST_DUE: 2}
-            own_rank = state_rank.get(self._attr_native_value, 2)
-            min_dep_rank = own_rank
-            for dep_entity_id in self.dependencies:
-                dep_state_obj = self.hass.states.get(dep_entity_id)
-                if dep_state_obj is None:
-                    continue
-                dep_rank = state_rank.get(dep_state_obj.state)
-                if dep_rank is not None and dep_rank < min_dep_rank:
-                    min_dep_rank = dep_rank
-            if min_dep_rank < own_rank:
-                # Clamp to the least-urgent dependency state
-                rank_state = {0: CONST_DONE, 1: CONST_DUE_SOON, 2: CONST_DUE}
-                self._attr_native_value = rank_state[min_dep_rank]
+        # A task's state cannot be more urgent than its least-urgent dependency
+        self._own_state = self._attr_native_value
+        self._attr_native_value = self._clamp_to_dependencies(self._own_state)
 
         self._effective_active: bool = effective_active
         self._effective_due_soon_days: int = effective_due_soon_days
+        async_get_scheduler(self.hass).async_schedule_transition(self.entry_id, self._next_transition())
 
         self._attr_extra_state_attributes: dict[str, str | int | list] = {
             "last_done": str(self.coordinator.last_done),
@@ -256,6 +397,7 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
             "due_soon_days": effective_due_soon_days,
             "notification_interval": self.notification_interval,
             "dependencies": self.dependencies,
+            **self.coordinator.history.as_attributes(),
         }
         if self.coordinator.repeat_mode == CONF_REPEAT_EVERY:
             repeat_every_type = self.coordinator.repeat_every_type
@@ -276,8 +418,79 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
         else:
             self._attr_extra_state_attributes["task_interval_value"] = effective_task_interval_value
             self._attr_extra_state_attributes["task_interval_type"] = effective_task_interval_type
-        for todo_list in self.todo_lists:
-            await self.async_sync_todo_list(todo_list)
+        # Re-clamp the tasks depending on this one in a single topologically ordered pass
+        graph = async_get_dependency_graph(self.hass)
+        if graph.async_set_state(self.entity_id, self._attr_native_value):
+            graph.async_propagate(self.entity_id)
+
+    def _clamp_to_dependencies(self, state: str) -> str:
+        """Return *state* clamped to the least urgent state among the dependencies.
+
+        Urgency ordering: done < due_soon < due.  The dependency graph keeps
+        per-state counts of this task's dependencies, so this is a constant-time
+        lookup however many dependencies there are.
+        """
+        if state not in (CONST_DUE, CONST_DUE_SOON) or not self.dependencies:
+            return state
+        min_dep_rank = async_get_dependency_graph(self.hass).least_urgent_dependency(self.entity_id)
+        if min_dep_rank is not None and min_dep_rank < STATE_RANK[state]:
+            return RANK_STATE[min_dep_rank]
+        return state
+
+    @callback
+    def async_reevaluate_dependencies(self) -> bool:
+        """Re-apply the dependency clamp after a dependency changed; return whether the state changed.
+
+        Called by the dependency graph instead of a full refresh; the new state
+        is written right away and the todo lists are reconciled in the next batch.
+        """
+        if self._own_state is None:
+            return False
+        state = self._clamp_to_dependencies(self._own_state)
+        if state == self._attr_native_value:
+            return False
+        self._attr_native_value = state
+        async_get_dependency_graph(self.hass).async_set_state(self.entity_id, state)
+        self._async_write_if_changed()
+        if self._start_todo_sync():
+            async_get_todo_reconciler(self.hass).async_schedule(self)
+        return True
+
+    def _day_counters(self, today: date) -> tuple[int, int]:
+        """Return ``(due_in, overdue_by)`` for *today*."""
+        due_in = (self.due_date - today).days if self.due_date > today else 0
+        overdue_by = (today - self.due_date).days if self.due_date < today else 0
+        return due_in, overdue_by
+
+    def _next_transition(self) -> date | None:
+        """Return the next day on which the state changes by the passing of time alone.
+
+        Inactive and due tasks have no such day; their state only changes
+        through completion, configuration or override / dependency changes,
+        all of which trigger a refresh themselves.
+        """
+        if not self._effective_active or self.due_in == 0:
+            return None
+        if self.due_in > self._effective_due_soon_days:
+            return self.due_date - timedelta(days=self._effective_due_soon_days)
+        return self.due_date
+
+    @callback
+    def async_advance_day(self) -> None:
+        """Move ``due_in`` / ``overdue_by`` on to a new day on which the state does not change.
+
+        Called by the scheduler at midnight instead of a full refresh, so no
+        todo list is touched.
+        """
+        if not self._attr_extra_state_attributes:
+            return
+        self.due_in, overdue_by = self._day_counters(dt_util.now().date())
+        self._attr_extra_state_attributes = {
+            **self._attr_extra_state_attributes,
+            "due_in": self.due_in,
+            "overdue_by": overdue_by,
+        }
+        self._async_write_if_changed()
 
     @callback
     def _filter_state_changes(self, event_data: EventStateChangedData) -> bool:
@@ -300,18 +513,46 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
             return False
 
     @callback
-    def _filter_override_changes(self, event_data: EventStateChangedData) -> bool:
-        """Listen only for state changes in override entities."""
-        override_entities = {e for e in
-                             [self.active_override, self.task_interval_override, self.due_soon_override] if e}
-        return event_data["entity_id"] in override_entities
+    def _async_todo_list_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle a state change of one of the task's todo lists."""
+        if self._filter_state_changes(event.data):
+            self.async_todo_list_changed(event)
 
     @callback
-    def _filter_dependency_changes(self, event_data: EventStateChangedData) -> bool:
-        """Listen only for state changes in dependency entities."""
-        return event_data["entity_id"] in self.dependencies
+    def _async_override_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Refresh the task if an override entity's new state changes an effective value.
 
-    async def async_todo_list_changed(self, event: Any) -> None:
+        Numeric sensors used as overrides may report every few seconds; a new
+        state that parses to the same value (or falls back to the same
+        configured value) does not refresh the task.
+        """
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+        effective = self._resolve_overrides()
+        for kind, override in self._override_entities().items():
+            if override == entity_id:
+                self._override_values[kind] = OVERRIDE_PARSERS[kind](new_state)
+        if self._resolve_overrides() == effective:
+            self.override_refreshes_skipped += 1
+            return
+        self.async_schedule_refresh()
+
+    @callback
+    def _async_dependency_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Follow a state change of a dependency that is not a loaded task.
+
+        Loaded tasks report their state to the dependency graph themselves.
+        """
+        entity_id = event.data["entity_id"]
+        graph = async_get_dependency_graph(self.hass)
+        if graph.is_task(entity_id):
+            return
+        new_state = event.data.get("new_state")
+        if graph.async_set_state(entity_id, new_state.state if new_state is not None else None):
+            graph.async_propagate(entity_id)
+
+    @callback
+    def async_todo_list_changed(self, event: Any) -> None:
         """Handle a todo list state-change event.
 
         Cancels any previously scheduled deferred update, then waits 5 seconds
@@ -351,22 +592,42 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
     async def async_sync_todo_list(self, todo_list: str) -> None:
         """Add, update, or remove this task's item in *todo_list* as appropriate."""
         existing_item: dict | None = await self.async_get_item_from_todo_list(todo_list)
+        operation = self.get_todo_operation(existing_item)
+        if operation is not None:
+            await self.async_apply_todo_operation(todo_list, operation)
 
+    def get_todo_operation(self, existing_item: dict[str, Any] | None) -> str | None:
+        """Return the todo service needed to bring *existing_item* in line, or ``None``."""
         if self._effective_active and self._attr_native_value in [CONST_DUE, CONST_DUE_SOON]:
             # there is supposed to be an item in the todo list
             if existing_item is None:
                 # The item does not exist, so we need to add it
-                await self.async_add_item_to_todo_list(todo_list)
-                return
-            # the item exists but the status and due date might be wrong
-            # even if the current status and due date are correct, it is easiest to just update the item
+                return TODO_ADD
+            if self._todo_item_is_current(existing_item):
+                # Updating an identical item would still rewrite the list and fire a state change
+                self.todo_writes_avoided += 1
+                return None
+            # the item exists but the status or due date is wrong
+            return TODO_UPDATE
+        # there is NOT supposed to be an item in the todo list
+        if existing_item is None:
+            # The item does not exist, so no action is needed
+            return None
+        # The item exists, so we need to remove it
+        return TODO_REMOVE
+
+    def _todo_item_is_current(self, existing_item: dict[str, Any]) -> bool:
+        """Return whether *existing_item* already has the status and due date an update would set."""
+        return (existing_item.get("status") == "needs_action"
+                and existing_item.get("due") == self.due_date.isoformat())
+
+    async def async_apply_todo_operation(self, todo_list: str, operation: str) -> None:
+        """Call the todo service *operation* for this task's item in *todo_list*."""
+        if operation == TODO_ADD:
+            await self.async_add_item_to_todo_list(todo_list)
+        elif operation == TODO_UPDATE:
             await self.async_update_item_in_todo_list(todo_list)
-        else:
-            # there is NOT supposed to be an item in the todo list
-            if existing_item is None:
-                # The item does not exist, so no action is needed
-                return
-            # The item exists, so we need to remove it
+        elif operation == TODO_REMOVE:
             await self.async_remove_item_from_todo_list(todo_list)
 
     async def async_add_item_to_todo_list(self, todo_list: str) -> None:
@@ -394,19 +655,8 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
         })
 
     async def async_get_item_from_todo_list(self, todo_list: str) -> dict | None:
-        """Get the todo item from the todo list."""
-        response = await self.async_call_service("get_items", {
-            CONF_ENTITY_ID: todo_list,
-            "status": ["needs_action", "completed"],
-        }, blocking=True, response=True)
-
-        if not response:
-            return None
-
-        for item in response.get(todo_list, {}).get("items", []):
-            if item.get("summary") == self.entry_name:
-                return item
-        return None
+        """Get the todo item from the todo list, through the item index shared by all tasks."""
+        return await async_get_todo_index(self.hass).async_get_item(todo_list, self.entry_name)
 
     async def async_call_service(self, service: str, service_data: dict[str, Any], blocking: bool = False,
                                  response: bool = False) -> dict | None:
@@ -422,6 +672,11 @@ class TaskTrackerSensor(RestoreSensor, SensorEntity):
         except (ServiceValidationError, HomeAssistantError) as err:
             LOGGER.error("Failed to call service \"todo.%s\": %s", service, err)
             raise
+        finally:
+            if not response:
+                # Writes do not always change the list's state (e.g. a new due
+                # date), so drop the shared index entry explicitly.
+                async_get_todo_index(self.hass).async_invalidate(service_data[CONF_ENTITY_ID])
 
     async def async_mark_as_done(self) -> None:
         """Mark the task as done for today.
@@ -467,12 +722,14 @@ class TaskTrackerTimesCompletedSensor(RestoreSensor, SensorEntity):
     async def async_added_to_hass(self) -> None:
         """Restore last known state on startup."""
         await super().async_added_to_hass()
+        self.async_on_remove(async_get_registry(self.hass).async_add_entity(self.entry_id, self.entity_id))
         self.async_on_remove(
             self.coordinator.async_add_listener(
                 lambda: self.async_schedule_update_ha_state(force_refresh=True)
             )
         )
-        last_sensor_state = await self.async_get_last_sensor_data()
+        # Restored from the state store already, unless the task is not stored there yet
+        last_sensor_state = None if self.coordinator.state_restored else await self.async_get_last_sensor_data()
         if last_sensor_state is not None:
             try:
                 restored_times_completed = int(last_sensor_state.native_value)
@@ -0,0 +1,87 @@
+"""Central state-change dispatcher for the Task Tracker integration.
+
+Tasks follow the state of their todo lists, override entities and
+dependencies.  Rather than every task adding its own ``EVENT_STATE_CHANGED``
+listener, whose filter then runs for every state change in the instance, all
+tasks subscribe here: a single bus listener looks the changed entity up in a
+dict from entity id to subscribers and calls only those.  A task without todo
+lists, overrides or dependencies subscribes to nothing.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, EventStateChangedData, HomeAssistant, callback
+
+from .const import DOMAIN
+
+DATA_STATE_DISPATCHER = "state_dispatcher"
+
+StateChangeAction = Callable[[Event[EventStateChangedData]], None]
+
+
+class StateChangeDispatcher:
+    """Dispatches state changes to the subscribers of the changed entity."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the dispatcher without subscribers or bus listener."""
+        self.hass = hass
+        self._subscribers: dict[str, list[StateChangeAction]] = {}
+        self._unsub_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_track(self, entity_ids: Iterable[str], action: StateChangeAction) -> Callable[[], None]:
+        """Call *action* with every state change of *entity_ids*; returns a callable that stops it.
+
+        *action* must be a callback; it is called from the event loop.
+        """
+        entity_ids = list(dict.fromkeys(entity_id for entity_id in entity_ids if entity_id))
+        for entity_id in entity_ids:
+            self._subscribers.setdefault(entity_id, []).append(action)
+        if self._subscribers and self._unsub_listener is None:
+            self._unsub_listener = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_dispatch, self._async_filter
+            )
+
+        @callback
+        def remove_tracking() -> None:
+            for entity_id in entity_ids:
+                subscribers = self._subscribers.get(entity_id)
+                if subscribers is None or action not in subscribers:
+                    continue
+                subscribers.remove(action)
+                if not subscribers:
+                    del self._subscribers[entity_id]
+            if not self._subscribers and self._unsub_listener is not None:
+                self._unsub_listener()
+                self._unsub_listener = None
+
+        return remove_tracking
+
+    def subscriber_count(self, entity_id: str) -> int:
+        """Return the number of subscriptions to *entity_id*."""
+        return len(self._subscribers.get(entity_id, ()))
+
+    @callback
+    def _async_filter(self, event_data: EventStateChangedData) -> bool:
+        """Let through only state changes of entities someone subscribed to."""
+        return event_data["entity_id"] in self._subscribers
+
+    @callback
+    def _async_dispatch(self, event: Event[EventStateChangedData]) -> None:
+        """Call the subscribers of the changed entity."""
+        # Copy, as a subscriber may unsubscribe while being called
+        for action in list(self._subscribers.get(event.data["entity_id"], ())):
+            action(event)
+
+
+@callback
+def async_get_state_dispatcher(hass: HomeAssistant) -> StateChangeDispatcher:
+    """Return the state-change dispatcher stored in ``hass.data[DOMAIN]``, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    dispatcher = domain_data.get(DATA_STATE_DISPATCHER)
+    if dispatcher is None:
+        dispatcher = domain_data[DATA_STATE_DISPATCHER] = StateChangeDispatcher(hass)
+    return dispatcher
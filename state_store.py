@@ -0,0 +1,104 @@
+"""Persistent coordinator state for the Task Tracker integration.
+
+The state every coordinator owns (the day the task was last done and how often
+it was completed) is kept for all tasks in one ``Store``, loaded once in
+``async_setup`` before any config entry is set up.  A coordinator is restored
+from it as soon as it is created, so it is valid before its entities are
+added, independent of the restore-state cache and of the order in which the
+entities are set up.
+
+Days are stored as proleptic Gregorian ordinals.  Writes are delayed and
+coalesced, so a burst of completions across many tasks results in one write
+to disk; the data is taken from the live coordinators at write time.
+
+Tasks without stored state (set up before this store existed) are restored
+from their entities' last state once more; the store is written shortly after
+they are added so that it takes over from then on.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from logging import getLogger
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .coordinator import TaskTrackerCoordinator
+
+LOGGER = getLogger(__name__)
+
+DATA_STATE_STORE = "state_store"
+STORAGE_KEY = f"{DOMAIN}.state"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+class TaskTrackerStateStore:
+    """Coordinator state of all tasks, persisted together in one ``Store``."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the store; call ``async_load`` before use."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        # Stored state of every task, and the coordinators of the loaded ones
+        self._tasks: dict[str, dict[str, int]] = {}
+        self._coordinators: dict[str, TaskTrackerCoordinator] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored state of all tasks."""
+        data = await self._store.async_load() or {}
+        self._tasks = dict(data.get("tasks", {}))
+        LOGGER.debug("Loaded coordinator state for %s tasks", len(self._tasks))
+
+    @callback
+    def async_add_coordinator(self, coordinator: TaskTrackerCoordinator) -> Callable[[], None]:
+        """Restore *coordinator* from the stored state and keep it persisted.
+
+        Sets ``coordinator.state_restored`` when stored state was found;
+        otherwise a write is scheduled so that the state the entities restore
+        is stored.  Returns a callable that stops persisting the coordinator,
+        keeping its last state.
+        """
+        entry_id = coordinator.entry_id
+        task_data = self._tasks.get(entry_id)
+        if task_data is not None:
+            coordinator.last_done = date.fromordinal(task_data.get("last_done", coordinator.last_done.toordinal()))
+            coordinator.times_completed = task_data.get("times_completed", 0)
+            coordinator.state_restored = True
+        self._coordinators[entry_id] = coordinator
+        if task_data is None:
+            self.async_schedule_save()
+
+        @callback
+        def remove_coordinator() -> None:
+            if self._coordinators.get(entry_id) is coordinator:
+                self._tasks[entry_id] = self._coordinator_data(coordinator)
+                del self._coordinators[entry_id]
+
+        return remove_coordinator
+
+    @callback
+    def async_remove_task(self, entry_id: str) -> None:
+        """Delete the state of a removed task."""
+        self._coordinators.pop(entry_id, None)
+        if self._tasks.pop(entry_id, None) is not None:
+            self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write; writes requested within ``SAVE_DELAY`` are merged."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @staticmethod
+    def _coordinator_data(coordinator: TaskTrackerCoordinator) -> dict[str, int]:
+        """Return the persisted state of *coordinator*."""
+        return {"last_done": coordinator.last_done.toordinal(), "times_completed": coordinator.times_completed}
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data written to disk."""
+        for entry_id, coordinator in self._coordinators.items():
+            self._tasks[entry_id] = self._coordinator_data(coordinator)
+        return {"tasks": dict(self._tasks)}
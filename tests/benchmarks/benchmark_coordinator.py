@@ -0,0 +1,215 @@
+"""Benchmarks for the due-date computation in ``coordinator.py``.
+
+Times ``calculate_due_date`` (cold and memoised), ``async_mark_as_done`` and
+every ``_calc_*`` helper across all repeat_after interval types and all
+repeat_every sub-types, including the pathological cases: a never-completed
+task (``last_done`` = 1970-01-01), ``months_interval`` = 12, the "last"
+weekday of the month and ``days_before_end`` = 30.
+
+Results are written as JSON so that runs from different releases can be
+diffed.  Usage, from the repository root::
+
+    python tests/benchmarks/benchmark_coordinator.py [--output FILE] [--quick]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import timeit
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+absolute_mock_path = str(Path(__file__).parent.parent / "unit_tests" / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from task_tracker.coordinator import TaskTrackerCoordinator  # noqa: E402
+from task_tracker.const import (  # noqa: E402
+    CONF_DAY, CONF_WEEK, CONF_MONTH, CONF_YEAR,
+    CONF_REPEAT_AFTER, CONF_REPEAT_EVERY,
+    CONF_REPEAT_EVERY_WEEKDAY, CONF_REPEAT_EVERY_DAY_OF_MONTH, CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH,
+    CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH,
+    CONF_MONDAY, CONF_FRIDAY, CONF_SUNDAY,
+)
+
+EPOCH = date(1970, 1, 1)
+RECENT = date(2026, 1, 15)
+TODAY = date(2026, 10, 18)
+LAST_DONE_CASES = {"epoch": EPOCH, "recent": RECENT}
+
+REPEAT_AFTER_INTERVALS = [
+    (1, CONF_DAY), (7, CONF_DAY), (1, CONF_WEEK), (2, CONF_WEEK),
+    (1, CONF_MONTH), (3, CONF_MONTH), (12, CONF_MONTH), (1, CONF_YEAR), (2, CONF_YEAR),
+]
+
+
+def _repeat_every_schedules() -> list[dict]:
+    """Return repeat_every configurations covering every sub-type and interval value."""
+    schedules = []
+    for weeks_interval in (1, 2, 4):
+        for weekday in (CONF_MONDAY, CONF_SUNDAY):
+            schedules.append({"repeat_every_type": CONF_REPEAT_EVERY_WEEKDAY, "repeat_weekday": weekday,
+                              "repeat_weeks_interval": weeks_interval})
+    for months_interval in (1, 2, 3, 6, 12):
+        for day in (1, 15, 31):
+            schedules.append({"repeat_every_type": CONF_REPEAT_EVERY_DAY_OF_MONTH, "repeat_month_day": day,
+                              "repeat_months_interval": months_interval})
+        for nth in ("1", "2", "3", "4", "last"):
+            schedules.append({"repeat_every_type": CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH,
+                              "repeat_weekday": CONF_FRIDAY, "repeat_nth_occurrence": nth,
+                              "repeat_months_interval": months_interval})
+        for days_before in (0, 15, 30):
+            schedules.append({"repeat_every_type": CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH,
+                              "repeat_days_before_end": days_before, "repeat_months_interval": months_interval})
+    return schedules
+
+
+def _measure(func, number: int, repeat: int) -> dict:
+    """Time *func* and return per-call statistics in nanoseconds."""
+    runs = timeit.Timer(func).repeat(repeat=repeat, number=number)
+    per_call = [run / number * 1e9 for run in runs]
+    return {
+        "iterations": number * repeat,
+        "min_ns": round(min(per_call), 1),
+        "mean_ns": round(sum(per_call) / len(per_call), 1),
+        "max_ns": round(max(per_call), 1),
+    }
+
+
+def _coordinator(last_done: date, **kwargs) -> TaskTrackerCoordinator:
+    coordinator = TaskTrackerCoordinator("benchmark", **kwargs)
+    coordinator.last_done = last_done
+    return coordinator
+
+
+def bench_calculate_due_date(number: int, repeat: int) -> list[dict]:
+    """Benchmark calculate_due_date, both uncached (cold) and memoised (warm)."""
+    results = []
+    cases = [({"repeat_mode": CONF_REPEAT_AFTER}, interval) for interval in REPEAT_AFTER_INTERVALS]
+    cases += [({"repeat_mode": CONF_REPEAT_EVERY, **schedule}, (7, CONF_DAY)) for schedule in _repeat_every_schedules()]
+    for config, (interval_value, interval_type) in cases:
+        for last_done_name, last_done in LAST_DONE_CASES.items():
+            coordinator = _coordinator(last_done, **config)
+
+            def cold(c=coordinator, v=interval_value, t=interval_type):
+                c.invalidate_due_date_cache()
+                c.calculate_due_date(v, t)
+
+            def warm(c=coordinator, v=interval_value, t=interval_type):
+                c.calculate_due_date(v, t)
+
+            params = {**config, "interval_value": interval_value, "interval_type": interval_type,
+                      "last_done": last_done_name}
+            results.append({"name": "calculate_due_date[cold]", "params": params, **_measure(cold, number, repeat)})
+            results.append({"name": "calculate_due_date[warm]", "params": params, **_measure(warm, number, repeat)})
+    return results
+
+
+def bench_async_mark_as_done(number: int, repeat: int) -> list[dict]:
+    """Benchmark async_mark_as_done from an overdue state, so every call performs the catch-up."""
+    results = []
+    cases = [{"repeat_mode": CONF_REPEAT_AFTER}]
+    cases += [{"repeat_mode": CONF_REPEAT_EVERY, **schedule} for schedule in _repeat_every_schedules()]
+    loop = asyncio.new_event_loop()
+    try:
+        for config in cases:
+            for last_done_name, last_done in LAST_DONE_CASES.items():
+                coordinator = _coordinator(last_done, **config)
+
+                async def run(c=coordinator, start=last_done):
+                    for _ in range(number):
+                        c.last_done = start
+                        await c.async_mark_as_done(today=TODAY)
+
+                per_call = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    loop.run_until_complete(run())
+                    per_call.append((time.perf_counter() - started) / number * 1e9)
+                results.append({
+                    "name": "async_mark_as_done",
+                    "params": {**config, "last_done": last_done_name},
+                    "iterations": number * repeat,
+                    "min_ns": round(min(per_call), 1),
+                    "mean_ns": round(sum(per_call) / len(per_call), 1),
+                    "max_ns": round(max(per_call), 1),
+                })
+    finally:
+        loop.close()
+    return results
+
+
+def bench_calc_helpers(number: int, repeat: int) -> list[dict]:
+    """Benchmark each ``_calc_*`` helper with its most expensive parameters."""
+    results = []
+    for last_done_name, last_done in LAST_DONE_CASES.items():
+        c = _coordinator(last_done)
+        helper_cases = [
+            ("_calc_next_weekday", lambda: c._calc_next_weekday(c.last_done, CONF_SUNDAY, 4),
+             {"weekday": CONF_SUNDAY, "weeks_interval": 4}),
+            ("_calc_next_day_of_month", lambda: c._calc_next_day_of_month(c.last_done, 31, 12),
+             {"day": 31, "months_interval": 12}),
+            ("_calc_next_days_before_end_of_month", lambda: c._calc_next_days_before_end_of_month(c.last_done, 30, 12),
+             {"days_before_end": 30, "months_interval": 12}),
+            ("_calc_next_weekday_of_month",
+             lambda: c._calc_next_weekday_of_month(c.last_done, CONF_FRIDAY, "last", 12),
+             {"weekday": CONF_FRIDAY, "nth": "last", "months_interval": 12}),
+            ("_calc_most_recent_weekday", lambda: c._calc_most_recent_weekday(TODAY, CONF_SUNDAY),
+             {"weekday": CONF_SUNDAY}),
+            ("_calc_most_recent_weekday_in_cycle", lambda: c._calc_most_recent_weekday_in_cycle(TODAY, CONF_SUNDAY, 4),
+             {"weekday": CONF_SUNDAY, "weeks_interval": 4}),
+            ("_calc_most_recent_day_of_month", lambda: c._calc_most_recent_day_of_month(TODAY, 31, 12),
+             {"day": 31, "months_interval": 12}),
+            ("_calc_most_recent_days_before_end_of_month",
+             lambda: c._calc_most_recent_days_before_end_of_month(TODAY, 30, 12),
+             {"days_before_end": 30, "months_interval": 12}),
+            ("_calc_most_recent_weekday_of_month",
+             lambda: c._calc_most_recent_weekday_of_month(TODAY, CONF_FRIDAY, "last", 12),
+             {"weekday": CONF_FRIDAY, "nth": "last", "months_interval": 12}),
+        ]
+        for name, func, params in helper_cases:
+            results.append({"name": name, "params": {**params, "last_done": last_done_name},
+                            **_measure(func, number, repeat)})
+    return results
+
+
+def main() -> None:
+    """Run all benchmarks and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write the results to")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for a smoke run")
+    args = parser.parse_args()
+
+    number, repeat = (50, 3) if args.quick else (2000, 5)
+    started = time.perf_counter()
+    results = bench_calculate_due_date(number, repeat)
+    results += bench_async_mark_as_done(number, repeat)
+    results += bench_calc_helpers(number, repeat)
+
+    manifest = json.loads((Path(__file__).parent.parent.parent / "manifest.json").read_text())
+    report = {
+        "meta": {
+            "integration_version": manifest["version"],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "today": TODAY.isoformat(),
+            "number": number,
+            "repeat": repeat,
+            "duration_s": round(time.perf_counter() - started, 2),
+        },
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    slowest = max(results, key=lambda r: r["mean_ns"])
+    print(f"{len(results)} benchmarks written to {args.output} "
+          f"(slowest: {slowest['name']} {slowest['params']} at {slowest['mean_ns']:.0f} ns/call)")
+
+
+if __name__ == "__main__":
+    main()
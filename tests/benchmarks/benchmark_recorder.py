@@ -0,0 +1,118 @@
+"""Recorder database growth caused by the status sensor's attributes.
+
+Simulates a year of daily updates of a typical task (weekly, done on its due
+date, with tags, todo lists and a dependency) and sums the size of the
+``state_attributes`` rows the recorder would write for it.  The recorder
+stores each distinct attribute set once, as compact JSON, so the growth is the
+size of the distinct recorded attribute sets.  This is compared for all
+attributes, for the attributes recorded before the configuration attributes
+were excluded, and for the attributes recorded now.
+
+Results are written as JSON so that runs from different releases can be
+diffed.  Usage, from the repository root::
+
+    python tests/benchmarks/benchmark_recorder.py [--output FILE] [--days N]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+absolute_mock_path = str(Path(__file__).parent.parent / "unit_tests" / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from task_tracker.coordinator import TaskTrackerCoordinator  # noqa: E402
+from task_tracker.const import CONF_DAY, CONF_REPEAT_AFTER  # noqa: E402
+from task_tracker.history import HISTORY_ATTRIBUTES  # noqa: E402
+from task_tracker.sensor import TaskTrackerSensor  # noqa: E402
+
+START = date(2026, 1, 1)
+
+
+def _sensor() -> TaskTrackerSensor:
+    hass = MagicMock()
+    hass.data = {}
+    # Todo lists are not synced in this simulation
+    hass.async_create_background_task = MagicMock(side_effect=lambda target, name: target.close())
+    coordinator = TaskTrackerCoordinator("benchmark", repeat_mode=CONF_REPEAT_AFTER)
+    coordinator.last_done = START
+    sensor = TaskTrackerSensor(
+        coordinator, "Water the plants", 7, CONF_DAY, 1, ["todo.household", "todo.garden"], 1,
+        ["garden", "weekly"], True, "mdi:watering-can", "benchmark", hass,
+        dependencies=["sensor.task_tracker_buy_fertilizer_status"],
+    )
+    sensor.hass = hass
+    return sensor
+
+
+def _row_bytes(attributes: dict, excluded: frozenset) -> bytes:
+    """Return the compact JSON the recorder would store for *attributes*."""
+    recorded = {key: value for key, value in attributes.items() if key not in excluded}
+    return json.dumps(recorded, separators=(",", ":"), default=str).encode()
+
+
+async def simulate(days: int) -> dict:
+    """Return the attribute sets of one task over *days* daily updates."""
+    sensor = _sensor()
+    excluded = {
+        "all": frozenset(),
+        "before": HISTORY_ATTRIBUTES,
+        "after": frozenset(TaskTrackerSensor._unrecorded_attributes),
+    }
+    rows = {name: set() for name in excluded}
+    for offset in range(days):
+        today = START + timedelta(days=offset)
+        now = datetime.combine(today, time(12), tzinfo=timezone.utc)
+        with patch("task_tracker.sensor.dt_util.now", return_value=now):
+            if sensor.due_date == today:
+                sensor.coordinator.last_done = today
+            await sensor.async_update()
+        for name, keys in excluded.items():
+            rows[name].add(_row_bytes(sensor._attr_extra_state_attributes, keys))
+    return {
+        name: {"rows": len(distinct), "bytes": sum(len(row) for row in distinct),
+               "keys": sorted(set(sensor._attr_extra_state_attributes) - excluded[name])}
+        for name, distinct in rows.items()
+    }
+
+
+def main() -> None:
+    """Run the simulation and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="benchmark_recorder_results.json",
+                        help="JSON file to write the results to")
+    parser.add_argument("--days", type=int, default=365, help="number of days to simulate")
+    args = parser.parse_args()
+
+    results = asyncio.run(simulate(args.days))
+    saved = results["before"]["bytes"] - results["after"]["bytes"]
+
+    manifest = json.loads((Path(__file__).parent.parent.parent / "manifest.json").read_text())
+    report = {
+        "meta": {
+            "integration_version": manifest["version"],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "start": START.isoformat(),
+            "days": args.days,
+        },
+        "results": results,
+        "bytes_saved": saved,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"{results['after']['rows']} attribute rows over {args.days} days: "
+          f"{results['before']['bytes']} bytes before, {results['after']['bytes']} bytes now "
+          f"({saved} bytes, {saved / results['before']['bytes']:.0%} saved per task); written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Task setup time with and without deferring the todo reconciliation.
+
+Adds a number of tasks sharing a few todo lists, whose todo service calls take
+a fixed simulated latency, and times task setup from the first entity add to
+the last, in two modes:
+
+* ``deferred``: Home Assistant is still starting, so every task only
+  calculates and writes its state; the todo lists of all tasks are reconciled
+  in one batch once ``EVENT_HOMEASSISTANT_STARTED`` fires, which is timed
+  separately;
+* ``inline``: every task syncs its todo lists while it is added, as tasks did
+  before the reconciliation was deferred, so the syncs are part of setup.
+
+Results are written as JSON so that runs from different releases can be
+diffed.  Usage, from the repository root::
+
+    python tests/benchmarks/benchmark_startup.py [--output FILE] [--tasks N] [--lists N] [--latency S]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from contextlib import nullcontext
+from datetime import date, datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+absolute_mock_path = str(Path(__file__).parent.parent / "unit_tests" / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from homeassistant.core import CoreState  # noqa: E402
+
+from task_tracker.coordinator import TaskTrackerCoordinator  # noqa: E402
+from task_tracker.const import CONF_DAY, CONF_REPEAT_AFTER  # noqa: E402
+from task_tracker.sensor import TaskTrackerSensor  # noqa: E402
+from task_tracker.todo_sync import async_get_todo_reconciler  # noqa: E402
+
+LAST_DONE = date(2026, 1, 1)
+
+
+def _hass(lists: dict[str, list[dict]], latency: float, running: bool) -> MagicMock:
+    """Return a Home Assistant stand-in whose todo services keep *lists* and take *latency* seconds."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.state = CoreState.running if running else CoreState.not_running
+    hass.states.get = MagicMock(return_value=None)
+    hass.async_create_task = MagicMock(side_effect=lambda target, name: asyncio.ensure_future(target))
+    hass.async_create_background_task = hass.async_create_task
+    hass.calls = 0
+
+    async def async_call(domain, service, service_data, blocking=False, return_response=False):
+        hass.calls += 1
+        await asyncio.sleep(latency)
+        items = lists[service_data["entity_id"]]
+        if service == "get_items":
+            return {service_data["entity_id"]: {"items": list(items)}}
+        items[:] = [item for item in items if item["summary"] != service_data["item"]]
+        if service != "remove_item":
+            items.append({"summary": service_data["item"], "status": "needs_action",
+                          "due": service_data["due_date"].isoformat()})
+        return None
+
+    hass.services.async_call = MagicMock(side_effect=async_call)
+    return hass
+
+
+def _sensors(hass: MagicMock, tasks: int, todo_lists: list[str]) -> list[TaskTrackerSensor]:
+    """Return *tasks* due tasks, each on two of *todo_lists*."""
+    sensors = []
+    for number in range(tasks):
+        entry_id = f"task_{number}"
+        coordinator = TaskTrackerCoordinator(entry_id, repeat_mode=CONF_REPEAT_AFTER)
+        coordinator.last_done = LAST_DONE
+        task_lists = [todo_lists[number % len(todo_lists)], todo_lists[(number + 1) % len(todo_lists)]]
+        sensor = TaskTrackerSensor(
+            coordinator, f"Task {number}", 7, CONF_DAY, 1, task_lists, 1, [], True, "mdi:broom", entry_id, hass,
+        )
+        sensor.hass = hass
+        sensor.entity_id = f"sensor.task_tracker_task_{number}_status"
+        sensors.append(sensor)
+    return sensors
+
+
+async def run(mode: str, tasks: int, lists: int, latency: float) -> dict:
+    """Set up *tasks* tasks in *mode* and return the timings and todo service calls."""
+    todo_lists = {f"todo.list_{number}": [] for number in range(lists)}
+    hass = _hass(todo_lists, latency, running=mode == "inline")
+    sensors = _sensors(hass, tasks, list(todo_lists))
+    reconciler = async_get_todo_reconciler(hass)
+
+    async def add(sensor: TaskTrackerSensor) -> None:
+        await sensor.async_added_to_hass()
+        if mode == "inline":
+            await reconciler.async_sync_task(sensor)
+
+    # Entities of a platform are added concurrently; inline, the tasks sync
+    # themselves instead of joining the deferred batch
+    with patch.object(reconciler, "async_schedule") if mode == "inline" else nullcontext():
+        started = time.perf_counter()
+        await asyncio.gather(*(add(sensor) for sensor in sensors))
+        setup = time.perf_counter() - started
+    result = {"setup_s": round(setup, 4), "todo_calls_during_setup": hass.calls, "reconcile_s": 0.0}
+    if mode == "deferred":
+        on_started = hass.bus.async_listen_once.call_args.args[1]
+        started = time.perf_counter()
+        await on_started(None)
+        result["reconcile_s"] = round(time.perf_counter() - started, 4)
+    result["todo_calls"] = hass.calls
+    result["items"] = sum(len(items) for items in todo_lists.values())
+    return result
+
+
+def main() -> None:
+    """Run both modes and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="benchmark_startup_results.json",
+                        help="JSON file to write the results to")
+    parser.add_argument("--tasks", type=int, default=100, help="number of tasks to set up")
+    parser.add_argument("--lists", type=int, default=4, help="number of todo lists the tasks share")
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="simulated duration of a todo service call while starting, in seconds")
+    args = parser.parse_args()
+
+    results = {mode: asyncio.run(run(mode, args.tasks, args.lists, args.latency)) for mode in ("inline", "deferred")}
+
+    manifest = json.loads((Path(__file__).parent.parent.parent / "manifest.json").read_text())
+    report = {
+        "meta": {
+            "integration_version": manifest["version"],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "tasks": args.tasks,
+            "lists": args.lists,
+            "latency_s": args.latency,
+        },
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    inline, deferred = results["inline"], results["deferred"]
+    print(f"{args.tasks} tasks on {args.lists} lists: setup took {inline['setup_s']:.3f}s with the todo sync inline "
+          f"({inline['todo_calls']} calls) and {deferred['setup_s']:.3f}s deferred, whose reconciliation took "
+          f"{deferred['reconcile_s']:.3f}s after startup ({deferred['todo_calls']} calls); written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
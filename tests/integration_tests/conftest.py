@@ -53,8 +53,8 @@ if str(REPO_ROOT) not in sys.path:
 
 @pytest.fixture
 def expected_lingering_timers() -> bool:
-    """The midnight-update timer registered by ``async_setup`` is intentionally
-    kept running until HA shuts down.  Allow it to linger during test teardown
+    """The day-transition timer armed by the scheduler is intentionally kept
+    running until HA shuts down.  Allow it to linger during test teardown
     so PHCC logs a warning rather than failing the test.
     """
     return True
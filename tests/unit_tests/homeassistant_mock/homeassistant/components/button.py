@@ -7,5 +7,11 @@ class ButtonEntity:
     _attr_unique_id = None
     _attr_device_info = None
 
+    def async_on_remove(self, cb):
+        pass
+
+    async def async_added_to_hass(self):
+        pass
+
     async def async_press(self):
         pass
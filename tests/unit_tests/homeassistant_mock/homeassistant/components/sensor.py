@@ -10,12 +10,19 @@ class SensorEntity:
     hass = None
     entity_id = None
 
+    @property
+    def native_value(self):
+        return self._attr_native_value
+
     def async_write_ha_state(self):
         pass
 
     def async_schedule_update_ha_state(self, force_refresh=False):
         pass
 
+    async def async_update_ha_state(self, force_refresh=False):
+        pass
+
     def async_on_remove(self, cb):
         pass
 
@@ -8,6 +8,11 @@ CONF_ICON = "icon"
 CONF_ENTITY_ID = "entity_id"
 CONF_OPTIONS = "options"
 CONF_MODE = "mode"
+ATTR_AREA_ID = "area_id"
+ATTR_DEVICE_ID = "device_id"
+ATTR_FLOOR_ID = "floor_id"
+ATTR_LABEL_ID = "label_id"
+ENTITY_MATCH_ALL = "all"
 EVENT_HOMEASSISTANT_STARTED = "homeassistant_started"
 EVENT_STATE_CHANGED = "state_changed"
 MAJOR_VERSION = 2025
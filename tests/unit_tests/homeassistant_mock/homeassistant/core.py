@@ -18,6 +18,24 @@ class ServiceCall:
         self.data = data or {}
 
 
+class State:
+    def __init__(self, entity_id=None, state=None, attributes=None):
+        self.entity_id = entity_id
+        self.state = state
+        self.attributes = attributes or {}
+
+
+class Event:
+    def __init__(self, event_type=None, data=None):
+        self.event_type = event_type
+        self.data = data or {}
+
+    def __class_getitem__(cls, item):
+        return cls
+
+
+CALLBACK_TYPE = object
+
 EventStateChangedData = dict
 
 
@@ -1,3 +1,5 @@
+import voluptuous as vol
+
 def empty_config_schema(domain):
     return lambda config: config
 
@@ -11,3 +13,39 @@ def date(value):
         from datetime import date as _date  # pylint: disable=import-outside-toplevel
         return _date.fromisoformat(value)
     return value
+
+
+def ensure_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def string(value):
+    return str(value)
+
+
+def comp_entity_ids(value):
+    if isinstance(value, str):
+        if value == "all":
+            return value
+        value = [part.strip() for part in value.split(",")]
+    return [entity_id(part) for part in value]
+
+
+ENTITY_SERVICE_FIELDS = {
+    vol.Optional("entity_id"): comp_entity_ids,
+    vol.Optional("device_id"): vol.All(ensure_list, [str]),
+    vol.Optional("area_id"): vol.All(ensure_list, [str]),
+    vol.Optional("floor_id"): vol.All(ensure_list, [str]),
+    vol.Optional("label_id"): vol.All(ensure_list, [str]),
+}
+
+
+def has_at_least_one_key(*keys):
+    def validate(obj):
+        for key in obj:
+            if key in keys:
+                return obj
+        raise vol.Invalid(f"must contain at least one of {', '.join(keys)}.")
+    return validate
@@ -1,3 +1,8 @@
+EVENT_ENTITY_REGISTRY_UPDATED = "entity_registry_updated"
+
+EventEntityRegistryUpdatedData = dict
+
+
 def async_get(hass):
     return getattr(hass, "entity_registry", None)
 
@@ -4,3 +4,7 @@ def async_call_later(hass, delay, action):
 
 def async_track_time_change(hass, action, **kwargs):
     return lambda: None
+
+
+def async_track_point_in_time(hass, action, point_in_time):
+    return lambda: None
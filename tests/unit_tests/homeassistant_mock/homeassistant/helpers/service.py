@@ -0,0 +1,11 @@
+class SelectedEntities:
+    def __init__(self, referenced=None, indirectly_referenced=None):
+        self.referenced = set(referenced or ())
+        self.indirectly_referenced = set(indirectly_referenced or ())
+
+
+def async_extract_referenced_entity_ids(hass, service_call, expand_group=True):
+    entity_ids = service_call.data.get("entity_id", [])
+    if isinstance(entity_ids, str):
+        entity_ids = [] if entity_ids == "all" else [entity_ids]
+    return SelectedEntities(referenced=entity_ids)
@@ -0,0 +1,24 @@
+class Store:
+    def __init__(self, hass, version, key, *args, **kwargs):
+        self.hass = hass
+        self.version = version
+        self.key = key
+        self.data = None
+        self.pending_data_func = None
+        self.delay_save_calls = 0
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.data = data
+
+    def async_delay_save(self, data_func, delay=0):
+        self.pending_data_func = data_func
+        self.delay_save_calls += 1
+
+    def flush(self):
+        """Test helper: write the pending delayed save."""
+        if self.pending_data_func is not None:
+            self.data = self.pending_data_func()
+            self.pending_data_func = None
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, time, timezone
 
 UTC = timezone.utc
 
@@ -6,3 +6,13 @@ UTC = timezone.utc
 def now():
     """Return the current datetime in UTC (mirrors homeassistant.util.dt.now)."""
     return datetime.now(UTC)
+
+
+def as_local(value):
+    return value.astimezone(UTC)
+
+
+def start_of_local_day(day=None):
+    if day is None:
+        day = now().date()
+    return datetime.combine(day, time(), tzinfo=UTC)
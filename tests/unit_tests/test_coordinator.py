@@ -0,0 +1,241 @@
+import asyncio
+import sys
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from task_tracker.coordinator import TaskTrackerCoordinator
+from task_tracker.const import (
+    CONF_DAY, CONF_WEEK, CONF_MONTH, CONF_YEAR,
+    CONF_REPEAT_AFTER, CONF_REPEAT_EVERY,
+    CONF_REPEAT_EVERY_WEEKDAY, CONF_REPEAT_EVERY_DAY_OF_MONTH, CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH,
+    CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH,
+    CONF_WEDNESDAY, CONF_FRIDAY,
+)
+
+# Representative schedules covering every repeat_every sub-type
+REPEAT_EVERY_SCHEDULES = [
+    {"repeat_every_type": CONF_REPEAT_EVERY_WEEKDAY, "repeat_weekday": CONF_WEDNESDAY, "repeat_weeks_interval": 1},
+    {"repeat_every_type": CONF_REPEAT_EVERY_WEEKDAY, "repeat_weekday": CONF_FRIDAY, "repeat_weeks_interval": 3},
+    {"repeat_every_type": CONF_REPEAT_EVERY_DAY_OF_MONTH, "repeat_month_day": 31, "repeat_months_interval": 1},
+    {"repeat_every_type": CONF_REPEAT_EVERY_DAY_OF_MONTH, "repeat_month_day": 15, "repeat_months_interval": 3},
+    {"repeat_every_type": CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH, "repeat_weekday": CONF_FRIDAY,
+     "repeat_nth_occurrence": "last", "repeat_months_interval": 1},
+    {"repeat_every_type": CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH, "repeat_weekday": CONF_WEDNESDAY,
+     "repeat_nth_occurrence": "2", "repeat_months_interval": 12},
+    {"repeat_every_type": CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH, "repeat_days_before_end": 0,
+     "repeat_months_interval": 1},
+    {"repeat_every_type": CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH, "repeat_days_before_end": 30,
+     "repeat_months_interval": 2},
+]
+
+
+def make_coordinator(last_done=date(2024, 1, 10), **kwargs):
+    coordinator = TaskTrackerCoordinator("abc123", **kwargs)
+    coordinator.last_done = last_done
+    return coordinator
+
+
+def chained_due_dates(coordinator, start, end, interval_value=None, interval_type=None):
+    """Reference implementation: call calculate_due_date in a loop, feeding each result back in."""
+    original = coordinator.last_done
+    result = []
+    try:
+        while True:
+            due = coordinator.calculate_due_date(interval_value, interval_type)
+            if due > end:
+                return result
+            if due >= start:
+                result.append(due)
+            coordinator.last_done = due
+    finally:
+        coordinator.last_done = original
+
+
+class TestIterOccurrencesRepeatEvery(unittest.TestCase):
+
+    def test_matches_chained_due_dates_for_every_sub_type(self):
+        for schedule in REPEAT_EVERY_SCHEDULES:
+            for last_done in (date(1970, 1, 1), date(2024, 1, 31), date(2024, 2, 29)):
+                with self.subTest(schedule=schedule, last_done=last_done):
+                    coordinator = make_coordinator(last_done, repeat_mode=CONF_REPEAT_EVERY, **schedule)
+                    start, end = date(2024, 3, 1), date(2026, 3, 1)
+                    self.assertEqual(
+                        list(coordinator.iter_occurrences(start, end)),
+                        chained_due_dates(coordinator, start, end),
+                    )
+
+    def test_window_before_last_done_is_empty(self):
+        coordinator = make_coordinator(date(2024, 6, 1), repeat_mode=CONF_REPEAT_EVERY,
+                                       **REPEAT_EVERY_SCHEDULES[2])
+        self.assertEqual(list(coordinator.iter_occurrences(date(2024, 1, 1), date(2024, 5, 31))), [])
+
+    def test_first_occurrence_is_the_current_due_date(self):
+        coordinator = make_coordinator(date(2024, 1, 10), repeat_mode=CONF_REPEAT_EVERY,
+                                       **REPEAT_EVERY_SCHEDULES[3])
+        occurrences = coordinator.iter_occurrences(date(1970, 1, 1), date(2030, 1, 1))
+        self.assertEqual(next(occurrences), coordinator.calculate_due_date(7, CONF_DAY))
+
+
+class TestIterOccurrencesRepeatAfter(unittest.TestCase):
+
+    def test_matches_chained_due_dates_for_every_interval_type(self):
+        for interval_value, interval_type in ((1, CONF_DAY), (10, CONF_DAY), (2, CONF_WEEK),
+                                              (1, CONF_MONTH), (5, CONF_MONTH), (1, CONF_YEAR)):
+            for last_done in (date(1970, 1, 1), date(2023, 1, 31), date(2024, 2, 29), date(2024, 3, 15)):
+                with self.subTest(interval=(interval_value, interval_type), last_done=last_done):
+                    coordinator = make_coordinator(last_done, repeat_mode=CONF_REPEAT_AFTER)
+                    start, end = date(2024, 4, 1), date(2027, 4, 1)
+                    self.assertEqual(
+                        list(coordinator.iter_occurrences(start, end, interval_value, interval_type)),
+                        chained_due_dates(coordinator, start, end, interval_value, interval_type),
+                    )
+
+    def test_clamped_day_matches_chain_from_long_ago(self):
+        # Days above 28 clamp on the way; the chain is jumped rather than walked
+        for interval_value, interval_type in ((1, CONF_MONTH), (3, CONF_MONTH), (1, CONF_YEAR), (4, CONF_YEAR)):
+            for last_done in (date(1970, 1, 31), date(1972, 2, 29), date(1904, 2, 29), date(1970, 3, 30)):
+                with self.subTest(interval=(interval_value, interval_type), last_done=last_done):
+                    coordinator = make_coordinator(last_done, repeat_mode=CONF_REPEAT_AFTER)
+                    start, end = date(2098, 1, 1), date(2106, 1, 1)
+                    self.assertEqual(
+                        list(coordinator.iter_occurrences(start, end, interval_value, interval_type)),
+                        chained_due_dates(coordinator, start, end, interval_value, interval_type),
+                    )
+
+    def test_requires_interval(self):
+        coordinator = make_coordinator(repeat_mode=CONF_REPEAT_AFTER)
+        with self.assertRaises(ValueError):
+            coordinator.iter_occurrences(date(2024, 1, 1), date(2024, 12, 31))
+
+    def test_window_bounds_are_inclusive(self):
+        coordinator = make_coordinator(date(2024, 1, 1), repeat_mode=CONF_REPEAT_AFTER)
+        result = list(coordinator.iter_occurrences(date(2024, 1, 8), date(2024, 1, 22), 7, CONF_DAY))
+        self.assertEqual(result, [date(2024, 1, 8), date(2024, 1, 15), date(2024, 1, 22)])
+
+
+class TestListOccurrences(unittest.TestCase):
+
+    def test_limit_bounds_the_result(self):
+        coordinator = make_coordinator(date(2024, 1, 1), repeat_mode=CONF_REPEAT_AFTER)
+        result = coordinator.list_occurrences(date(2024, 1, 1), date(2030, 1, 1), 1, CONF_DAY, limit=5)
+        self.assertEqual(result, [date(2024, 1, 2) + timedelta(days=n) for n in range(5)])
+
+    def test_does_not_modify_coordinator_state(self):
+        coordinator = make_coordinator(date(2024, 1, 1), repeat_mode=CONF_REPEAT_EVERY,
+                                       **REPEAT_EVERY_SCHEDULES[0])
+        coordinator.list_occurrences(date(2024, 1, 1), date(2025, 1, 1))
+        self.assertEqual(coordinator.last_done, date(2024, 1, 1))
+        self.assertEqual(coordinator.times_completed, 0)
+
+
+class TestDueDateCache(unittest.IsolatedAsyncioTestCase):
+
+    def test_repeated_calculation_is_a_cache_hit(self):
+        coordinator = make_coordinator(date(2024, 1, 1), repeat_mode=CONF_REPEAT_AFTER)
+        first = coordinator.calculate_due_date(7, CONF_DAY)
+        second = coordinator.calculate_due_date(7, CONF_DAY)
+        self.assertEqual(first, second)
+        self.assertEqual(coordinator.due_date_cache_misses, 1)
+        self.assertEqual(coordinator.due_date_cache_hits, 1)
+
+    def test_different_interval_is_a_cache_miss(self):
+        coordinator = make_coordinator(date(2024, 1, 1), repeat_mode=CONF_REPEAT_AFTER)
+        self.assertEqual(coordinator.calculate_due_date(7, CONF_DAY), date(2024, 1, 8))
+        self.assertEqual(coordinator.calculate_due_date(1, CONF_MONTH), date(2024, 2, 1))
+        self.assertEqual(coordinator.due_date_cache_misses, 2)
+
+    def test_direct_last_done_assignment_is_not_served_stale(self):
+        coordinator = make_coordinator(date(2024, 1, 1), repeat_mode=CONF_REPEAT_AFTER)
+        coordinator.calculate_due_date(7, CONF_DAY)
+        coordinator.last_done = date(2024, 2, 1)
+        self.assertEqual(coordinator.calculate_due_date(7, CONF_DAY), date(2024, 2, 8))
+
+    async def test_mark_as_done_reuses_and_then_clears_cache(self):
+        coordinator = make_coordinator(date(2024, 1, 1), repeat_mode=CONF_REPEAT_EVERY,
+                                       **REPEAT_EVERY_SCHEDULES[0])
+        coordinator.calculate_due_date(7, CONF_DAY)
+        await coordinator.async_mark_as_done(today=date(2024, 1, 10))
+        self.assertEqual(coordinator.due_date_cache_hits, 1)
+        self.assertEqual(coordinator._due_date_cache, {})
+
+    async def test_set_last_done_date_clears_cache(self):
+        coordinator = make_coordinator(date(2024, 1, 1), repeat_mode=CONF_REPEAT_AFTER)
+        coordinator.calculate_due_date(7, CONF_DAY)
+        await coordinator.async_set_last_done_date(date(2024, 3, 1))
+        self.assertEqual(coordinator._due_date_cache, {})
+        self.assertEqual(coordinator.calculate_due_date(7, CONF_DAY), date(2024, 3, 8))
+
+
+class TestDeferredNotification(unittest.IsolatedAsyncioTestCase):
+
+    async def test_mark_as_done_without_notify_defers_listeners(self):
+        coordinator = make_coordinator(date(2024, 1, 1), repeat_mode=CONF_REPEAT_AFTER)
+        calls = []
+        coordinator.async_add_listener(lambda: calls.append(1))
+        self.assertTrue(await coordinator.async_mark_as_done(today=date(2024, 1, 10), notify=False))
+        self.assertEqual(calls, [])
+        coordinator.async_notify_listeners()
+        await asyncio.sleep(0)
+        self.assertEqual(calls, [1])
+
+    async def test_mark_as_done_reports_no_op(self):
+        coordinator = make_coordinator(date(2024, 1, 10), repeat_mode=CONF_REPEAT_AFTER)
+        self.assertFalse(await coordinator.async_mark_as_done(today=date(2024, 1, 10)))
+        self.assertEqual(coordinator.times_completed, 0)
+
+    async def test_set_last_done_date_without_notify_defers_listeners(self):
+        coordinator = make_coordinator(date(2024, 1, 1))
+        calls = []
+        coordinator.async_add_listener(lambda: calls.append(1))
+        await coordinator.async_set_last_done_date(date(2024, 2, 1), notify=False)
+        self.assertEqual(coordinator.last_done, date(2024, 2, 1))
+        self.assertEqual(calls, [])
+
+
+class TestCoalescedNotification(unittest.IsolatedAsyncioTestCase):
+
+    async def test_burst_of_mutations_notifies_once(self):
+        coordinator = make_coordinator(date(2024, 1, 1), repeat_mode=CONF_REPEAT_AFTER)
+        calls = []
+        coordinator.async_add_listener(lambda: calls.append(coordinator.last_done))
+        await coordinator.async_set_last_done_date(date(2024, 1, 5))
+        await coordinator.async_mark_as_done(today=date(2024, 1, 10))
+        await coordinator.async_set_last_done_date(date(2024, 1, 8))
+        self.assertEqual(calls, [])
+        await asyncio.sleep(0)
+        self.assertEqual(calls, [date(2024, 1, 8)])
+        self.assertEqual(coordinator.coalesced_notifications, 2)
+
+    async def test_mutation_after_flush_notifies_again(self):
+        coordinator = make_coordinator(date(2024, 1, 1))
+        calls = []
+        coordinator.async_add_listener(lambda: calls.append(1))
+        await coordinator.async_set_last_done_date(date(2024, 1, 5))
+        await asyncio.sleep(0)
+        await coordinator.async_set_last_done_date(date(2024, 1, 6))
+        await asyncio.sleep(0)
+        self.assertEqual(calls, [1, 1])
+        self.assertEqual(coordinator.coalesced_notifications, 0)
+
+    async def test_notify_delay_window(self):
+        coordinator = TaskTrackerCoordinator("abc123", notify_delay=0.05)
+        calls = []
+        coordinator.async_add_listener(lambda: calls.append(1))
+        await coordinator.async_set_last_done_date(date(2024, 1, 5))
+        await asyncio.sleep(0)
+        await coordinator.async_set_last_done_date(date(2024, 1, 6))
+        self.assertEqual(calls, [])
+        await asyncio.sleep(0.1)
+        self.assertEqual(calls, [1])
+        self.assertEqual(coordinator.coalesced_notifications, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import calendar
+import sys
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+from dateutil.relativedelta import relativedelta
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from task_tracker.datemath import (
+    add_months, day_in_month, month_first_ordinal, month_from_index, month_index, month_length, ordinal_weekday,
+)
+
+# Years inside the precomputed tables plus a few on either side of them
+YEARS = [1, 1899, 1900, 1970, 2000, 2023, 2024, 2100, 2299, 2300, 9998]
+
+
+class TestMonthTables(unittest.TestCase):
+
+    def test_month_length_matches_calendar(self):
+        for year in YEARS:
+            for month in range(1, 13):
+                with self.subTest(year=year, month=month):
+                    index = month_index(date(year, month, 1))
+                    self.assertEqual(month_length(index), calendar.monthrange(year, month)[1])
+
+    def test_month_first_ordinal_and_weekday(self):
+        for year in YEARS:
+            for month in range(1, 13):
+                with self.subTest(year=year, month=month):
+                    first = date(year, month, 1)
+                    ordinal = month_first_ordinal(month_index(first))
+                    self.assertEqual(ordinal, first.toordinal())
+                    self.assertEqual(ordinal_weekday(ordinal), first.weekday())
+
+    def test_month_index_round_trip(self):
+        self.assertEqual(month_from_index(month_index(date(2024, 12, 5))), (2024, 12))
+        self.assertEqual(month_from_index(month_index(date(2025, 1, 5))), (2025, 1))
+
+
+class TestDayInMonth(unittest.TestCase):
+
+    def test_clamps_to_month_length(self):
+        self.assertEqual(day_in_month(month_index(date(2024, 2, 1)), 31), date(2024, 2, 29))
+        self.assertEqual(day_in_month(month_index(date(2023, 2, 1)), 31), date(2023, 2, 28))
+
+    def test_clamps_to_first_day(self):
+        self.assertEqual(day_in_month(month_index(date(2024, 2, 1)), -3), date(2024, 2, 1))
+
+
+class TestAddMonthsAgainstRelativedelta(unittest.TestCase):
+    """relativedelta is the reference implementation for add_months."""
+
+    def test_matches_relativedelta(self):
+        start = date(1969, 11, 1)
+        for offset in range(0, 1200, 7):
+            day = start + timedelta(days=offset)
+            for months in (-13, -1, 0, 1, 2, 3, 6, 11, 12, 24, 120, 600):
+                with self.subTest(day=day, months=months):
+                    self.assertEqual(add_months(day, months), day + relativedelta(months=months))
+
+    def test_years_match_relativedelta(self):
+        for day in (date(2024, 2, 29), date(2023, 3, 31), date(1970, 1, 1)):
+            for years in (1, 2, 4, 100):
+                with self.subTest(day=day, years=years):
+                    self.assertEqual(add_months(day, 12 * years), day + relativedelta(years=years))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from task_tracker.const import DOMAIN
+from task_tracker.dependency_graph import DATA_DEPENDENCY_GRAPH, async_get_dependency_graph
+
+
+def make_hass():
+    hass = MagicMock()
+    hass.data = {}
+    hass.states.get = MagicMock(return_value=None)
+    return hass
+
+
+class FakeNode:
+    """Node that takes over the state of its first dependency when told to re-evaluate, if *follows*."""
+
+    def __init__(self, graph, entity_id, dependencies, state="due", follows=True):
+        self.graph = graph
+        self.entity_id = entity_id
+        self.dependencies = dependencies
+        self.native_value = state
+        self.follows = follows
+        self.evaluations = []
+
+    def async_reevaluate_dependencies(self):
+        self.evaluations.append(self.entity_id)
+        new_state = self.graph.get_state(self.dependencies[0]) if self.follows else self.native_value
+        if new_state == self.native_value:
+            return False
+        self.native_value = new_state
+        return True
+
+
+class TestTaskDependencyGraph(unittest.TestCase):
+
+    def _add(self, graph, entity_id, dependencies, state="due", follows=True):
+        node = FakeNode(graph, entity_id, dependencies, state, follows)
+        graph.async_add_task(entity_id, dependencies, node)
+        return node
+
+    def test_diamond_evaluated_in_topological_order(self):
+        graph = async_get_dependency_graph(make_hass())
+        self._add(graph, "a", [])
+        self._add(graph, "b", ["a"])
+        self._add(graph, "c", ["a"])
+        self._add(graph, "d", ["b", "c"])
+        order = graph.downstream_order("a")
+        self.assertCountEqual(order, ["b", "c", "d"])
+        self.assertEqual(order[-1], "d")
+
+    def test_chain_re_evaluated_in_one_pass(self):
+        graph = async_get_dependency_graph(make_hass())
+        root = self._add(graph, "a", [])
+        chain = [self._add(graph, name, [previous]) for previous, name in zip("abcd", "bcde")]
+        root.native_value = "done"
+
+        self.assertEqual(graph.async_propagate("a"), ["b", "c", "d", "e"])
+        self.assertTrue(all(node.native_value == "done" for node in chain))
+        self.assertTrue(all(len(node.evaluations) == 1 for node in chain))
+
+    def test_unchanged_dependent_stops_the_pass(self):
+        graph = async_get_dependency_graph(make_hass())
+        root = self._add(graph, "a", [], state="done")
+        middle = self._add(graph, "b", ["a"], state="done", follows=False)
+        leaf = self._add(graph, "c", ["b"], state="due")
+        root.native_value = "due"
+
+        self.assertEqual(graph.async_propagate("a"), [])
+        self.assertEqual(middle.evaluations, ["b"])
+        self.assertEqual(leaf.evaluations, [])
+
+    def test_cycle_is_skipped_with_warning(self):
+        graph = async_get_dependency_graph(make_hass())
+        self._add(graph, "x", [])
+        self._add(graph, "a", ["c", "x"])
+        self._add(graph, "b", ["a"])
+        self._add(graph, "c", ["b"])
+        with self.assertLogs("task_tracker.dependency_graph", level="WARNING"):
+            self.assertEqual(graph.downstream_order("x"), [])
+
+    def test_state_of_unknown_entity_read_from_hass(self):
+        hass = make_hass()
+        hass.states.get = MagicMock(return_value=MagicMock(state="due_soon"))
+        graph = async_get_dependency_graph(hass)
+        self._add(graph, "a", [], state="done")
+        self.assertEqual(graph.get_state("a"), "done")
+        self.assertEqual(graph.get_state("sensor.other"), "due_soon")
+        self.assertFalse(graph.is_task("sensor.other"))
+
+    def test_removed_task_leaves_the_graph(self):
+        graph = async_get_dependency_graph(make_hass())
+        self._add(graph, "a", [])
+        node = FakeNode(graph, "b", ["a"])
+        remove = graph.async_add_task("b", ["a"], node)
+        remove()
+        self.assertFalse(graph.is_task("b"))
+        self.assertEqual(graph.downstream_order("a"), [])
+
+    def test_rank_counters_follow_state_changes(self):
+        hass = make_hass()
+        hass.states.get = MagicMock(return_value=MagicMock(state="due_soon"))
+        graph = async_get_dependency_graph(hass)
+        self._add(graph, "a", [], state="due")
+        self._add(graph, "b", [], state="due")
+        self._add(graph, "hub", ["a", "b", "sensor.external"])
+        self.assertEqual(graph.least_urgent_dependency("hub"), 1)
+
+        self.assertTrue(graph.async_set_state("sensor.external", "inactive"))
+        self.assertEqual(graph.least_urgent_dependency("hub"), 2)
+        self.assertTrue(graph.async_set_state("a", "done"))
+        self.assertEqual(graph.least_urgent_dependency("hub"), 0)
+        self.assertFalse(graph.async_set_state("a", "done"))
+        self.assertTrue(graph.async_set_state("a", "due"))
+        self.assertEqual(graph.least_urgent_dependency("hub"), 2)
+
+    def test_state_of_entity_nobody_depends_on_is_not_tracked(self):
+        graph = async_get_dependency_graph(make_hass())
+        self._add(graph, "a", [])
+        self.assertFalse(graph.async_set_state("a", "done"))
+        self.assertIsNone(graph.least_urgent_dependency("a"))
+
+    def test_creates_graph_once(self):
+        hass = make_hass()
+        graph = async_get_dependency_graph(hass)
+        self.assertIs(async_get_dependency_graph(hass), graph)
+        self.assertIs(hass.data[DOMAIN][DATA_DEPENDENCY_GRAPH], graph)
+
+
+if __name__ == "__main__":
+    unittest.main()
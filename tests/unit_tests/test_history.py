@@ -0,0 +1,131 @@
+import sys
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from task_tracker.const import CONF_DAY, CONF_REPEAT_AFTER
+from task_tracker.coordinator import TaskTrackerCoordinator
+from task_tracker.history import CompletionHistory, HISTORY_ATTRIBUTES, TaskTrackerHistoryStore
+
+
+class TestCompletionHistory(unittest.TestCase):
+
+    def test_empty_history_has_no_aggregates(self):
+        history = CompletionHistory()
+        self.assertEqual(history.as_attributes(), {
+            "completions_recorded": 0,
+            "mean_completion_interval": None,
+            "mean_lateness": None,
+            "on_time_streak": 0,
+        })
+        self.assertEqual(set(history.as_attributes()), HISTORY_ATTRIBUTES)
+
+    def test_aggregates(self):
+        history = CompletionHistory()
+        history.add(date(2024, 1, 1), 2)
+        history.add(date(2024, 1, 8), -1)
+        history.add(date(2024, 1, 22), 0)
+        self.assertEqual(history.mean_interval, 10.5)
+        self.assertAlmostEqual(history.mean_lateness, 1 / 3)
+        self.assertEqual(history.streak, 2)
+        self.assertEqual(history.last_completion, date(2024, 1, 22))
+
+    def test_late_completion_resets_streak(self):
+        history = CompletionHistory()
+        history.add(date(2024, 1, 1), 0)
+        history.add(date(2024, 1, 2), 3)
+        self.assertEqual(history.streak, 0)
+
+    def test_unknown_lateness_is_left_out(self):
+        history = CompletionHistory()
+        history.add(date(2024, 1, 1), None)
+        history.add(date(2024, 1, 3), 4)
+        self.assertEqual(history.mean_lateness, 4)
+        self.assertEqual(history.mean_interval, 2)
+
+    def test_limit_evicts_oldest_and_keeps_running_sums(self):
+        history = CompletionHistory(limit=3)
+        start = date(2024, 1, 1)
+        for i, lateness in enumerate([10, 1, 2, 3]):
+            history.add(start + timedelta(days=7 * i), lateness)
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.mean_lateness, 2)
+        self.assertEqual(history.mean_interval, 7)
+
+    def test_round_trip(self):
+        history = CompletionHistory()
+        history.add(date(2024, 1, 1), 2)
+        history.add(date(2024, 1, 8), None)
+        data = history.as_dict()
+        self.assertEqual(data["done"], [date(2024, 1, 1).toordinal(), date(2024, 1, 8).toordinal()])
+        restored = CompletionHistory.from_dict(data)
+        self.assertEqual(restored.as_dict(), data)
+        self.assertEqual(restored.mean_lateness, 2)
+
+    def test_from_dict_applies_smaller_limit(self):
+        history = CompletionHistory()
+        for day in range(1, 6):
+            history.add(date(2024, 1, day), day)
+        restored = CompletionHistory.from_dict(history.as_dict(), limit=2)
+        self.assertEqual(len(restored), 2)
+        self.assertEqual(restored.mean_lateness, 4.5)
+
+
+class TestTaskTrackerHistoryStore(unittest.IsolatedAsyncioTestCase):
+
+    async def test_saves_all_tasks_in_one_store(self):
+        store = TaskTrackerHistoryStore(MagicMock())
+        await store.async_load()
+        store.async_get_history("a").add(date(2024, 1, 1), 0)
+        store.async_schedule_save()
+        store.async_get_history("b").add(date(2024, 1, 2), 1)
+        store.async_schedule_save()
+        store._store.flush()
+        self.assertEqual(set(store._store.data["tasks"]), {"a", "b"})
+
+        reloaded = TaskTrackerHistoryStore(MagicMock(), limit=10)
+        reloaded._store.data = store._store.data
+        await reloaded.async_load()
+        self.assertEqual(reloaded.async_get_history("b").mean_lateness, 1)
+        self.assertEqual(reloaded.async_get_history("b").limit, 10)
+
+    async def test_remove_history(self):
+        store = TaskTrackerHistoryStore(MagicMock())
+        store.async_get_history("a").add(date(2024, 1, 1), 0)
+        store.async_remove_history("a")
+        store._store.flush()
+        self.assertEqual(store._store.data, {"tasks": {}})
+
+
+class TestCoordinatorRecordsHistory(unittest.IsolatedAsyncioTestCase):
+
+    async def test_lateness_relative_to_last_calculated_due_date(self):
+        coordinator = TaskTrackerCoordinator("abc123", repeat_mode=CONF_REPEAT_AFTER)
+        coordinator.last_done = date(2024, 1, 1)
+        coordinator.calculate_due_date(7, CONF_DAY)
+        await coordinator.async_mark_as_done(today=date(2024, 1, 10))
+        self.assertEqual(coordinator.history.mean_lateness, 2)
+
+    async def test_lateness_unknown_without_calculated_due_date(self):
+        coordinator = TaskTrackerCoordinator("abc123", repeat_mode=CONF_REPEAT_AFTER)
+        coordinator.last_done = date(2024, 1, 1)
+        await coordinator.async_mark_as_done(today=date(2024, 1, 10))
+        self.assertEqual(len(coordinator.history), 1)
+        self.assertIsNone(coordinator.history.mean_lateness)
+
+    async def test_no_op_is_not_recorded(self):
+        coordinator = TaskTrackerCoordinator("abc123", repeat_mode=CONF_REPEAT_AFTER)
+        coordinator.last_done = date(2024, 1, 10)
+        await coordinator.async_mark_as_done(today=date(2024, 1, 10))
+        self.assertEqual(len(coordinator.history), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,8 @@ import unittest
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import voluptuous as vol
+
 absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
 sys.path.insert(0, absolute_mock_path)
 
@@ -11,16 +13,20 @@ sys.path.insert(0, absolute_plugin_path)
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ICON
+from homeassistant.core import ServiceCall
+from homeassistant.helpers.service import SelectedEntities
 
-from task_tracker import _async_register_blueprints, async_migrate_entry, _get_coordinator
+from task_tracker import _async_register_blueprints, async_migrate_entry, _get_coordinator, _resolve_coordinators
 from task_tracker.const import (
     CONF_ACTIVE, CONF_TASK_INTERVAL_VALUE, CONF_TASK_INTERVAL_TYPE,
     CONF_TAGS, CONF_TODO_LISTS, CONF_DUE_SOON_DAYS, CONF_DUE_SOON_OVERRIDE,
     CONF_NOTIFICATION_INTERVAL, CONF_DAY,
     CONF_REPEAT_MODE, CONF_REPEAT_AFTER,
+    SERVICE_MARK_AS_DONE_SCHEMA, SERVICE_SET_LAST_DONE_DATE_SCHEMA,
     DOMAIN,
 )
 from task_tracker.coordinator import TaskTrackerCoordinator
+from task_tracker.registry import async_get_registry
 
 
 class TestAsyncMigrateEntry(unittest.IsolatedAsyncioTestCase):
@@ -441,15 +447,12 @@ class TestAsyncMigrateEntry(unittest.IsolatedAsyncioTestCase):
 
 class TestGetCoordinator(unittest.IsolatedAsyncioTestCase):
 
-    def _make_hass(self, coordinator, config_entry_id="entry1"):
+    def _make_hass(self, coordinator, config_entry_id="entry1", entity_id="sensor.task_tracker_my_task"):
         mock_hass = MagicMock()
-        mock_hass.data = {DOMAIN: {config_entry_id: coordinator}}
-        import homeassistant.helpers.entity_registry as entity_registry
-        mock_reg_entry = MagicMock()
-        mock_reg_entry.config_entry_id = config_entry_id
-        entity_registry.async_get = lambda hass: MagicMock(
-            async_get=lambda entity_id: mock_reg_entry
-        )
+        mock_hass.data = {}
+        registry = async_get_registry(mock_hass)
+        registry.async_add_task(config_entry_id, coordinator)
+        registry.async_add_entity(config_entry_id, entity_id)
         return mock_hass
 
     def test_returns_coordinator_when_found(self):
@@ -458,27 +461,98 @@ class TestGetCoordinator(unittest.IsolatedAsyncioTestCase):
         result = _get_coordinator(mock_hass, "sensor.task_tracker_my_task")
         self.assertEqual(result, coordinator)
 
-    def test_raises_when_entity_not_in_registry(self):
-        mock_hass = MagicMock()
-        mock_hass.data = {DOMAIN: {}}
+    def test_does_not_scan_entity_registry(self):
         import homeassistant.helpers.entity_registry as entity_registry
-        entity_registry.async_get = lambda hass: MagicMock(async_get=lambda entity_id: None)
+        coordinator = TaskTrackerCoordinator("entry1")
+        mock_hass = self._make_hass(coordinator)
+        with patch.object(entity_registry, "async_get", side_effect=AssertionError("registry scanned")):
+            self.assertEqual(_get_coordinator(mock_hass, "sensor.task_tracker_my_task"), coordinator)
+
+    def test_raises_when_entity_not_in_registry(self):
+        mock_hass = self._make_hass(TaskTrackerCoordinator("entry1"))
         with self.assertRaises(ValueError):
             _get_coordinator(mock_hass, "sensor.task_tracker_nonexistent")
 
-    def test_raises_when_coordinator_not_in_hass_data(self):
-        mock_hass = MagicMock()
-        mock_hass.data = {DOMAIN: {}}
-        import homeassistant.helpers.entity_registry as entity_registry
-        mock_reg_entry = MagicMock()
-        mock_reg_entry.config_entry_id = "entry_missing"
-        entity_registry.async_get = lambda hass: MagicMock(
-            async_get=lambda entity_id: mock_reg_entry
-        )
+    def test_raises_when_coordinator_not_loaded(self):
+        mock_hass = self._make_hass(TaskTrackerCoordinator("entry1"))
+        async_get_registry(mock_hass).async_remove_task("entry1")
         with self.assertRaises(ValueError):
             _get_coordinator(mock_hass, "sensor.task_tracker_my_task")
 
 
+class TestResolveCoordinators(unittest.TestCase):
+
+    def _make_hass(self, tasks):
+        """*tasks* maps entry ids to tag lists; each task gets a sensor and a button."""
+        mock_hass = MagicMock()
+        mock_hass.data = {}
+        registry = async_get_registry(mock_hass)
+        coordinators = {}
+        for entry_id, tags in tasks.items():
+            coordinators[entry_id] = TaskTrackerCoordinator(entry_id)
+            registry.async_add_task(entry_id, coordinators[entry_id], tags)
+            registry.async_add_entity(entry_id, f"sensor.{entry_id}")
+            registry.async_add_entity(entry_id, f"button.{entry_id}_mark_as_done")
+        return mock_hass, coordinators
+
+    def _resolve(self, mock_hass, data, selected=None):
+        call = ServiceCall(SERVICE_MARK_AS_DONE_SCHEMA(data))
+        if selected is None:
+            return _resolve_coordinators(mock_hass, call)
+        with patch("task_tracker.async_extract_referenced_entity_ids", return_value=selected):
+            return _resolve_coordinators(mock_hass, call)
+
+    def test_entity_id_list(self):
+        mock_hass, coordinators = self._make_hass({"a": [], "b": [], "c": []})
+        result = self._resolve(mock_hass, {"entity_id": ["sensor.a", "sensor.c"]})
+        self.assertCountEqual(result, [coordinators["a"], coordinators["c"]])
+
+    def test_each_task_is_resolved_once(self):
+        mock_hass, coordinators = self._make_hass({"a": []})
+        result = self._resolve(mock_hass, {"entity_id": ["sensor.a", "button.a_mark_as_done"]})
+        self.assertEqual(result, [coordinators["a"]])
+
+    def test_unknown_explicit_entity_raises(self):
+        mock_hass, _ = self._make_hass({"a": []})
+        with self.assertRaises(ValueError):
+            self._resolve(mock_hass, {"entity_id": ["sensor.a", "light.kitchen"]})
+
+    def test_area_target_skips_foreign_entities(self):
+        mock_hass, coordinators = self._make_hass({"a": [], "b": []})
+        selected = SelectedEntities(indirectly_referenced={"sensor.b", "button.b_mark_as_done", "light.kitchen"})
+        result = self._resolve(mock_hass, {"area_id": "kitchen"}, selected)
+        self.assertEqual(result, [coordinators["b"]])
+
+    def test_tags_without_target_select_among_all_tasks(self):
+        mock_hass, coordinators = self._make_hass({"a": ["daily"], "b": ["weekly"], "c": ["daily", "kitchen"]})
+        result = self._resolve(mock_hass, {"tags": "daily"})
+        self.assertCountEqual(result, [coordinators["a"], coordinators["c"]])
+
+    def test_tags_filter_targeted_tasks(self):
+        mock_hass, coordinators = self._make_hass({"a": ["daily"], "b": ["weekly"], "c": ["daily"]})
+        result = self._resolve(mock_hass, {"entity_id": ["sensor.a", "sensor.b"], "tags": ["daily"]})
+        self.assertEqual(result, [coordinators["a"]])
+
+    def test_empty_tag_list_matches_nothing(self):
+        mock_hass, _ = self._make_hass({"a": ["daily"]})
+        self.assertEqual(self._resolve(mock_hass, {"tags": []}), [])
+
+    def test_entity_match_all(self):
+        mock_hass, coordinators = self._make_hass({"a": [], "b": []})
+        self.assertCountEqual(self._resolve(mock_hass, {"entity_id": "all"}), coordinators.values())
+
+    def test_resolves_200_tasks_in_one_call(self):
+        mock_hass, coordinators = self._make_hass({f"task_{i}": [] for i in range(200)})
+        result = self._resolve(mock_hass, {"entity_id": [f"sensor.task_{i}" for i in range(200)]})
+        self.assertCountEqual(result, coordinators.values())
+
+    def test_schema_requires_a_target_or_tags(self):
+        with self.assertRaises(vol.Invalid):
+            SERVICE_MARK_AS_DONE_SCHEMA({})
+        with self.assertRaises(vol.Invalid):
+            SERVICE_SET_LAST_DONE_DATE_SCHEMA({"date": "2026-01-01"})
+
+
 class TestRegisterBlueprints(unittest.IsolatedAsyncioTestCase):
 
     async def test_registers_bundled_blueprint(self):
@@ -0,0 +1,82 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from task_tracker.const import DOMAIN
+from task_tracker.coordinator import TaskTrackerCoordinator
+from task_tracker.registry import DATA_REGISTRY, TaskTrackerRegistry, async_get_registry
+
+
+def make_registry() -> tuple[TaskTrackerRegistry, TaskTrackerCoordinator]:
+    registry = TaskTrackerRegistry()
+    coordinator = TaskTrackerCoordinator("entry1")
+    registry.async_add_task("entry1", coordinator)
+    registry.async_add_entity("entry1", "sensor.task_tracker_my_task")
+    registry.async_add_entity("entry1", "sensor.task_tracker_my_task_times_completed")
+    registry.async_add_entity("entry1", "button.task_tracker_my_task_mark_as_done")
+    return registry, coordinator
+
+
+class TestTaskTrackerRegistry(unittest.TestCase):
+
+    def test_lookup_by_any_entity_or_entry_id(self):
+        registry, coordinator = make_registry()
+        for key in ("entry1", "sensor.task_tracker_my_task", "sensor.task_tracker_my_task_times_completed",
+                    "button.task_tracker_my_task_mark_as_done"):
+            self.assertIs(registry.get_coordinator(key), coordinator)
+
+    def test_unknown_entity_returns_none(self):
+        registry, _ = make_registry()
+        self.assertIsNone(registry.get_coordinator("sensor.other"))
+        self.assertFalse(registry.is_known_entity("sensor.other"))
+
+    def test_remove_task_forgets_entities(self):
+        registry, _ = make_registry()
+        registry.async_remove_task("entry1")
+        self.assertIsNone(registry.get_coordinator("sensor.task_tracker_my_task"))
+        self.assertFalse(registry.is_known_entity("button.task_tracker_my_task_mark_as_done"))
+
+    def test_entity_remover(self):
+        registry = TaskTrackerRegistry()
+        remove = registry.async_add_entity("entry1", "sensor.task_tracker_my_task")
+        remove()
+        self.assertFalse(registry.is_known_entity("sensor.task_tracker_my_task"))
+
+    def test_stale_remover_does_not_drop_re_added_entity(self):
+        registry = TaskTrackerRegistry()
+        remove = registry.async_add_entity("entry1", "sensor.task_tracker_my_task")
+        registry.async_add_entity("entry2", "sensor.task_tracker_my_task")
+        remove()
+        self.assertTrue(registry.is_known_entity("sensor.task_tracker_my_task"))
+
+    def test_rename_follows_entity_id(self):
+        registry, coordinator = make_registry()
+        registry.async_rename_entity("sensor.task_tracker_my_task", "sensor.renamed")
+        self.assertIsNone(registry.get_coordinator("sensor.task_tracker_my_task"))
+        self.assertIs(registry.get_coordinator("sensor.renamed"), coordinator)
+
+    def test_rename_of_unknown_entity_is_ignored(self):
+        registry, _ = make_registry()
+        registry.async_rename_entity("sensor.other", "sensor.renamed")
+        self.assertFalse(registry.is_known_entity("sensor.renamed"))
+
+
+class TestAsyncGetRegistry(unittest.TestCase):
+
+    def test_creates_registry_once(self):
+        hass = MagicMock()
+        hass.data = {}
+        registry = async_get_registry(hass)
+        self.assertIs(hass.data[DOMAIN][DATA_REGISTRY], registry)
+        self.assertIs(async_get_registry(hass), registry)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from task_tracker.coordinator import TaskTrackerCoordinator
+from task_tracker.schedule import (
+    compile_schedule, WeekdaySchedule, DayOfMonthSchedule, WeekdayOfMonthSchedule,
+    DaysBeforeEndOfMonthSchedule, FallbackSchedule,
+)
+from task_tracker.const import (
+    CONF_REPEAT_EVERY, CONF_REPEAT_EVERY_WEEKDAY, CONF_REPEAT_EVERY_DAY_OF_MONTH,
+    CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH, CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH,
+    CONF_FRIDAY,
+)
+
+
+def compile_for(repeat_every_type):
+    return compile_schedule(
+        repeat_every_type, repeat_weekday=CONF_FRIDAY, repeat_weeks_interval=2, repeat_month_day=15,
+        repeat_nth_occurrence="last", repeat_days_before_end=3, repeat_months_interval=4,
+    )
+
+
+class TestCompileSchedule(unittest.TestCase):
+
+    def test_weekday(self):
+        schedule = compile_for(CONF_REPEAT_EVERY_WEEKDAY)
+        self.assertIsInstance(schedule, WeekdaySchedule)
+        self.assertEqual((schedule.weekday, schedule.weeks_interval), (4, 2))
+
+    def test_day_of_month(self):
+        schedule = compile_for(CONF_REPEAT_EVERY_DAY_OF_MONTH)
+        self.assertIsInstance(schedule, DayOfMonthSchedule)
+        self.assertEqual((schedule.day, schedule.months_interval), (15, 4))
+
+    def test_weekday_of_month_parses_last_as_minus_one(self):
+        schedule = compile_for(CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH)
+        self.assertIsInstance(schedule, WeekdayOfMonthSchedule)
+        self.assertEqual((schedule.weekday, schedule.nth, schedule.months_interval), (4, -1, 4))
+
+    def test_days_before_end_of_month(self):
+        schedule = compile_for(CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH)
+        self.assertIsInstance(schedule, DaysBeforeEndOfMonthSchedule)
+        self.assertEqual((schedule.days_before, schedule.months_interval), (3, 4))
+
+    def test_unknown_type_falls_back_to_seven_days(self):
+        schedule = compile_for(None)
+        self.assertIsInstance(schedule, FallbackSchedule)
+        self.assertEqual(schedule.next_after(date(2024, 1, 1)), date(2024, 1, 8))
+
+
+class TestScheduleObjects(unittest.TestCase):
+
+    def test_schedules_are_immutable(self):
+        schedule = DayOfMonthSchedule(15, 1)
+        with self.assertRaises(AttributeError):
+            schedule.day = 20
+
+    def test_schedules_have_no_instance_dict(self):
+        for schedule in (WeekdaySchedule(0, 1), DayOfMonthSchedule(1, 1), WeekdayOfMonthSchedule(0, 1, 1),
+                         DaysBeforeEndOfMonthSchedule(0, 1), FallbackSchedule()):
+            with self.subTest(schedule=type(schedule).__name__):
+                self.assertFalse(hasattr(schedule, "__dict__"))
+
+    def test_next_after_and_most_recent_are_consistent(self):
+        # 2nd cycle after the anchor must be found again when looking back from it
+        schedule = WeekdayOfMonthSchedule(4, -1, 3)
+        anchor = date(2024, 1, 26)
+        first = schedule.next_after(anchor)
+        second = schedule.next_after(first)
+        self.assertEqual(second, date(2024, 7, 26))
+        self.assertEqual(schedule.most_recent_on_or_before(second, anchor), second)
+
+
+class TestCoordinatorCompilesSchedule(unittest.TestCase):
+
+    def test_schedule_is_compiled_from_the_configuration(self):
+        coordinator = TaskTrackerCoordinator(
+            "abc123", repeat_mode=CONF_REPEAT_EVERY, repeat_every_type=CONF_REPEAT_EVERY_DAY_OF_MONTH,
+            repeat_month_day=31, repeat_months_interval=2,
+        )
+        self.assertIsInstance(coordinator.schedule, DayOfMonthSchedule)
+        coordinator.last_done = date(2024, 1, 31)
+        self.assertEqual(coordinator.calculate_due_date(7, "day"), date(2024, 3, 31))
+
+
+if __name__ == "__main__":
+    unittest.main()
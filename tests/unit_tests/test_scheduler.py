@@ -0,0 +1,176 @@
+import asyncio
+import sys
+import unittest
+from datetime import date, datetime, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from task_tracker.const import DOMAIN
+from task_tracker.scheduler import DATA_SCHEDULER, TaskTrackerScheduler, async_get_scheduler
+
+
+def midnight(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+class TestTaskTrackerScheduler(unittest.TestCase):
+
+    def setUp(self):
+        hass = MagicMock()
+        # Run the background refresh to completion right away
+        hass.async_create_background_task = lambda coro, name: asyncio.run(coro)
+        self.scheduler = TaskTrackerScheduler(hass)
+        self.calls = []
+
+    def _add(self, key):
+        async def refresh():
+            self.calls.append(("refresh", key))
+
+        return self.scheduler.async_add_task(key, lambda: self.calls.append(("advance", key)), refresh)
+
+    def test_refreshes_only_tasks_whose_transition_arrived(self):
+        for key in ("a", "b", "c"):
+            self._add(key)
+        self.scheduler.async_schedule_transition("a", date(2024, 1, 2))
+        self.scheduler.async_schedule_transition("b", date(2024, 1, 5))
+        self.scheduler._async_run(midnight(date(2024, 1, 2)))
+        self.assertCountEqual(self.calls, [("refresh", "a"), ("advance", "b"), ("advance", "c")])
+        self.assertIsNone(self.scheduler.next_transition("a"))
+        self.assertEqual(self.scheduler.next_transition("b"), date(2024, 1, 5))
+
+    def test_rescheduled_transition_supersedes_earlier_one(self):
+        self._add("a")
+        self.scheduler.async_schedule_transition("a", date(2024, 1, 2))
+        self.scheduler.async_schedule_transition("a", date(2024, 1, 9))
+        self.scheduler._async_run(midnight(date(2024, 1, 2)))
+        self.assertEqual(self.calls, [("advance", "a")])
+        self.scheduler._async_run(midnight(date(2024, 1, 9)))
+        self.assertEqual(self.calls[-1], ("refresh", "a"))
+
+    def test_cleared_transition_is_not_refreshed(self):
+        self._add("a")
+        self.scheduler.async_schedule_transition("a", date(2024, 1, 2))
+        self.scheduler.async_schedule_transition("a", None)
+        self.scheduler._async_run(midnight(date(2024, 1, 3)))
+        self.assertEqual(self.calls, [("advance", "a")])
+
+    def test_missed_transition_is_refreshed_on_next_run(self):
+        self._add("a")
+        self.scheduler.async_schedule_transition("a", date(2024, 1, 2))
+        self.scheduler._async_run(midnight(date(2024, 1, 4)))
+        self.assertEqual(self.calls, [("refresh", "a")])
+
+    def test_heap_stays_bounded_under_rescheduling(self):
+        self._add("a")
+        for offset in range(1, 1000):
+            self.scheduler.async_schedule_transition("a", date.fromordinal(date(2024, 1, 1).toordinal() + offset))
+        self.assertLess(len(self.scheduler._heap), 100)
+
+    def test_single_timer_armed_and_released(self):
+        unsub = MagicMock()
+        with patch("task_tracker.scheduler.async_track_point_in_time", return_value=unsub) as mock_track:
+            remove_a = self._add("a")
+            remove_b = self._add("b")
+            mock_track.assert_called_once()
+            remove_a()
+            unsub.assert_not_called()
+            remove_b()
+            unsub.assert_called_once()
+
+    def test_timer_rearmed_after_run(self):
+        with patch("task_tracker.scheduler.async_track_point_in_time", return_value=MagicMock()) as mock_track:
+            self._add("a")
+            self.scheduler._async_run(midnight(date(2024, 1, 2)))
+        self.assertEqual(mock_track.call_count, 2)
+
+    def test_removed_task_is_neither_refreshed_nor_advanced(self):
+        remove = self._add("a")
+        self.scheduler.async_schedule_transition("a", date(2024, 1, 2))
+        remove()
+        self.scheduler._async_run(midnight(date(2024, 1, 2)))
+        self.assertEqual(self.calls, [])
+
+
+class TestRefreshQueue(unittest.IsolatedAsyncioTestCase):
+
+    async def test_refreshes_run_in_order(self):
+        scheduler = TaskTrackerScheduler(MagicMock())
+        done = []
+
+        def refresh_for(name):
+            async def refresh():
+                done.append(name)
+            return refresh
+
+        metrics = await scheduler.async_refresh({"a": refresh_for("a"), "b": refresh_for("b")})
+        self.assertEqual(done, ["a", "b"])
+        self.assertEqual(metrics["tasks_refreshed"], 2)
+        self.assertIsNone(metrics["todo_sync"])
+        self.assertEqual(metrics["peak_in_flight"], 0)
+        self.assertIs(scheduler.last_refresh_metrics, metrics)
+
+    async def test_failure_does_not_stop_the_queue(self):
+        scheduler = TaskTrackerScheduler(MagicMock(), concurrency=1)
+        done = []
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        async def succeeding():
+            done.append(1)
+
+        for key in ("failing", "a", "b"):
+            scheduler.async_add_task(key, MagicMock(), MagicMock())
+        now = datetime(2024, 1, 2, 0, 0, 1, tzinfo=timezone.utc)
+        with self.assertLogs("task_tracker.scheduler", level="ERROR"), \
+                patch("task_tracker.scheduler.dt_util.now", return_value=now):
+            metrics = await scheduler.async_refresh({"failing": failing, "a": succeeding, "b": succeeding})
+        self.assertEqual(done, [1, 1])
+        self.assertEqual(metrics["failed"], 1)
+        self.assertEqual(metrics["tasks_refreshed"], 2)
+        # The failed task is retried the next day instead of being left stale
+        self.assertEqual(scheduler.next_transition("failing"), date(2024, 1, 3))
+        self.assertIsNone(scheduler.next_transition("a"))
+
+    async def test_refreshed_targets_reconciled_in_one_batch(self):
+        scheduler = TaskTrackerScheduler(MagicMock(), concurrency=2, spread=300)
+        targets = [object(), object()]
+        reconciler = MagicMock()
+        reconciler.async_reconcile = AsyncMock(return_value={"lists": 1, "peak_in_flight": 1})
+
+        def refresh_for(target):
+            async def refresh():
+                return target
+            return refresh
+
+        async def no_target():
+            return None
+
+        with patch("task_tracker.scheduler.async_get_todo_reconciler", return_value=reconciler):
+            metrics = await scheduler.async_refresh(
+                {"a": refresh_for(targets[0]), "b": no_target, "c": refresh_for(targets[1])}
+            )
+        reconciler.async_reconcile.assert_awaited_once()
+        self.assertEqual(reconciler.async_reconcile.await_args.args, (targets, 2, 300))
+        self.assertEqual(metrics["todo_sync"], {"lists": 1, "peak_in_flight": 1})
+        self.assertEqual(metrics["peak_in_flight"], 1)
+
+
+class TestAsyncGetScheduler(unittest.TestCase):
+
+    def test_creates_scheduler_once(self):
+        hass = MagicMock()
+        hass.data = {}
+        scheduler = async_get_scheduler(hass)
+        self.assertIs(hass.data[DOMAIN][DATA_SCHEDULER], scheduler)
+        self.assertIs(async_get_scheduler(hass), scheduler)
+
+
+if __name__ == "__main__":
+    unittest.main()
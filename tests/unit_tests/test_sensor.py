@@ -1,6 +1,7 @@
+import asyncio
 import sys
 import unittest
-from datetime import date
+from datetime import date, datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,7 +11,12 @@ sys.path.insert(0, absolute_mock_path)
 absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
 sys.path.insert(0, absolute_plugin_path)
 
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import CoreState, Event, State
+from homeassistant.exceptions import HomeAssistantError
+
 from task_tracker.coordinator import TaskTrackerCoordinator
+from task_tracker.scheduler import async_get_scheduler
 from task_tracker.sensor import TaskTrackerSensor, TaskTrackerTimesCompletedSensor
 from task_tracker.const import (
     CONF_DAY, CONF_WEEK, CONF_MONTH, CONF_YEAR,
@@ -49,6 +55,10 @@ def make_sensor(
 ):
     if hass is None:
         hass = MagicMock()
+        hass.data = {}
+        hass.state = CoreState.running
+        hass.async_create_background_task = MagicMock(side_effect=lambda target, name: asyncio.ensure_future(target))
+        hass.async_create_task = MagicMock(side_effect=lambda target, name: asyncio.ensure_future(target))
     if coordinator is None:
         coordinator = TaskTrackerCoordinator(
             entry_id,
@@ -62,7 +72,7 @@ def make_sensor(
             repeat_months_interval=repeat_months_interval,
             due_soon_days=due_soon_days,
         )
-    return TaskTrackerSensor(
+    sensor = TaskTrackerSensor(
         coordinator=coordinator,
         entry_name=entry_name,
         task_interval_value=task_interval_value,
@@ -79,6 +89,9 @@ def make_sensor(
         task_interval_override=task_interval_override,
         due_soon_override=due_soon_override,
     )
+    # Home Assistant sets hass on the entity before it is updated
+    sensor.hass = hass
+    return sensor
 
 
 class TestTaskTrackerSensorInit(unittest.TestCase):
@@ -230,11 +243,225 @@ class TestTaskTrackerSensorUpdate(unittest.IsolatedAsyncioTestCase):
         with patch.object(sensor, "async_write_ha_state"):
             with patch.object(sensor, "async_sync_todo_list", new_callable=AsyncMock) as mock_sync:
                 await sensor.async_update()
+                await sensor._todo_sync_task
         self.assertEqual(mock_sync.call_count, 2)
         mock_sync.assert_any_call("todo.list1")
         mock_sync.assert_any_call("todo.list2")
 
 
+
+class TestTaskTrackerSensorBackgroundTodoSync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_update_returns_before_todo_lists_are_synced(self):
+        sensor = make_sensor(todo_lists=["todo.slow"])
+        sensor.coordinator.last_done = date(1970, 1, 1)
+        release = asyncio.Event()
+
+        async def slow_sync(_todo_list):
+            await release.wait()
+
+        with patch.object(sensor, "async_sync_todo_list", side_effect=slow_sync) as mock_sync:
+            await asyncio.wait_for(sensor.async_update(), timeout=1)
+            self.assertEqual(sensor.native_value, CONST_DUE)
+            self.assertFalse(sensor._todo_sync_task.done())
+            release.set()
+            await sensor._todo_sync_task
+        mock_sync.assert_called_once_with("todo.slow")
+
+    async def test_update_while_starting_defers_sync_to_batch(self):
+        sensor = make_sensor(todo_lists=["todo.list1"])
+        sensor.hass.state = CoreState.not_running
+        reconciler = MagicMock()
+        with patch("task_tracker.sensor.async_get_todo_reconciler", return_value=reconciler):
+            await sensor.async_update()
+        reconciler.async_schedule.assert_called_once_with(sensor)
+        sensor.hass.async_create_background_task.assert_not_called()
+
+    async def test_todo_lists_synced_only_when_due_date_or_state_changes(self):
+        sensor = make_sensor(todo_lists=["todo.list1"])
+        sensor.coordinator.last_done = date(1970, 1, 1)
+        with patch.object(sensor, "async_sync_todo_list", new_callable=AsyncMock) as mock_sync:
+            await sensor.async_update()
+            await sensor._todo_sync_task
+            await sensor.async_update()
+            self.assertEqual(mock_sync.call_count, 1)
+
+            sensor.coordinator.last_done = date.today()
+            await sensor.async_update()
+            await sensor._todo_sync_task
+        self.assertEqual(mock_sync.call_count, 2)
+
+    async def test_failed_sync_is_retried_on_next_update(self):
+        sensor = make_sensor(todo_lists=["todo.list1"])
+        sensor.coordinator.last_done = date(1970, 1, 1)
+        with patch.object(sensor, "async_sync_todo_list", new_callable=AsyncMock,
+                          side_effect=[HomeAssistantError("boom"), None]) as mock_sync:
+            await sensor.async_update()
+            await sensor._todo_sync_task
+            await sensor.async_update()
+            await sensor._todo_sync_task
+        self.assertEqual(mock_sync.call_count, 2)
+
+    async def test_change_during_sync_syncs_again_afterwards(self):
+        sensor = make_sensor(todo_lists=["todo.list1"])
+        sensor.coordinator.last_done = date(1970, 1, 1)
+        release = asyncio.Event()
+        states = []
+
+        async def slow_sync(_todo_list):
+            states.append(sensor.native_value)
+            await release.wait()
+
+        with patch.object(sensor, "async_sync_todo_list", side_effect=slow_sync):
+            await sensor.async_update()
+            while not states:
+                await asyncio.sleep(0)
+            sensor.coordinator.last_done = date.today()
+            await sensor.async_update()
+            release.set()
+            await sensor._todo_sync_task
+        self.assertEqual(states, [CONST_DUE, CONST_DONE])
+
+
+class TestTaskTrackerSensorWriteSuppression(unittest.IsolatedAsyncioTestCase):
+
+    async def test_unchanged_refresh_does_not_write(self):
+        sensor = make_sensor(task_interval_value=7)
+        sensor.coordinator.last_done = date(1970, 1, 1)
+        with patch.object(SensorEntity, "async_write_ha_state") as mock_write:
+            await sensor._async_refresh()
+            await sensor._async_refresh()
+        mock_write.assert_called_once()
+        self.assertEqual(sensor.state_writes_skipped, 1)
+
+    async def test_changed_state_or_attribute_is_written(self):
+        sensor = make_sensor(task_interval_value=7)
+        sensor.coordinator.last_done = date(1970, 1, 1)
+        with patch.object(SensorEntity, "async_write_ha_state") as mock_write:
+            await sensor._async_refresh()
+            sensor.coordinator.last_done = date.today()
+            await sensor._async_refresh()
+            sensor.notification_interval = 5
+            await sensor._async_refresh()
+        self.assertEqual(mock_write.call_count, 3)
+        self.assertEqual(sensor.state_writes_skipped, 0)
+
+    async def test_override_change_with_same_value_does_not_write(self):
+        hass = MagicMock()
+        hass.data = {}
+        hass.states.get = MagicMock(return_value=MagicMock(state="on"))
+        sensor = make_sensor(hass=hass, active_override="input_boolean.active")
+        sensor.hass = hass
+        with patch.object(SensorEntity, "async_write_ha_state") as mock_write:
+            await sensor._async_refresh()
+            hass.states.get.return_value = MagicMock(state="on")
+            await sensor._async_refresh()
+        mock_write.assert_called_once()
+
+    async def test_direct_write_is_never_skipped(self):
+        sensor = make_sensor()
+        with patch.object(SensorEntity, "async_write_ha_state") as mock_write:
+            await sensor._async_refresh()
+            sensor.async_write_ha_state()
+            sensor.async_write_ha_state()
+        self.assertEqual(mock_write.call_count, 3)
+        self.assertEqual(sensor.state_writes_skipped, 0)
+
+    async def test_refresh_writes_after_update_by_home_assistant(self):
+        sensor = make_sensor()
+        with patch.object(SensorEntity, "async_write_ha_state") as mock_write:
+            await sensor._async_refresh()
+            # update_entity: Home Assistant calls async_update and writes the state itself
+            await sensor.async_update()
+            await sensor._async_refresh()
+        self.assertEqual(mock_write.call_count, 2)
+
+    async def test_refresh_writes_after_being_added_again(self):
+        sensor = make_sensor()
+        with patch.object(SensorEntity, "async_write_ha_state") as mock_write:
+            await sensor._async_refresh()
+            with patch.object(sensor, "async_get_last_sensor_data", new_callable=AsyncMock, return_value=None), \
+                    patch.object(sensor, "async_get_last_state", new_callable=AsyncMock, return_value=None):
+                sensor.async_on_remove = MagicMock()
+                await sensor.async_added_to_hass()
+            mock_write.reset_mock()
+            await sensor._async_refresh()
+        mock_write.assert_called_once()
+
+
+class TestTaskTrackerSensorRecordedAttributes(unittest.IsolatedAsyncioTestCase):
+
+    async def _recorded(self, sensor):
+        sensor.coordinator.last_done = date(2024, 1, 1)
+        await sensor.async_update()
+        return set(sensor._attr_extra_state_attributes) - sensor._unrecorded_attributes
+
+    async def test_only_changing_attributes_recorded_for_repeat_after(self):
+        sensor = make_sensor(todo_lists=["todo.list1"], tags=["kitchen"])
+        self.assertEqual(await self._recorded(sensor), {"last_done", "due_date", "due_in", "overdue_by"})
+
+    async def test_only_changing_attributes_recorded_for_repeat_every(self):
+        for repeat_every_type in (CONF_REPEAT_EVERY_WEEKDAY, CONF_REPEAT_EVERY_DAY_OF_MONTH,
+                                  CONF_REPEAT_EVERY_WEEKDAY_OF_MONTH, CONF_REPEAT_EVERY_DAYS_BEFORE_END_OF_MONTH):
+            sensor = make_sensor(repeat_mode=CONF_REPEAT_EVERY, repeat_every_type=repeat_every_type,
+                                 repeat_weekday=CONF_MONDAY)
+            self.assertEqual(await self._recorded(sensor), {"last_done", "due_date", "due_in", "overdue_by"})
+
+
+class TestTaskTrackerSensorDayTransitions(unittest.IsolatedAsyncioTestCase):
+
+    async def _update_on(self, sensor, today):
+        sensor.hass = MagicMock()
+        sensor.hass.data = {}
+        sensor.hass.async_create_background_task = MagicMock(
+            side_effect=lambda target, name: asyncio.ensure_future(target)
+        )
+        with patch("task_tracker.sensor.dt_util.now", return_value=datetime.combine(today, datetime.min.time(),
+                                                                                      tzinfo=timezone.utc)):
+            with patch.object(sensor, "async_write_ha_state"):
+                with patch.object(sensor, "async_sync_todo_list", new_callable=AsyncMock):
+                    await sensor.async_update()
+                    if sensor._todo_sync_task is not None:
+                        await sensor._todo_sync_task
+        return async_get_scheduler(sensor.hass)
+
+    async def test_done_task_transitions_when_due_soon_window_opens(self):
+        sensor = make_sensor(task_interval_value=10, due_soon_days=3)
+        sensor.coordinator.last_done = date(2024, 1, 1)
+        scheduler = await self._update_on(sensor, date(2024, 1, 2))
+        self.assertEqual(sensor._attr_native_value, CONST_DONE)
+        self.assertEqual(scheduler.next_transition("abc123"), date(2024, 1, 8))
+
+    async def test_due_soon_task_transitions_on_due_date(self):
+        sensor = make_sensor(task_interval_value=10, due_soon_days=3)
+        sensor.coordinator.last_done = date(2024, 1, 1)
+        scheduler = await self._update_on(sensor, date(2024, 1, 9))
+        self.assertEqual(sensor._attr_native_value, CONST_DUE_SOON)
+        self.assertEqual(scheduler.next_transition("abc123"), date(2024, 1, 11))
+
+    async def test_due_and_inactive_tasks_have_no_transition(self):
+        due = make_sensor(task_interval_value=10)
+        due.coordinator.last_done = date(2024, 1, 1)
+        self.assertIsNone((await self._update_on(due, date(2024, 1, 20))).next_transition("abc123"))
+        inactive = make_sensor(task_interval_value=10, active=False)
+        inactive.coordinator.last_done = date(2024, 1, 1)
+        self.assertIsNone((await self._update_on(inactive, date(2024, 1, 2))).next_transition("abc123"))
+
+    async def test_advance_day_updates_counters_without_todo_sync(self):
+        sensor = make_sensor(task_interval_value=10, todo_lists=["todo.list1"])
+        sensor.coordinator.last_done = date(2024, 1, 1)
+        await self._update_on(sensor, date(2024, 1, 12))
+        self.assertEqual(sensor._attr_extra_state_attributes["overdue_by"], 1)
+        with patch("task_tracker.sensor.dt_util.now", return_value=datetime(2024, 1, 13, tzinfo=timezone.utc)):
+            with patch.object(sensor, "async_write_ha_state") as mock_write:
+                with patch.object(sensor, "async_sync_todo_list", new_callable=AsyncMock) as mock_sync:
+                    sensor.async_advance_day()
+        self.assertEqual(sensor._attr_extra_state_attributes["overdue_by"], 2)
+        self.assertEqual(sensor._attr_native_value, CONST_DUE)
+        mock_write.assert_called_once()
+        mock_sync.assert_not_called()
+
+
 class TestTaskTrackerTimesCompletedSensor(unittest.IsolatedAsyncioTestCase):
 
     def test_uses_translation_key_for_name(self):
@@ -248,6 +475,8 @@ class TestTaskTrackerTimesCompletedSensor(unittest.IsolatedAsyncioTestCase):
 
     async def test_async_added_to_hass_writes_restored_state(self):
         sensor = TaskTrackerTimesCompletedSensor(make_sensor().coordinator, "My Task", "abc123", MagicMock())
+        sensor.hass = MagicMock()
+        sensor.hass.data = {}
         sensor.async_on_remove = MagicMock()
         restored_state = MagicMock(native_value="3")
 
@@ -259,6 +488,23 @@ class TestTaskTrackerTimesCompletedSensor(unittest.IsolatedAsyncioTestCase):
         mock_write_ha_state.assert_called_once()
 
 
+    async def test_coordinator_restored_from_state_store_ignores_last_state(self):
+        coordinator = make_sensor().coordinator
+        coordinator.times_completed = 2
+        coordinator.state_restored = True
+        sensor = TaskTrackerTimesCompletedSensor(coordinator, "My Task", "abc123", MagicMock())
+        sensor.hass = MagicMock()
+        sensor.hass.data = {}
+        sensor.async_on_remove = MagicMock()
+
+        with patch.object(sensor, "async_get_last_sensor_data", new_callable=AsyncMock) as mock_last_data:
+            with patch.object(sensor, "async_write_ha_state"):
+                await sensor.async_added_to_hass()
+
+        mock_last_data.assert_not_awaited()
+        self.assertEqual(sensor._attr_native_value, 2)
+
+
 class TestTaskTrackerSensorFilterStateChanges(unittest.TestCase):
 
     def _make_event_data(self, entity_id, old_state, new_state):
@@ -345,6 +591,30 @@ class TestTaskTrackerSensorSyncTodoList(unittest.IsolatedAsyncioTestCase):
                 await sensor.async_sync_todo_list("todo.list1")
         mock_update.assert_called_once_with("todo.list1")
 
+    async def test_skips_update_when_item_already_current(self):
+        sensor = make_sensor(task_interval_value=7, due_soon_days=0)
+        sensor.due_in = 0
+        sensor.due_date = date(1970, 1, 8)
+        existing = {"summary": "Test Task", "status": "needs_action", "due": "1970-01-08"}
+        with patch.object(sensor, "async_get_item_from_todo_list", new_callable=AsyncMock, return_value=existing):
+            with patch.object(sensor, "async_update_item_in_todo_list", new_callable=AsyncMock) as mock_update:
+                await sensor.async_sync_todo_list("todo.list1")
+        mock_update.assert_not_called()
+        self.assertEqual(sensor.todo_writes_avoided, 1)
+
+    async def test_updates_item_when_due_date_or_status_differs(self):
+        sensor = make_sensor(task_interval_value=7, due_soon_days=0)
+        sensor.due_in = 0
+        sensor.due_date = date(1970, 1, 8)
+        for existing in ({"summary": "Test Task", "status": "needs_action", "due": "1970-01-01"},
+                         {"summary": "Test Task", "status": "completed", "due": "1970-01-08"},
+                         {"summary": "Test Task", "status": "needs_action", "due": "1970-01-08T10:00:00+00:00"}):
+            with patch.object(sensor, "async_get_item_from_todo_list", new_callable=AsyncMock, return_value=existing):
+                with patch.object(sensor, "async_update_item_in_todo_list", new_callable=AsyncMock) as mock_update:
+                    await sensor.async_sync_todo_list("todo.list1")
+            mock_update.assert_called_once_with("todo.list1")
+        self.assertEqual(sensor.todo_writes_avoided, 0)
+
     async def test_removes_item_when_not_due_and_exists(self):
         sensor = make_sensor(task_interval_value=7, due_soon_days=0)
         sensor._attr_native_value = CONST_DONE
@@ -381,6 +651,30 @@ class TestTaskTrackerSensorSyncTodoList(unittest.IsolatedAsyncioTestCase):
                 await sensor.async_sync_todo_list("todo.list1")
         mock_remove.assert_called_once_with("todo.list1")
 
+    async def test_item_lookup_uses_shared_index(self):
+        hass = MagicMock()
+        hass.data = {}
+        hass.services.async_call = AsyncMock(return_value={"todo.list1": {"items": [
+            {"summary": "Other Task", "uid": "1"}, {"summary": "Test Task", "uid": "2"},
+        ]}})
+        sensor = make_sensor(hass=hass)
+        other = make_sensor(hass=hass, entry_name="Other Task", entry_id="other")
+        self.assertEqual((await sensor.async_get_item_from_todo_list("todo.list1"))["uid"], "2")
+        self.assertEqual((await other.async_get_item_from_todo_list("todo.list1"))["uid"], "1")
+        hass.services.async_call.assert_awaited_once()
+
+    async def test_write_invalidates_shared_index(self):
+        hass = MagicMock()
+        hass.data = {}
+        hass.services.async_call = AsyncMock(return_value={"todo.list1": {"items": []}})
+        sensor = make_sensor(hass=hass)
+        sensor.due_date = date(1970, 1, 8)
+        await sensor.async_get_item_from_todo_list("todo.list1")
+        await sensor.async_add_item_to_todo_list("todo.list1")
+        await sensor.async_get_item_from_todo_list("todo.list1")
+        get_items_calls = [c for c in hass.services.async_call.await_args_list if c.kwargs["service"] == "get_items"]
+        self.assertEqual(len(get_items_calls), 2)
+
 
 class TestTaskTrackerSensorMarkAsDone(unittest.IsolatedAsyncioTestCase):
 
@@ -391,10 +685,12 @@ class TestTaskTrackerSensorMarkAsDone(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sensor.coordinator.last_done, date.today())
 
     async def test_mark_as_done_triggers_update(self):
-        sensor = make_sensor()
-        with patch.object(sensor, "async_schedule_update_ha_state") as mock_schedule:
+        # The coordinator listener is bound when the sensor is created
+        with patch.object(TaskTrackerSensor, "async_schedule_refresh") as mock_schedule:
+            sensor = make_sensor()
             await sensor.async_mark_as_done()
-        mock_schedule.assert_called_once_with(force_refresh=True)
+            await asyncio.sleep(0)
+        mock_schedule.assert_called_once_with()
 
 
 class TestTaskTrackerSensorSetLastDoneDate(unittest.IsolatedAsyncioTestCase):
@@ -407,10 +703,12 @@ class TestTaskTrackerSensorSetLastDoneDate(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sensor.coordinator.last_done, new_date)
 
     async def test_set_last_done_date_triggers_update(self):
-        sensor = make_sensor()
-        with patch.object(sensor, "async_schedule_update_ha_state") as mock_schedule:
+        # The coordinator listener is bound when the sensor is created
+        with patch.object(TaskTrackerSensor, "async_schedule_refresh") as mock_schedule:
+            sensor = make_sensor()
             await sensor.async_set_last_done_date(date(2024, 1, 1))
-        mock_schedule.assert_called_once_with(force_refresh=True)
+            await asyncio.sleep(0)
+        mock_schedule.assert_called_once_with()
 
 
 class TestTaskTrackerSensorActiveOverride(unittest.IsolatedAsyncioTestCase):
@@ -587,33 +885,46 @@ class TestTaskTrackerSensorAddedToHass(unittest.IsolatedAsyncioTestCase):
 
     def _make_hass(self):
         hass = MagicMock()
+        hass.data = {}
         hass.bus.async_listen = MagicMock(return_value=MagicMock())
         hass.states.get = MagicMock(return_value=None)
         return hass
 
-    async def test_async_update_called_immediately(self):
-        """async_update should always be called directly without deferral."""
+    async def _add_to_hass(self, sensor, hass):
+        with patch.object(sensor, "async_get_last_sensor_data", new_callable=AsyncMock, return_value=None):
+            with patch.object(sensor, "async_get_last_state", new_callable=AsyncMock, return_value=None):
+                sensor.hass = hass
+                sensor.async_on_remove = MagicMock()
+                await sensor.async_added_to_hass()
+
+    async def test_state_updated_immediately_and_todo_sync_batched(self):
+        """The state should be calculated directly; the todo lists are synced in the startup batch."""
         hass = self._make_hass()
-        sensor = make_sensor(hass=hass)
+        sensor = make_sensor(hass=hass, todo_lists=["todo.my_list"])
+        reconciler = MagicMock()
 
         with patch.object(sensor, "async_get_last_sensor_data", new_callable=AsyncMock, return_value=None):
             with patch.object(sensor, "async_get_last_state", new_callable=AsyncMock, return_value=None):
-                with patch.object(sensor, "async_update", new_callable=AsyncMock) as mock_update:
+                with patch.object(sensor, "_async_update_state", new_callable=AsyncMock) as mock_update, \
+                        patch.object(sensor, "async_sync_todo_list", new_callable=AsyncMock) as mock_sync, \
+                        patch("task_tracker.sensor.async_get_todo_reconciler", return_value=reconciler):
                     sensor.hass = hass
                     sensor.async_on_remove = MagicMock()
                     await sensor.async_added_to_hass()
 
         mock_update.assert_called_once()
+        mock_sync.assert_not_called()
+        reconciler.async_schedule.assert_called_once_with(sensor)
 
-    async def test_async_update_called_regardless_of_hass_state(self):
-        """async_update should be called even when hass is not in running state."""
+    async def test_state_updated_regardless_of_hass_state(self):
+        """The state should be calculated even when hass is not in running state."""
         hass = self._make_hass()
         hass.state = "not_running"
         sensor = make_sensor(hass=hass)
 
         with patch.object(sensor, "async_get_last_sensor_data", new_callable=AsyncMock, return_value=None):
             with patch.object(sensor, "async_get_last_state", new_callable=AsyncMock, return_value=None):
-                with patch.object(sensor, "async_update", new_callable=AsyncMock) as mock_update:
+                with patch.object(sensor, "_async_update_state", new_callable=AsyncMock) as mock_update:
                     sensor.hass = hass
                     sensor.async_on_remove = MagicMock()
                     await sensor.async_added_to_hass()
@@ -637,19 +948,101 @@ class TestTaskTrackerSensorAddedToHass(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(sensor.coordinator.last_done, date(2024, 5, 10))
 
-    async def test_todo_list_state_change_listener_registered(self):
-        """A state-change listener for todo lists should be subscribed."""
+    async def test_coordinator_restored_from_state_store_ignores_last_state(self):
         hass = self._make_hass()
-        sensor = make_sensor(hass=hass, todo_lists=["todo.my_list"])
+        sensor = make_sensor(hass=hass)
+        sensor.coordinator.last_done = date(2024, 6, 1)
+        sensor.coordinator.state_restored = True
 
         with patch.object(sensor, "async_get_last_sensor_data", new_callable=AsyncMock, return_value=None):
-            with patch.object(sensor, "async_get_last_state", new_callable=AsyncMock, return_value=None):
-                with patch.object(sensor, "async_update", new_callable=AsyncMock):
-                    sensor.hass = hass
-                    sensor.async_on_remove = MagicMock()
-                    await sensor.async_added_to_hass()
+            with patch.object(sensor, "async_get_last_state", new_callable=AsyncMock) as mock_last_state:
+                sensor.hass = hass
+                sensor.async_on_remove = MagicMock()
+                await sensor.async_added_to_hass()
 
-        hass.bus.async_listen.assert_called()
+        mock_last_state.assert_not_awaited()
+        self.assertEqual(sensor.coordinator.last_done, date(2024, 6, 1))
+
+    async def test_todo_list_state_changes_dispatched_to_task(self):
+        """State changes of the task's todo lists should reach it through the shared dispatcher."""
+        hass = self._make_hass()
+        sensor = make_sensor(hass=hass, todo_lists=["todo.my_list"])
+        await self._add_to_hass(sensor, hass)
+        listener, event_filter = hass.bus.async_listen.call_args.args[1:3]
+        self.assertTrue(event_filter({"entity_id": "todo.my_list"}))
+        self.assertFalse(event_filter({"entity_id": "todo.other_list"}))
+
+        data = {"entity_id": "todo.my_list", "old_state": MagicMock(state="2"), "new_state": MagicMock(state="1")}
+        with patch.object(sensor, "async_todo_list_changed") as mock_changed:
+            listener(Event("state_changed", data))
+        mock_changed.assert_called_once()
+
+    async def test_override_changes_refresh_task(self):
+        hass = self._make_hass()
+        hass.states.get.return_value = State("input_boolean.active", "off")
+        sensor = make_sensor(hass=hass, active_override="input_boolean.active")
+        await self._add_to_hass(sensor, hass)
+        listener = hass.bus.async_listen.call_args.args[1]
+        with patch.object(sensor, "async_schedule_refresh") as mock_schedule:
+            listener(Event("state_changed", {"entity_id": "input_boolean.active",
+                                             "new_state": State("input_boolean.active", "on")}))
+        mock_schedule.assert_called_once_with()
+
+    async def test_override_change_to_same_parsed_value_does_not_refresh(self):
+        hass = self._make_hass()
+        hass.states.get.return_value = State("sensor.days", "7")
+        sensor = make_sensor(hass=hass, task_interval_override="sensor.days", due_soon_override="sensor.days")
+        await self._add_to_hass(sensor, hass)
+        hass.states.get.reset_mock()
+        listener = hass.bus.async_listen.call_args.args[1]
+        with patch.object(sensor, "async_schedule_refresh") as mock_schedule:
+            for value in ("7.2", "7.9", "7"):
+                listener(Event("state_changed", {"entity_id": "sensor.days", "new_state": State("sensor.days", value)}))
+            mock_schedule.assert_not_called()
+            listener(Event("state_changed", {"entity_id": "sensor.days", "new_state": State("sensor.days", "8")}))
+        mock_schedule.assert_called_once_with()
+        self.assertEqual(sensor.override_refreshes_skipped, 3)
+        hass.states.get.assert_not_called()
+
+    async def test_unusable_override_falling_back_to_same_value_does_not_refresh(self):
+        hass = self._make_hass()
+        hass.states.get.return_value = State("sensor.days", "3")
+        sensor = make_sensor(hass=hass, due_soon_days=3, due_soon_override="sensor.days")
+        await self._add_to_hass(sensor, hass)
+        listener = hass.bus.async_listen.call_args.args[1]
+        with patch.object(sensor, "async_schedule_refresh") as mock_schedule:
+            listener(Event("state_changed", {"entity_id": "sensor.days", "new_state": State("sensor.days", "unavailable")}))
+            listener(Event("state_changed", {"entity_id": "sensor.days", "new_state": None}))
+        mock_schedule.assert_not_called()
+
+    async def test_cached_override_value_used_by_refresh(self):
+        hass = self._make_hass()
+        hass.states.get.return_value = State("input_number.interval", "7")
+        sensor = make_sensor(hass=hass, task_interval_value=1, task_interval_type=CONF_WEEK,
+                             task_interval_override="input_number.interval")
+        await self._add_to_hass(sensor, hass)
+        sensor.coordinator.last_done = date(2024, 1, 1)
+        listener = hass.bus.async_listen.call_args.args[1]
+        with patch.object(sensor, "async_schedule_refresh"):
+            listener(Event("state_changed", {"entity_id": "input_number.interval",
+                                             "new_state": State("input_number.interval", "30")}))
+        hass.states.get.reset_mock()
+        await sensor._async_update_state()
+        self.assertEqual(sensor.due_date, date(2024, 1, 31))
+        hass.states.get.assert_not_called()
+
+    async def test_task_without_watched_entities_subscribes_to_nothing(self):
+        hass = self._make_hass()
+        sensor = make_sensor(hass=hass)
+        await self._add_to_hass(sensor, hass)
+        hass.bus.async_listen.assert_not_called()
+
+    async def test_tasks_share_one_state_change_listener(self):
+        hass = self._make_hass()
+        for index in range(3):
+            sensor = make_sensor(hass=hass, entry_id=f"task{index}", todo_lists=["todo.my_list"])
+            await self._add_to_hass(sensor, hass)
+        hass.bus.async_listen.assert_called_once()
 
     async def test_no_event_homeassistant_started_listener_registered(self):
         """No listener for EVENT_HOMEASSISTANT_STARTED should be registered."""
@@ -667,6 +1060,79 @@ class TestTaskTrackerSensorAddedToHass(unittest.IsolatedAsyncioTestCase):
         hass.bus.async_listen_once.assert_not_called()
 
 
+
+class TestTaskTrackerSensorDependencyGraph(unittest.IsolatedAsyncioTestCase):
+
+    async def _add(self, hass, name, last_done, dependencies=()):
+        sensor = make_sensor(hass=hass, entry_name=name, entry_id=name.lower())
+        sensor.dependencies = list(dependencies)
+        sensor.coordinator.last_done = last_done
+        with patch.object(sensor, "async_get_last_state", new_callable=AsyncMock, return_value=None):
+            sensor.async_on_remove = MagicMock()
+            await sensor.async_added_to_hass()
+        return sensor
+
+    async def test_dependency_change_re_clamps_chain_in_one_pass(self):
+        hass = MagicMock()
+        hass.data = {}
+        hass.states.get = MagicMock(return_value=None)
+        root = await self._add(hass, "Root", date.today())
+        middle = await self._add(hass, "Middle", date(1970, 1, 1), [root.entity_id])
+        leaf = await self._add(hass, "Leaf", date(1970, 1, 1), [middle.entity_id])
+        self.assertEqual([middle.native_value, leaf.native_value], [CONST_DONE, CONST_DONE])
+
+        root.coordinator.last_done = date(1970, 1, 1)
+        with patch.object(middle, "async_write_ha_state") as middle_write, \
+                patch.object(leaf, "async_write_ha_state") as leaf_write, \
+                patch.object(middle, "async_schedule_refresh") as middle_refresh, \
+                patch.object(leaf, "async_schedule_refresh") as leaf_refresh:
+            await root.async_update()
+
+        self.assertEqual([root.native_value, middle.native_value, leaf.native_value], [CONST_DUE] * 3)
+        middle_write.assert_called_once()
+        leaf_write.assert_called_once()
+        middle_refresh.assert_not_called()
+        leaf_refresh.assert_not_called()
+
+    async def test_dependency_state_changes_re_clamp_without_refresh(self):
+        hass = MagicMock()
+        hass.data = {}
+        hass.states.get = MagicMock(return_value=None)
+        root = await self._add(hass, "Root", date.today())
+        dependent = await self._add(hass, "Dependent", date(1970, 1, 1), [root.entity_id, "sensor.not_loaded"])
+        self.assertEqual(dependent.native_value, CONST_DONE)
+        with patch.object(dependent, "async_schedule_refresh") as mock_refresh:
+            # Loaded tasks report to the graph themselves
+            dependent._async_dependency_state_changed(Event("state_changed", {"entity_id": root.entity_id}))
+            # A dependency outside the graph updates the counters from the event
+            root.coordinator.last_done = date(1970, 1, 1)
+            await root.async_update()
+            self.assertEqual(dependent.native_value, CONST_DUE)
+            dependent._async_dependency_state_changed(Event("state_changed", {
+                "entity_id": "sensor.not_loaded", "new_state": MagicMock(state=CONST_DUE_SOON),
+            }))
+            self.assertEqual(dependent.native_value, CONST_DUE_SOON)
+        mock_refresh.assert_not_called()
+
+    async def test_hub_clamp_follows_dependency_counts(self):
+        hass = MagicMock()
+        hass.data = {}
+        hass.states.get = MagicMock(return_value=None)
+        spokes = [await self._add(hass, f"Spoke {i}", date(1970, 1, 1)) for i in range(50)]
+        hub = await self._add(hass, "Hub", date(1970, 1, 1), [spoke.entity_id for spoke in spokes])
+        self.assertEqual(hub.native_value, CONST_DUE)
+
+        spokes[17].coordinator.last_done = date.today()
+        await spokes[17].async_update()
+        self.assertEqual(hub.native_value, CONST_DONE)
+        hass.states.get.reset_mock()
+        spokes[17].coordinator.last_done = date(1970, 1, 1)
+        await spokes[17].async_update()
+        self.assertEqual(hub.native_value, CONST_DUE)
+        # The clamp no longer reads the dependencies' states
+        hass.states.get.assert_not_called()
+
+
 class TestTaskTrackerSensorRepeatMode(unittest.IsolatedAsyncioTestCase):
     """Tests for the repeat_mode feature (repeat_after vs repeat_every)."""
 
@@ -1385,6 +1851,20 @@ class TestCalcMostRecentDayOfMonthWithInterval(unittest.TestCase):
         result = coord._calc_most_recent_day_of_month(date(2024, 2, 1), 15, 12)
         self.assertEqual(result, date(2024, 1, 15))
 
+    def test_epoch_last_done_catches_up_to_current_cycle(self):
+        # last_done = epoch; quarterly day 31 → cycle months Apr, Jul, Oct, Jan
+        # today = Nov 20 2024 → most recent cycle date = Oct 31 2024
+        coord = self._coord(last_done=date(1970, 1, 1))
+        result = coord._calc_most_recent_day_of_month(date(2024, 11, 20), 31, 3)
+        self.assertEqual(result, date(2024, 10, 31))
+
+    def test_today_in_cycle_month_before_target_day(self):
+        # last_done = Jan 15 2024; quarterly day 20 → cycles Apr 20, Jul 20
+        # today = Jul 10 → the July occurrence is still ahead, so Apr 20
+        coord = self._coord(last_done=date(2024, 1, 15))
+        result = coord._calc_most_recent_day_of_month(date(2024, 7, 10), 20, 3)
+        self.assertEqual(result, date(2024, 4, 20))
+
 
 class TestCalcMostRecentDaysBeforeEndOfMonthWithInterval(unittest.TestCase):
     """Tests for _calc_most_recent_days_before_end_of_month with months_interval > 1."""
@@ -1416,6 +1896,13 @@ class TestCalcMostRecentDaysBeforeEndOfMonthWithInterval(unittest.TestCase):
         result = coord._calc_most_recent_days_before_end_of_month(date(2025, 2, 1), 3, 6)
         self.assertEqual(result, date(2025, 1, 28))
 
+    def test_epoch_last_done_catches_up_to_current_cycle(self):
+        # last_done = epoch; annual 30 days before end → every January 1st
+        # today = Mar 3 2025 → most recent cycle date = Jan 1 2025
+        coord = self._coord(date(1970, 1, 1))
+        result = coord._calc_most_recent_days_before_end_of_month(date(2025, 3, 3), 30, 12)
+        self.assertEqual(result, date(2025, 1, 1))
+
 
 class TestCalcMostRecentWeekdayOfMonthWithInterval(unittest.TestCase):
     """Tests for _calc_most_recent_weekday_of_month with months_interval > 1."""
@@ -1447,6 +1934,13 @@ class TestCalcMostRecentWeekdayOfMonthWithInterval(unittest.TestCase):
         result = coord._calc_most_recent_weekday_of_month(date(2024, 1, 15), CONF_MONDAY, "1", 12)
         self.assertEqual(result, date(2024, 1, 1))
 
+    def test_epoch_last_done_catches_up_to_current_cycle(self):
+        # last_done = epoch; every 2 months on the last Friday → odd months
+        # today = Nov 28 2024 (before Nov's last Friday, Nov 29) → Sep 27 2024
+        coord = self._coord(date(1970, 1, 1))
+        result = coord._calc_most_recent_weekday_of_month(date(2024, 11, 28), CONF_FRIDAY, "last", 2)
+        self.assertEqual(result, date(2024, 9, 27))
+
 
 class TestRepeatMonthsIntervalEndToEnd(unittest.TestCase):
     """End-to-end tests for tasks with repeat_months_interval > 1."""
@@ -0,0 +1,84 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from homeassistant.core import Event
+
+from task_tracker.const import DOMAIN
+from task_tracker.state_dispatcher import DATA_STATE_DISPATCHER, async_get_state_dispatcher
+
+
+def make_hass():
+    hass = MagicMock()
+    hass.data = {}
+    hass.bus.async_listen = MagicMock(return_value=MagicMock())
+    return hass
+
+
+class TestStateChangeDispatcher(unittest.TestCase):
+
+    def _fire(self, hass, entity_id):
+        """Deliver a state change of *entity_id* through the dispatcher's bus listener."""
+        listener, event_filter = hass.bus.async_listen.call_args.args[1:3]
+        data = {"entity_id": entity_id}
+        if event_filter(data):
+            listener(Event("state_changed", data))
+
+    def test_dispatches_only_to_subscribers_of_the_entity(self):
+        hass = make_hass()
+        dispatcher = async_get_state_dispatcher(hass)
+        calls = []
+        dispatcher.async_track(["todo.a", "todo.b"], lambda event: calls.append(("first", event.data["entity_id"])))
+        dispatcher.async_track(["todo.b"], lambda event: calls.append(("second", event.data["entity_id"])))
+
+        self._fire(hass, "todo.a")
+        self._fire(hass, "todo.b")
+        self._fire(hass, "light.kitchen")
+
+        self.assertEqual(calls, [("first", "todo.a"), ("first", "todo.b"), ("second", "todo.b")])
+        hass.bus.async_listen.assert_called_once()
+
+    def test_duplicate_and_empty_entity_ids_subscribe_once(self):
+        hass = make_hass()
+        dispatcher = async_get_state_dispatcher(hass)
+        calls = []
+        dispatcher.async_track(["todo.a", None, "todo.a"], calls.append)
+        self._fire(hass, "todo.a")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(dispatcher.subscriber_count("todo.a"), 1)
+
+    def test_nothing_to_track_adds_no_listener(self):
+        hass = make_hass()
+        async_get_state_dispatcher(hass).async_track([None, None], MagicMock())
+        hass.bus.async_listen.assert_not_called()
+
+    def test_removing_last_subscription_removes_listener(self):
+        hass = make_hass()
+        dispatcher = async_get_state_dispatcher(hass)
+        unsub_listener = hass.bus.async_listen.return_value
+        remove_first = dispatcher.async_track(["todo.a"], MagicMock())
+        remove_second = dispatcher.async_track(["todo.a"], MagicMock())
+
+        remove_first()
+        self.assertEqual(dispatcher.subscriber_count("todo.a"), 1)
+        unsub_listener.assert_not_called()
+        remove_second()
+        self.assertEqual(dispatcher.subscriber_count("todo.a"), 0)
+        unsub_listener.assert_called_once()
+
+    def test_creates_dispatcher_once(self):
+        hass = make_hass()
+        dispatcher = async_get_state_dispatcher(hass)
+        self.assertIs(async_get_state_dispatcher(hass), dispatcher)
+        self.assertIs(hass.data[DOMAIN][DATA_STATE_DISPATCHER], dispatcher)
+
+
+if __name__ == "__main__":
+    unittest.main()
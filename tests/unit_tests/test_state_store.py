@@ -0,0 +1,84 @@
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from task_tracker.coordinator import TaskTrackerCoordinator
+from task_tracker.state_store import TaskTrackerStateStore
+
+
+async def make_store(data=None):
+    store = TaskTrackerStateStore(MagicMock())
+    store._store.data = data
+    await store.async_load()
+    return store
+
+
+class TestTaskTrackerStateStore(unittest.IsolatedAsyncioTestCase):
+
+    async def test_saves_all_coordinators_in_one_store(self):
+        store = await make_store()
+        first, second = TaskTrackerCoordinator("a"), TaskTrackerCoordinator("b")
+        store.async_add_coordinator(first)
+        store.async_add_coordinator(second)
+        await first.async_mark_as_done(today=date(2024, 3, 1), notify=False)
+        store.async_schedule_save()
+        await second.async_set_last_done_date(date(2024, 2, 1), notify=False)
+        store.async_schedule_save()
+        store._store.flush()
+        self.assertEqual(store._store.data, {"tasks": {
+            "a": {"last_done": date(2024, 3, 1).toordinal(), "times_completed": 1},
+            "b": {"last_done": date(2024, 2, 1).toordinal(), "times_completed": 0},
+        }})
+
+    async def test_coordinator_restored_when_added(self):
+        store = await make_store({"tasks": {"a": {"last_done": date(2024, 3, 1).toordinal(), "times_completed": 4}}})
+        coordinator = TaskTrackerCoordinator("a")
+        store.async_add_coordinator(coordinator)
+        self.assertEqual(coordinator.last_done, date(2024, 3, 1))
+        self.assertEqual(coordinator.times_completed, 4)
+        self.assertTrue(coordinator.state_restored)
+        self.assertEqual(store._store.delay_save_calls, 0)
+
+    async def test_unstored_coordinator_is_saved_after_adding(self):
+        store = await make_store({"tasks": {}})
+        coordinator = TaskTrackerCoordinator("a")
+        store.async_add_coordinator(coordinator)
+        self.assertFalse(coordinator.state_restored)
+        # State restored by the entities before the delayed write is stored
+        coordinator.last_done = date(2024, 5, 10)
+        store._store.flush()
+        self.assertEqual(store._store.data["tasks"]["a"]["last_done"], date(2024, 5, 10).toordinal())
+
+    async def test_unloaded_coordinator_keeps_its_state(self):
+        store = await make_store()
+        coordinator = TaskTrackerCoordinator("a")
+        remove = store.async_add_coordinator(coordinator)
+        coordinator.last_done = date(2024, 5, 10)
+        remove()
+        coordinator.last_done = date(2024, 6, 1)
+        store.async_schedule_save()
+        store._store.flush()
+        self.assertEqual(store._store.data["tasks"]["a"]["last_done"], date(2024, 5, 10).toordinal())
+
+        reloaded = TaskTrackerCoordinator("a")
+        store.async_add_coordinator(reloaded)
+        self.assertEqual(reloaded.last_done, date(2024, 5, 10))
+
+    async def test_remove_task(self):
+        store = await make_store({"tasks": {"a": {"last_done": 1, "times_completed": 0}}})
+        store.async_add_coordinator(TaskTrackerCoordinator("a"))
+        store.async_remove_task("a")
+        store._store.flush()
+        self.assertEqual(store._store.data, {"tasks": {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from homeassistant.core import Event
+from homeassistant.exceptions import HomeAssistantError
+
+from task_tracker.const import DOMAIN
+from task_tracker.todo_index import CACHE_TTL, DATA_TODO_INDEX, async_get_todo_index
+
+
+def make_hass(items):
+    hass = MagicMock()
+    hass.data = {}
+
+    async def async_call(domain, service, service_data, blocking=False, return_response=False):
+        await asyncio.sleep(0)
+        return {service_data["entity_id"]: {"items": items}}
+
+    hass.services.async_call = AsyncMock(side_effect=async_call)
+    return hass
+
+
+class TestTodoItemIndex(unittest.IsolatedAsyncioTestCase):
+
+    def _state_changed(self, hass, entity_id):
+        """Deliver a state change of *entity_id* to the index's bus listener."""
+        listener, event_filter = hass.bus.async_listen.call_args.args[1:3]
+        data = {"entity_id": entity_id}
+        if event_filter(data):
+            listener(Event("state_changed", data))
+
+    async def test_one_fetch_shared_by_all_tasks(self):
+        hass = make_hass([{"summary": "Task A", "uid": "1"}, {"summary": "Task B", "uid": "2"}])
+        index = async_get_todo_index(hass)
+        self.assertEqual((await index.async_get_item("todo.shared", "Task A"))["uid"], "1")
+        self.assertEqual((await index.async_get_item("todo.shared", "Task B"))["uid"], "2")
+        self.assertIsNone(await index.async_get_item("todo.shared", "Task C"))
+        self.assertEqual(hass.services.async_call.await_count, 1)
+        self.assertEqual(index.fetches, 1)
+        self.assertEqual(index.hits, 2)
+
+    async def test_concurrent_lookups_share_a_fetch(self):
+        hass = make_hass([{"summary": f"Task {i}", "uid": str(i)} for i in range(300)])
+        index = async_get_todo_index(hass)
+        items = await asyncio.gather(*(index.async_get_item("todo.shared", f"Task {i}") for i in range(300)))
+        self.assertEqual([item["uid"] for item in items], [str(i) for i in range(300)])
+        self.assertEqual(index.fetches, 1)
+
+    async def test_cached_list_expires_after_ttl(self):
+        hass = make_hass([{"summary": "Task A", "uid": "1"}])
+        index = async_get_todo_index(hass)
+        with patch("task_tracker.todo_index.time.monotonic", return_value=1000):
+            await index.async_get_items("todo.shared")
+        with patch("task_tracker.todo_index.time.monotonic", return_value=1000 + CACHE_TTL - 1):
+            await index.async_get_items("todo.shared")
+        self.assertEqual(index.fetches, 1)
+        with patch("task_tracker.todo_index.time.monotonic", return_value=1000 + CACHE_TTL):
+            await index.async_get_items("todo.shared")
+        self.assertEqual(index.fetches, 2)
+
+    async def test_cancelled_fetch_does_not_cancel_the_other_waiters(self):
+        hass = make_hass([{"summary": "Task A", "uid": "1"}])
+        index = async_get_todo_index(hass)
+        first = asyncio.ensure_future(index.async_get_item("todo.shared", "Task A"))
+        second = asyncio.ensure_future(index.async_get_item("todo.shared", "Task A"))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual((await second)["uid"], "1")
+        self.assertTrue(first.cancelled())
+        self.assertEqual(index.fetches, 2)
+
+    async def test_clear_stops_following_the_lists(self):
+        hass = make_hass([])
+        unsub_listener = MagicMock()
+        hass.bus.async_listen = MagicMock(return_value=unsub_listener)
+        index = async_get_todo_index(hass)
+        await index.async_get_items("todo.one")
+        await index.async_get_items("todo.two")
+        hass.bus.async_listen.assert_called_once()
+        index.async_clear()
+        unsub_listener.assert_called_once()
+        await index.async_get_items("todo.one")
+        self.assertEqual(index.fetches, 3)
+
+    async def test_state_change_invalidates_only_that_list(self):
+        hass = make_hass([{"summary": "Task A", "uid": "1"}])
+        index = async_get_todo_index(hass)
+        await index.async_get_items("todo.one")
+        await index.async_get_items("todo.two")
+        self._state_changed(hass, "todo.one")
+        self._state_changed(hass, "sensor.unrelated")
+        await index.async_get_items("todo.one")
+        await index.async_get_items("todo.two")
+        self.assertEqual(index.fetches, 3)
+
+    async def test_invalidation_during_fetch_is_not_cached(self):
+        hass = make_hass([{"summary": "Task A", "uid": "1"}])
+        index = async_get_todo_index(hass)
+        fetch = asyncio.ensure_future(index.async_get_items("todo.one"))
+        await asyncio.sleep(0)
+        index.async_invalidate("todo.one")
+        await fetch
+        await index.async_get_items("todo.one")
+        self.assertEqual(index.fetches, 2)
+
+    async def test_fetch_error_is_raised_and_not_cached(self):
+        hass = make_hass([])
+        hass.services.async_call = AsyncMock(side_effect=HomeAssistantError("boom"))
+        index = async_get_todo_index(hass)
+        with self.assertRaises(HomeAssistantError):
+            await index.async_get_items("todo.one")
+        with self.assertRaises(HomeAssistantError):
+            await index.async_get_items("todo.one")
+        self.assertEqual(index.fetches, 2)
+
+    async def test_index_is_created_once(self):
+        hass = make_hass([])
+        index = async_get_todo_index(hass)
+        self.assertIs(hass.data[DOMAIN][DATA_TODO_INDEX], index)
+        self.assertIs(async_get_todo_index(hass), index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+absolute_mock_path = str(Path(__file__).parent / "homeassistant_mock")
+sys.path.insert(0, absolute_mock_path)
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.parent.absolute())
+sys.path.insert(0, absolute_plugin_path)
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, Event
+from homeassistant.exceptions import HomeAssistantError
+
+from task_tracker.todo_index import async_get_todo_index
+from task_tracker.todo_sync import TODO_ADD, TODO_REMOVE, TODO_UPDATE, TodoReconciler, async_get_todo_reconciler
+
+
+def make_hass(lists):
+    hass = MagicMock()
+    hass.data = {}
+    hass.state = CoreState.running
+
+    async def async_call(domain, service, service_data, blocking=False, return_response=False):
+        await asyncio.sleep(0)
+        if service_data["entity_id"] not in lists:
+            raise HomeAssistantError("unknown list")
+        return {service_data["entity_id"]: {"items": lists[service_data["entity_id"]]}}
+
+    hass.services.async_call = AsyncMock(side_effect=async_call)
+    return hass
+
+
+class FakeTask:
+    """Sync target that wants its item on its lists when *wanted*."""
+
+    def __init__(self, name, todo_lists, wanted, fail=False):
+        self.entry_id = f"id_{name}"
+        self.entry_name = name
+        self.todo_lists = todo_lists
+        self.wanted = wanted
+        self.fail = fail
+        self.applied = []
+
+    def get_todo_operation(self, existing_item):
+        if self.wanted:
+            return TODO_ADD if existing_item is None else TODO_UPDATE
+        return TODO_REMOVE if existing_item is not None else None
+
+    async def async_apply_todo_operation(self, todo_list, operation):
+        if self.fail:
+            raise HomeAssistantError("write failed")
+        self.applied.append((todo_list, operation))
+
+
+class TestTodoReconciler(unittest.IsolatedAsyncioTestCase):
+
+    async def test_one_fetch_per_list_for_all_tasks(self):
+        hass = make_hass({
+            "todo.a": [{"summary": "Present", "uid": "1"}, {"summary": "Stale", "uid": "2"}],
+            "todo.b": [],
+        })
+        present = FakeTask("Present", ["todo.a", "todo.b"], wanted=True)
+        stale = FakeTask("Stale", ["todo.a"], wanted=False)
+        absent = FakeTask("Absent", ["todo.a", "todo.b"], wanted=False)
+
+        metrics = await async_get_todo_reconciler(hass).async_reconcile([present, stale, absent])
+
+        self.assertEqual(hass.services.async_call.await_count, 2)
+        self.assertEqual(present.applied, [("todo.a", TODO_UPDATE), ("todo.b", TODO_ADD)])
+        self.assertEqual(stale.applied, [("todo.a", TODO_REMOVE)])
+        self.assertEqual(absent.applied, [])
+        self.assertEqual(metrics["lists"], 2)
+        self.assertEqual((metrics[TODO_ADD], metrics[TODO_UPDATE], metrics[TODO_REMOVE]), (1, 1, 1))
+        self.assertEqual(metrics["unchanged"], 2)
+
+    async def test_reconcile_refetches_cached_lists(self):
+        hass = make_hass({"todo.a": []})
+        task = FakeTask("Task", ["todo.a"], wanted=True)
+        await async_get_todo_index(hass).async_get_items("todo.a")
+        await async_get_todo_reconciler(hass).async_reconcile([task])
+        self.assertEqual(hass.services.async_call.await_count, 2)
+
+    async def test_failed_fetch_skips_only_that_list(self):
+        hass = make_hass({"todo.a": []})
+        task = FakeTask("Task", ["todo.missing", "todo.a"], wanted=True)
+        metrics = await async_get_todo_reconciler(hass).async_reconcile([task])
+        self.assertEqual(task.applied, [("todo.a", TODO_ADD)])
+        self.assertEqual(metrics["failed"], 1)
+
+    async def test_failed_write_does_not_stop_the_batch(self):
+        hass = make_hass({"todo.a": []})
+        failing = FakeTask("Failing", ["todo.a"], wanted=True, fail=True)
+        ok = FakeTask("Ok", ["todo.a"], wanted=True)
+        metrics = await async_get_todo_reconciler(hass).async_reconcile([failing, ok])
+        self.assertEqual(ok.applied, [("todo.a", TODO_ADD)])
+        self.assertEqual((metrics["failed"], metrics[TODO_ADD]), (1, 1))
+
+    async def test_lists_reconciled_up_to_the_concurrency(self):
+        lists = {f"todo.{i}": [] for i in range(6)}
+        hass = make_hass(lists)
+        task = FakeTask("Task", list(lists), wanted=True)
+        metrics = await async_get_todo_reconciler(hass).async_reconcile([task], concurrency=2)
+        self.assertEqual(metrics["peak_in_flight"], 2)
+        self.assertEqual(metrics[TODO_ADD], 6)
+
+    async def test_spread_staggers_list_start_times(self):
+        lists = {f"todo.{i}": [] for i in range(4)}
+        hass = make_hass(lists)
+        task = FakeTask("Task", list(lists), wanted=True)
+        starts = []
+        fetch = hass.services.async_call.side_effect
+
+        async def timed_fetch(*args, **kwargs):
+            starts.append(asyncio.get_running_loop().time())
+            return await fetch(*args, **kwargs)
+
+        hass.services.async_call.side_effect = timed_fetch
+        metrics = await async_get_todo_reconciler(hass).async_reconcile([task], concurrency=10, spread=0.2)
+        self.assertGreaterEqual(starts[-1] - starts[0], 0.14)
+        self.assertEqual(metrics["peak_in_flight"], 1)
+
+    async def test_scheduled_targets_reconciled_in_one_batch(self):
+        hass = make_hass({"todo.a": []})
+        reconciler = async_get_todo_reconciler(hass)
+        tasks = [FakeTask(f"Task {i}", ["todo.a"], wanted=True) for i in range(3)]
+        with patch("task_tracker.todo_sync.async_call_later", return_value=MagicMock()) as call_later:
+            for task in tasks:
+                reconciler.async_schedule(task)
+        call_later.assert_called_once()
+
+        await call_later.call_args.args[2](None)
+
+        self.assertEqual(hass.services.async_call.await_count, 1)
+        self.assertTrue(all(task.applied == [("todo.a", TODO_ADD)] for task in tasks))
+        self.assertEqual(reconciler.last_metrics[TODO_ADD], 3)
+
+    async def test_reconciliation_deferred_until_started(self):
+        hass = make_hass({"todo.a": []})
+        hass.state = CoreState.not_running
+        reconciler = async_get_todo_reconciler(hass)
+        tasks = [FakeTask(f"Task {i}", ["todo.a"], wanted=True) for i in range(3)]
+        with patch("task_tracker.todo_sync.async_call_later") as call_later, \
+                patch("task_tracker.todo_sync.time.monotonic", side_effect=[10.0, 10.5, 12.0]):
+            for task in tasks:
+                reconciler.async_schedule(task)
+        call_later.assert_not_called()
+        hass.bus.async_listen_once.assert_called_once()
+        self.assertEqual(hass.bus.async_listen_once.call_args.args[0], EVENT_HOMEASSISTANT_STARTED)
+        hass.services.async_call.assert_not_called()
+
+        hass.state = CoreState.running
+        await hass.bus.async_listen_once.call_args.args[1](Event(EVENT_HOMEASSISTANT_STARTED))
+
+        self.assertEqual(hass.services.async_call.await_count, 1)
+        self.assertTrue(all(task.applied == [("todo.a", TODO_ADD)] for task in tasks))
+        self.assertEqual(reconciler.startup_timing["tasks"], 3)
+        # Setup is measured from the first to the last task deferred
+        self.assertEqual(reconciler.startup_timing["setup"], 2.0)
+
+        with patch("task_tracker.todo_sync.async_call_later", return_value=MagicMock()) as call_later:
+            reconciler.async_schedule(tasks[0])
+        call_later.assert_called_once()
+
+
+class SlowListTask:
+    """Sync target whose lists take the given number of seconds to sync."""
+
+    def __init__(self, durations, fail=()):
+        self.entry_id = "id_slow"
+        self.entry_name = "Slow"
+        self.todo_lists = list(durations)
+        self.durations = durations
+        self.fail = fail
+        self.synced = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def async_sync_todo_list(self, todo_list):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.durations[todo_list])
+            if todo_list in self.fail:
+                raise HomeAssistantError("write failed")
+            self.synced.append(todo_list)
+        finally:
+            self.in_flight -= 1
+
+
+class TestTodoReconcilerSyncTask(unittest.IsolatedAsyncioTestCase):
+
+    async def test_lists_synced_concurrently_up_to_the_limit(self):
+        task = SlowListTask({f"todo.{i}": 0.01 for i in range(5)})
+        self.assertTrue(await TodoReconciler(MagicMock(), concurrency=2).async_sync_task(task))
+        self.assertCountEqual(task.synced, task.todo_lists)
+        self.assertEqual(task.peak, 2)
+
+    async def test_slow_list_does_not_hold_up_the_others(self):
+        task = SlowListTask({"todo.slow": 10, "todo.a": 0, "todo.b": 0})
+        reconciler = TodoReconciler(MagicMock(), concurrency=3, timeout=0.05)
+        started = asyncio.get_running_loop().time()
+        with self.assertLogs("task_tracker.todo_sync", level="WARNING"):
+            self.assertFalse(await reconciler.async_sync_task(task))
+        self.assertLess(asyncio.get_running_loop().time() - started, 1)
+        self.assertCountEqual(task.synced, ["todo.a", "todo.b"])
+        self.assertEqual(task.in_flight, 0)
+
+    async def test_failing_list_does_not_stop_the_others(self):
+        task = SlowListTask({"todo.a": 0, "todo.b": 0}, fail={"todo.a"})
+        self.assertFalse(await TodoReconciler(MagicMock()).async_sync_task(task))
+        self.assertEqual(task.synced, ["todo.b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
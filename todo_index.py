@@ -0,0 +1,153 @@
+"""Shared index of todo list items for the Task Tracker integration.
+
+Every task that syncs to a todo list needs to know whether its item is on the
+list.  Instead of each task fetching and scanning the whole list, the index
+fetches a list once with ``todo.get_items`` and keeps its items keyed by
+summary for all tasks to share.  A list's entry is dropped when the todo
+entity changes state, and after every write the integration itself makes to
+the list, so the next lookup fetches it again.  Items edited elsewhere do not
+always change the entity's state, so entries also expire after ``CACHE_TTL``
+seconds, and a reconciliation pass always fetches its lists afresh.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from logging import getLogger
+from typing import Any, Callable
+
+from homeassistant.const import CONF_ENTITY_ID
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+
+from .const import DOMAIN
+from .state_dispatcher import async_get_state_dispatcher
+
+LOGGER = getLogger(__name__)
+
+DATA_TODO_INDEX = "todo_index"
+# Seconds a fetched list is trusted without a state change of its entity
+CACHE_TTL = 60
+
+
+class TodoListItems:
+    """The items of one todo list, keyed by summary."""
+
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        """Index *items* as returned by ``todo.get_items``."""
+        self.fetched_at: float = time.monotonic()
+        self.by_summary: dict[str, dict[str, Any]] = {}
+        for item in items:
+            # Keep the first item for a summary, as the linear scan it replaces did
+            self.by_summary.setdefault(item.get("summary"), item)
+
+
+class TodoItemIndex:
+    """Per todo entity item index shared by all tasks."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise an empty index."""
+        self.hass = hass
+        self._lists: dict[str, TodoListItems] = {}
+        self._pending: dict[str, asyncio.Future[TodoListItems]] = {}
+        # State change subscriptions of the cached or pending lists
+        self._unsub_lists: dict[str, Callable[[], None]] = {}
+        self.fetches: int = 0
+        self.hits: int = 0
+
+    @callback
+    def async_invalidate(self, todo_list: str) -> None:
+        """Drop the cached items of *todo_list*; a fetch in progress is not cached either."""
+        self._lists.pop(todo_list, None)
+        self._pending.pop(todo_list, None)
+        unsub = self._unsub_lists.pop(todo_list, None)
+        if unsub is not None:
+            unsub()
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all cached lists and stop following their state."""
+        for todo_list in list(self._unsub_lists):
+            self.async_invalidate(todo_list)
+
+    @callback
+    def _async_list_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Invalidate a list whose todo entity changed state."""
+        self.async_invalidate(event.data["entity_id"])
+
+    async def async_get_items(self, todo_list: str) -> TodoListItems:
+        """Return the items of *todo_list*, fetching them if they are not cached.
+
+        Concurrent callers for the same list share a single fetch.  If the
+        caller running it is cancelled, the others fetch the list again.
+        """
+        items = self._lists.get(todo_list)
+        if items is not None and time.monotonic() - items.fetched_at < CACHE_TTL:
+            self.hits += 1
+            return items
+        pending = self._pending.get(todo_list)
+        if pending is not None:
+            self.hits += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            # The caller fetching the list was cancelled, not this one
+            return await self.async_get_items(todo_list)
+        future: asyncio.Future[TodoListItems] = asyncio.get_running_loop().create_future()
+        self._pending[todo_list] = future
+        if todo_list not in self._unsub_lists:
+            self._unsub_lists[todo_list] = async_get_state_dispatcher(self.hass).async_track(
+                [todo_list], self._async_list_state_changed
+            )
+        try:
+            items = await self._async_fetch(todo_list)
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; the others waiting on it fetch again
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            # Mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(items)
+            if self._pending.get(todo_list) is future:
+                self._lists[todo_list] = items
+            return items
+        finally:
+            if self._pending.get(todo_list) is future:
+                del self._pending[todo_list]
+
+    async def async_get_item(self, todo_list: str, summary: str) -> dict[str, Any] | None:
+        """Return the item of *todo_list* with *summary*, or ``None``."""
+        return (await self.async_get_items(todo_list)).by_summary.get(summary)
+
+    async def _async_fetch(self, todo_list: str) -> TodoListItems:
+        """Fetch all items of *todo_list*."""
+        self.fetches += 1
+        try:
+            response = await self.hass.services.async_call(
+                domain="todo",
+                service="get_items",
+                service_data={CONF_ENTITY_ID: todo_list, "status": ["needs_action", "completed"]},
+                blocking=True,
+                return_response=True,
+            )
+        except (ServiceValidationError, HomeAssistantError) as err:
+            LOGGER.error("Failed to call service \"todo.get_items\": %s", err)
+            raise
+        return TodoListItems((response or {}).get(todo_list, {}).get("items", []))
+
+
+@callback
+def async_get_todo_index(hass: HomeAssistant) -> TodoItemIndex:
+    """Return the todo item index stored in ``hass.data[DOMAIN]``, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index = domain_data.get(DATA_TODO_INDEX)
+    if index is None:
+        index = domain_data[DATA_TODO_INDEX] = TodoItemIndex(hass)
+    return index
@@ -0,0 +1,258 @@
+"""Batched todo list reconciliation for the Task Tracker integration.
+
+Syncing task by task costs one lookup per task and todo list.  The reconciler
+instead groups the tasks to sync by todo list, fetches each list once through
+the shared item index and compares the fetched items with what every task on
+that list wants, issuing ``add_item`` / ``update_item`` / ``remove_item`` only
+for the items that differ, a bounded number of lists at a time.  The nightly
+refresh passes all refreshed tasks in one batch, and tasks starting up are
+collected for a short while and then reconciled together.  While Home
+Assistant itself is still starting, the tasks set up are only given their
+state; their todo lists are reconciled in one batch once Home Assistant has
+started, so the todo integrations are not queried while they and everything
+else are still booting.
+
+A single task refreshed on its own syncs its lists concurrently instead, at
+most ``concurrency`` at a time and within an overall ``timeout``, so one slow
+todo integration holds up neither the task's other lists nor its state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from logging import getLogger
+from typing import Any, Iterable, Protocol
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+from .todo_index import async_get_todo_index
+
+LOGGER = getLogger(__name__)
+
+DATA_TODO_RECONCILER = "todo_reconciler"
+# Seconds to collect tasks passed to async_schedule before reconciling them
+RECONCILE_DELAY = 1
+
+DEFAULT_TODO_SYNC_CONCURRENCY = 3
+DEFAULT_TODO_SYNC_TIMEOUT = 30
+
+TODO_ADD = "add_item"
+TODO_UPDATE = "update_item"
+TODO_REMOVE = "remove_item"
+
+
+class TodoSyncTarget(Protocol):
+    """A task whose item the reconciler keeps in sync."""
+
+    entry_id: str
+    entry_name: str
+    todo_lists: list[str]
+
+    def get_todo_operation(self, existing_item: dict[str, Any] | None) -> str | None:
+        """Return the operation needed given the list's current item, or ``None``."""
+
+    async def async_apply_todo_operation(self, todo_list: str, operation: str) -> None:
+        """Apply *operation* to the task's item in *todo_list*."""
+
+    async def async_sync_todo_list(self, todo_list: str) -> None:
+        """Look up the task's item in *todo_list* and apply the operation needed."""
+
+
+class TodoReconciler:
+    """Reconciles the items of many tasks with one fetch per todo list."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        concurrency: int = DEFAULT_TODO_SYNC_CONCURRENCY,
+        timeout: float = DEFAULT_TODO_SYNC_TIMEOUT,
+    ) -> None:
+        """Initialise the reconciler with nothing pending.
+
+        A single task syncs at most *concurrency* lists at once and gives up on
+        the lists not done after *timeout* seconds.
+        """
+        self.hass = hass
+        self.concurrency: int = max(1, concurrency)
+        self.timeout: float = timeout
+        self._pending: dict[str, TodoSyncTarget] = {}
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self.last_metrics: dict[str, int] | None = None
+        # Listener for the end of startup, and when the first and the last
+        # task set up while starting were deferred to it
+        self._unsub_started: CALLBACK_TYPE | None = None
+        self._deferred_span: tuple[float, float] | None = None
+        # Tasks reconciled after startup, seconds from the first to the last
+        # of them set up, and seconds the reconciliation took
+        self.startup_timing: dict[str, float] | None = None
+
+    @callback
+    def async_schedule(self, target: TodoSyncTarget) -> None:
+        """Reconcile *target* with the next batch.
+
+        The batch runs ``RECONCILE_DELAY`` seconds from the first request, or,
+        while Home Assistant is starting, once it has started.
+        """
+        self._pending[target.entry_id] = target
+        if self._unsub_started is not None:
+            self._deferred_span = (self._deferred_span[0], time.monotonic())
+            return
+        if self.hass.state is not CoreState.running:
+            now = time.monotonic()
+            self._deferred_span = (now, now)
+            self._unsub_started = self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, self._async_started)
+            return
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, RECONCILE_DELAY, self._async_flush)
+
+    async def _async_started(self, _event: Event) -> None:
+        """Reconcile all tasks set up while Home Assistant was starting."""
+        self._unsub_started = None
+        targets = list(self._pending.values())
+        self._pending.clear()
+        first, last = self._deferred_span
+        started = time.monotonic()
+        await self.async_reconcile(targets)
+        self.startup_timing = {
+            "tasks": len(targets),
+            "setup": round(last - first, 3),
+            "reconcile": round(time.monotonic() - started, 3),
+        }
+        LOGGER.debug(
+            "%s tasks set up in %.3fs with their todo reconciliation deferred; reconciling them after startup "
+            "took %.3fs",
+            len(targets), self.startup_timing["setup"], self.startup_timing["reconcile"],
+        )
+
+    async def _async_flush(self, _now: Any) -> None:
+        """Reconcile all pending targets."""
+        self._unsub_flush = None
+        targets = list(self._pending.values())
+        self._pending.clear()
+        await self.async_reconcile(targets)
+
+    async def async_reconcile(
+        self, targets: Iterable[TodoSyncTarget], concurrency: int | None = None, spread: float = 0
+    ) -> dict[str, int]:
+        """Bring the todo items of *targets* in line with their state.
+
+        At most *concurrency* lists (default: the reconciler's own limit) are
+        reconciled at once; with a *spread* (in seconds) their start times are
+        distributed evenly over that window.  Returns the counts of the
+        operations issued, which are also kept in ``last_metrics``.
+        """
+        by_list: dict[str, list[TodoSyncTarget]] = {}
+        for target in targets:
+            for todo_list in target.todo_lists:
+                by_list.setdefault(todo_list, []).append(target)
+        metrics = {
+            "lists": 0, TODO_ADD: 0, TODO_UPDATE: 0, TODO_REMOVE: 0, "unchanged": 0, "failed": 0,
+            "peak_in_flight": 0,
+        }
+        started = time.monotonic()
+        step = spread / len(by_list) if by_list else 0
+        queue: asyncio.Queue[tuple[float, str, list[TodoSyncTarget]]] = asyncio.Queue()
+        for position, (todo_list, list_targets) in enumerate(by_list.items()):
+            queue.put_nowait((position * step, todo_list, list_targets))
+        in_flight = 0
+
+        async def worker() -> None:
+            nonlocal in_flight
+            while not queue.empty():
+                offset, todo_list, list_targets = queue.get_nowait()
+                delay = started + offset - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                in_flight += 1
+                metrics["peak_in_flight"] = max(metrics["peak_in_flight"], in_flight)
+                try:
+                    await self._async_reconcile_list(todo_list, list_targets, metrics)
+                finally:
+                    in_flight -= 1
+
+        workers = min(max(1, concurrency or self.concurrency), len(by_list))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        self.last_metrics = metrics
+        LOGGER.debug(
+            "Todo reconciliation over %s lists: %s added, %s updated, %s removed, %s unchanged, %s failed, "
+            "peak %s lists in flight",
+            metrics["lists"], metrics[TODO_ADD], metrics[TODO_UPDATE], metrics[TODO_REMOVE],
+            metrics["unchanged"], metrics["failed"], metrics["peak_in_flight"],
+        )
+        return metrics
+
+    async def _async_reconcile_list(
+        self, todo_list: str, targets: list[TodoSyncTarget], metrics: dict[str, int]
+    ) -> None:
+        """Fetch *todo_list* once and apply the operations *targets* need on it, counting them in *metrics*."""
+        index = async_get_todo_index(self.hass)
+        # Items may have been edited elsewhere without the list's state changing
+        index.async_invalidate(todo_list)
+        try:
+            items = await index.async_get_items(todo_list)
+        except (ServiceValidationError, HomeAssistantError):
+            # Already logged by the index
+            metrics["failed"] += len(targets)
+            return
+        metrics["lists"] += 1
+        # Decide against the single fetch; the writes below invalidate the index entry
+        for target in targets:
+            operation = target.get_todo_operation(items.by_summary.get(target.entry_name))
+            if operation is None:
+                metrics["unchanged"] += 1
+                continue
+            try:
+                await target.async_apply_todo_operation(todo_list, operation)
+            except (ServiceValidationError, HomeAssistantError):
+                metrics["failed"] += 1
+            else:
+                metrics[operation] += 1
+
+    async def async_sync_task(self, target: TodoSyncTarget) -> bool:
+        """Sync the todo lists of a single *target* concurrently.
+
+        Returns ``False`` if a list failed or the lists could not all be synced
+        within the timeout; the syncs still running are then cancelled and left
+        to the next refresh.
+        """
+        if not target.todo_lists:
+            return True
+        semaphore = asyncio.Semaphore(self.concurrency)
+        failed = False
+
+        async def sync(todo_list: str) -> None:
+            nonlocal failed
+            async with semaphore:
+                try:
+                    await target.async_sync_todo_list(todo_list)
+                except (ServiceValidationError, HomeAssistantError):
+                    # Already logged by the service call; the other lists go on
+                    failed = True
+
+        tasks = [asyncio.create_task(sync(todo_list)) for todo_list in dict.fromkeys(target.todo_lists)]
+        _done, pending = await asyncio.wait(tasks, timeout=self.timeout)
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+            LOGGER.warning(
+                "Syncing %s of %s todo lists of task %s timed out after %ss",
+                len(pending), len(tasks), target.entry_name, self.timeout,
+            )
+            return False
+        return not failed
+
+
+@callback
+def async_get_todo_reconciler(hass: HomeAssistant) -> TodoReconciler:
+    """Return the todo reconciler stored in ``hass.data[DOMAIN]``, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    reconciler = domain_data.get(DATA_TODO_RECONCILER)
+    if reconciler is None:
+        reconciler = domain_data[DATA_TODO_RECONCILER] = TodoReconciler(hass)
+    return reconciler